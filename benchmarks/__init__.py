@@ -0,0 +1,4 @@
+"""
+Benchmarks of the quiz solver.
+Run them from the repository root, e.g. `python -m benchmarks.bench_give_answer`.
+"""
@@ -0,0 +1,111 @@
+import os
+import time
+import random
+import argparse
+import tempfile
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizGenerator
+
+
+def create_setup(strategy: str) -> QuizSolverSetup:
+    """Create a headless setup with the given preferred strategy."""
+    return QuizSolverSetup(headless=True, preferred_strategy=strategy, targeted_score=1.0, max_epochs=10 ** 9)
+
+
+def run_epochs(quiz_solver: QuizSolver, quiz_generator: QuizGenerator, epochs: int, *,
+               pending_quiz: dict | None = None) -> list:
+    """
+    Run epochs and record the answered questions and results.
+    If a pending quiz is given, the first epoch processes the feedback of its response.
+    """
+    transcript = []
+    for _ in range(epochs):
+        if pending_quiz is None:
+            quiz = quiz_generator.generate_quiz(num_questions=max(1, quiz_generator.questions_count // 5))
+            response = quiz_solver.give_answers(quiz=quiz)
+        else:
+            response, pending_quiz = pending_quiz, None
+        score = quiz_generator.compute_score(quiz=response)
+        transcript.append((response["questions"], quiz_solver.process_score_feedback(score=score, max_score=1.0)))
+    return transcript
+
+
+def check_resume(*, strategy: str, questions_count: int, epochs_before: int, epochs_after: int,
+                 during_quiz: bool, path: str):
+    """
+    Save a checkpoint, continue solving, then restore the checkpoint into a new solver
+    and continue solving again. Both runs must give the same responses and results
+    and end in the same state.
+    If during_quiz is set, the checkpoint is saved after answering a quiz and before its feedback.
+    """
+    quiz_generator = QuizGenerator(questions_count=questions_count)
+    quiz_solver = QuizSolver(setup=create_setup(strategy), strategy_in_use=strategy)
+    run_epochs(quiz_solver, quiz_generator, epochs_before)
+    response = None
+    if during_quiz:
+        quiz = quiz_generator.generate_quiz(num_questions=max(1, questions_count // 5))
+        response = quiz_solver.give_answers(quiz=quiz)
+    quiz_solver.save_checkpoint(path)
+    expected = run_epochs(quiz_solver, quiz_generator, epochs_after, pending_quiz=response)
+    resumed_solver = QuizSolver(setup=create_setup(strategy), strategy_in_use=strategy)
+    resumed_solver.load_checkpoint(path)
+    resumed = run_epochs(resumed_solver, quiz_generator, epochs_after, pending_quiz=response)
+    if resumed != expected:
+        raise ValueError(f"Resumed {strategy} solver behaves differently from the original solver.")
+    if resumed_solver.state.checkpoint_state() != quiz_solver.state.checkpoint_state():
+        raise ValueError(f"Resumed {strategy} solver ends in a different state.")
+    for name, strategy_state in quiz_solver.strategies.items():
+        if resumed_solver.strategies[name].checkpoint_state() != strategy_state.checkpoint_state():
+            raise ValueError(f"Resumed strategy {name} ends in a different state.")
+
+
+def create_quiz_question(i: int, answers_per_question: int) -> dict:
+    """Create a quiz question with unique question and answer texts."""
+    return {
+        "question": f"question {i}",
+        "answers": [{"answer": f"answer {i} {j}"} for j in range(answers_per_question)]
+    }
+
+
+def measure_checkpoint(*, questions_count: int, path: str, answers_per_question: int = 4) -> dict:
+    """
+    Measure saving a checkpoint of a bank of the given size (the first save encodes the bank,
+    later saves only the state) and loading it.
+    Returns:
+        dict: Times in milliseconds and the size of the checkpoint in megabytes.
+    """
+    quiz_solver = QuizSolver(setup=create_setup("Beta"), strategy_in_use="Beta")
+    chunk_size = 100000
+    for first in range(0, questions_count, chunk_size):
+        quiz_solver.give_answers(quiz={"questions": [create_quiz_question(i, answers_per_question)
+                                                     for i in range(first, min(first + chunk_size, questions_count))]})
+        quiz_solver.process_score_feedback(score=0.5, max_score=1.0)
+    start = time.perf_counter()
+    quiz_solver.save_checkpoint(path)
+    first_save_time = time.perf_counter() - start
+    start = time.perf_counter()
+    quiz_solver.save_checkpoint(path)
+    save_time = time.perf_counter() - start
+    start = time.perf_counter()
+    QuizSolver(setup=create_setup("Beta"), strategy_in_use="Beta").load_checkpoint(path)
+    load_time = time.perf_counter() - start
+    return {"first_save": first_save_time * 1e3, "save": save_time * 1e3, "load": load_time * 1e3,
+            "size": os.path.getsize(path) / 2 ** 20}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Checkpoint save and load of the whole solver state")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="Numbers of questions in the bank")
+    args = parser.parse_args()
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "quizsolver.checkpoint")
+        for strategy in ("Alpha", "NegativeAlpha", "Beta", "NegativeBeta"):
+            for during_quiz in (False, True):
+                check_resume(strategy=strategy, questions_count=50, epochs_before=60, epochs_after=300,
+                             during_quiz=during_quiz, path=path)
+        print(f"{'bank':>9} {'first save [ms]':>16} {'save [ms]':>10} {'load [ms]':>10} {'size [MB]':>10}")
+        for questions_count in args.sizes:
+            result = measure_checkpoint(questions_count=questions_count, path=path)
+            print(f"{questions_count:>9} {result['first_save']:>16.1f} {result['save']:>10.1f} "
+                  f"{result['load']:>10.1f} {result['size']:>10.1f}")
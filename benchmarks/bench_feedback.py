@@ -0,0 +1,49 @@
+import time
+import random
+import argparse
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizGenerator
+
+
+def measure_feedback(*, strategy: str, questions_count: int, quiz_size: int, epochs: int) -> tuple[float, float]:
+    """
+    Measure time of QuizSolver.process_score_feedback and of the feedback of the strategy in use
+    per question of the quiz.
+    Returns:
+        tuple: Times in microseconds per quiz question.
+    """
+    quiz_generator = QuizGenerator(questions_count=questions_count)
+    quiz_solver = QuizSolver(setup=QuizSolverSetup(redraw_console_interval=-1, render_plots_interval=-1,
+                                                   preferred_strategy=strategy, targeted_score=1.0),
+                             strategy_in_use=strategy)
+    # Time the feedback of the strategy separately
+    strategy_elapsed = [0.0]
+    strategy_in_use = quiz_solver.strategies[strategy]
+    process_quiz_feedback = strategy_in_use.process_quiz_feedback
+    def timed_process_quiz_feedback(**kwargs):
+        start = time.perf_counter()
+        process_quiz_feedback(**kwargs)
+        strategy_elapsed[0] += time.perf_counter() - start
+    strategy_in_use.process_quiz_feedback = timed_process_quiz_feedback
+    elapsed = 0.0
+    for _ in range(epochs):
+        quiz = quiz_generator.generate_quiz(num_questions=quiz_size)
+        score = quiz_generator.compute_score(quiz=quiz_solver.give_answers(quiz=quiz))
+        start = time.perf_counter()
+        quiz_solver.process_score_feedback(score=score, max_score=1.0)
+        elapsed += time.perf_counter() - start
+    return elapsed / epochs / quiz_size * 1e6, strategy_elapsed[0] / epochs / quiz_size * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of QuizSolver.process_score_feedback")
+    parser.add_argument("--strategy", type=str, default="Alpha", help="Strategy to benchmark")
+    parser.add_argument("--epochs", type=int, default=20, help="Number of measured epochs")
+    parser.add_argument("--quiz-sizes", type=int, nargs="+", default=[1000, 5000, 20000],
+                        help="Numbers of questions per quiz")
+    args = parser.parse_args()
+    random.seed(0)
+    print(f"{'strategy':>14} {'bank':>8} {'quiz':>8} {'feedback [us/question]':>23} {'strategy [us/question]':>23}")
+    for quiz_size in args.quiz_sizes:
+        feedback, strategy_feedback = measure_feedback(strategy=args.strategy, questions_count=quiz_size * 2,
+                                                       quiz_size=quiz_size, epochs=args.epochs)
+        print(f"{args.strategy:>14} {quiz_size * 2:>8} {quiz_size:>8} {feedback:>23.3f} {strategy_feedback:>23.3f}")
@@ -0,0 +1,104 @@
+import gc
+import time
+import random
+import argparse
+import tracemalloc
+from collections import Counter
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizGenerator
+
+PROBABILITIES = {"chooseOne": 0.5, "chooseOneOrMore": 0.3, "chooseZeroOrMore": 0.2}
+
+
+def create_generator(questions_count: int, compact: bool) -> QuizGenerator:
+    """Create a generator of questions with 2 to 6 answers of all three types."""
+    return QuizGenerator(questions_count=questions_count, min_answers_per_question=2, max_answers_per_question=6,
+                         probability_of_choose_one_type=PROBABILITIES["chooseOne"],
+                         probability_of_choose_one_or_more_type=PROBABILITIES["chooseOneOrMore"],
+                         probability_of_choose_zero_or_more_type=PROBABILITIES["chooseZeroOrMore"],
+                         compact=compact)
+
+
+def check_compact_bank(*, questions_count: int):
+    """
+    Check that the compact bank follows the type probabilities and the rules of the types,
+    that its quizzes have the format of the quizzes of the default generator, that the texts
+    of a question are the same in every quiz, and that a quiz solver can solve it.
+    """
+    quiz_generator = create_generator(questions_count, compact=True)
+    questions = [quiz_generator.get_question(i) for i in range(questions_count)]
+    types = Counter(question["type"] for question in questions)
+    for question_type, probability in PROBABILITIES.items():
+        if abs(types[question_type] / questions_count - probability) > 0.02:
+            raise ValueError(f"Compact bank has {types[question_type]} questions of type {question_type}.")
+    for question in questions:
+        correct = sum(answer["correct"] for answer in question["answers"])
+        if not 2 <= len(question["answers"]) <= 6 or len({answer["answer"] for answer in question["answers"]}) != \
+                len(question["answers"]):
+            raise ValueError(f"Compact bank has invalid answers of {question['question']}.")
+        if question["type"] == "chooseOne" and correct != 1 or question["type"] == "chooseOneOrMore" and correct < 1:
+            raise ValueError(f"Compact bank has {correct} correct answers of {question['question']}.")
+    default_quiz = create_generator(10, compact=False).generate_quiz(num_questions=5)
+    quiz = quiz_generator.generate_quiz(num_questions=questions_count)
+    if set(quiz) != set(default_quiz) or set(quiz["questions"][0]) != set(default_quiz["questions"][0]) or \
+            set(quiz["questions"][0]["answers"][0]) != set(default_quiz["questions"][0]["answers"][0]):
+        raise ValueError("Quizzes of the compact bank have a different format.")
+    for quiz_question in quiz["questions"]:
+        question = questions[int(quiz_question["question"][4:-5])]
+        if quiz_question["answers"] != [{"answer": answer["answer"]} for answer in question["answers"]]:
+            raise ValueError(f"Quiz has different texts of {quiz_question['question']}.")
+    # Random answers are not all correct, the correct fields of the bank always are
+    response = {"questions": [{"question": question["question"], "answers": question["answers"]}
+                              for question in questions]}
+    if quiz_generator.compute_score(quiz=response) != 1.0:
+        raise ValueError("Correct answers of the compact bank do not score 1.0.")
+    quiz_solver = QuizSolver(setup=QuizSolverSetup(headless=True, preferred_strategy="Alpha", targeted_score=1.0,
+                                                   max_epochs=10 ** 9),
+                             strategy_in_use="Alpha")
+    score = quiz_generator.compute_score(quiz=quiz_solver.give_answers(quiz=quiz))
+    if not 0.0 <= score < 1.0:
+        raise ValueError(f"Random answers of the compact bank scored {score}.")
+    quiz_solver.process_score_feedback(score=score, max_score=1.0)
+
+
+def measure_generator(*, questions_count: int, compact: bool, quiz_size: int = 1000) -> dict:
+    """
+    Measure building a bank, the memory it keeps, drawing a quiz and scoring it.
+    Returns:
+        dict: Build time in seconds, memory in megabytes and quiz times in milliseconds.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    quiz_generator = create_generator(questions_count, compact)
+    build_time = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    quiz = quiz_generator.generate_quiz(num_questions=quiz_size)
+    quiz_time = time.perf_counter() - start
+    for question in quiz["questions"]:
+        for answer in question["answers"]:
+            answer["correct"] = False
+    start = time.perf_counter()
+    quiz_generator.compute_score(quiz=quiz)
+    score_time = time.perf_counter() - start
+    return {"build": build_time, "memory": memory / 2 ** 20, "quiz": quiz_time * 1e3, "score": score_time * 1e3}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Question banks of the default and the compact quiz generator")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="Numbers of questions in the bank")
+    parser.add_argument("--default-limit", type=int, default=1000000,
+                        help="Largest bank built by the default generator")
+    args = parser.parse_args()
+    random.seed(0)
+    check_compact_bank(questions_count=20000)
+    print(f"{'bank':>9} {'mode':>8} {'build [s]':>10} {'memory [MB]':>12} {'quiz [ms]':>10} {'score [ms]':>11}")
+    for questions_count in args.sizes:
+        for compact in (False, True):
+            if not compact and questions_count > args.default_limit:
+                continue
+            result = measure_generator(questions_count=questions_count, compact=compact)
+            print(f"{questions_count:>9} {'compact' if compact else 'default':>8} {result['build']:>10.3f} "
+                  f"{result['memory']:>12.1f} {result['quiz']:>10.2f} {result['score']:>11.2f}")
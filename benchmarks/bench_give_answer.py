@@ -0,0 +1,62 @@
+import math
+import time
+import argparse
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizGenerator
+
+
+def measure_give_answer(*, questions_count: int, answers_per_question: int,
+                        repeats: int) -> tuple[float, float, float]:
+    """
+    Measure per-question latency of QuizSolver.give_answer for new and for already known questions
+    and of QuizSolver.give_answers for a whole quiz of already known questions.
+    Both paths of known questions are measured repeats times with new quizzes, in alternating order,
+    and the fastest pass of each is taken, so neither depends on warm-up or a single slow pass.
+    Returns:
+        tuple: Latency in microseconds of the first-seen path, of the fingerprint fast path
+               and of the batch path.
+    """
+    quiz_generator = QuizGenerator(questions_count=questions_count,
+                                   min_answers_per_question=answers_per_question,
+                                   max_answers_per_question=answers_per_question)
+    quiz = quiz_generator.generate_quiz(num_questions=questions_count)
+    quiz_solver = QuizSolver(setup=QuizSolverSetup(redraw_console_interval=-1, render_plots_interval=-1,
+                                                   preferred_strategy="Alpha"),
+                             strategy_in_use="Alpha")
+    # First pass builds every question
+    start = time.perf_counter()
+    for quiz_question in quiz["questions"]:
+        quiz_solver.give_answer(quiz_question=quiz_question)
+    first_seen = (time.perf_counter() - start) / questions_count * 1e6
+    known = math.inf
+    batch = math.inf
+    for _ in range(repeats):
+        # Every question is resolved by its fingerprint, one by one
+        quiz = quiz_generator.generate_quiz(num_questions=questions_count)
+        quiz_solver._latest_quiz.clear()
+        start = time.perf_counter()
+        for quiz_question in quiz["questions"]:
+            quiz_solver.give_answer(quiz_question=quiz_question)
+        known = min(known, (time.perf_counter() - start) / questions_count * 1e6)
+        # Whole quiz resolved by a single batch call
+        quiz = quiz_generator.generate_quiz(num_questions=questions_count)
+        quiz_solver._latest_quiz.clear()
+        start = time.perf_counter()
+        quiz_solver.give_answers(quiz=quiz)
+        batch = min(batch, (time.perf_counter() - start) / questions_count * 1e6)
+    return first_seen, known, batch
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of QuizSolver.give_answer")
+    parser.add_argument("--questions", type=int, default=20000, help="Number of questions in the bank")
+    parser.add_argument("--repeats", type=int, default=15,
+                        help="Number of measured passes of known questions, the fastest is reported")
+    args = parser.parse_args()
+    print(f"{'answers':>8} {'first seen [us]':>16} {'known [us]':>12} {'batch [us]':>12} {'speedup':>8} "
+          f"{'batch speedup':>14}")
+    for answers_per_question in (4, 8, 16):
+        first_seen, known, batch = measure_give_answer(questions_count=args.questions,
+                                                       answers_per_question=answers_per_question,
+                                                       repeats=args.repeats)
+        print(f"{answers_per_question:>8} {first_seen:>16.2f} {known:>12.2f} {batch:>12.2f} "
+              f"{first_seen / known:>8.1f}x {known / batch:>13.2f}x")
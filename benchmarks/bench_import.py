@@ -0,0 +1,57 @@
+import sys
+import json
+import argparse
+import subprocess
+
+
+# Each scenario runs in a fresh interpreter and reports its import time, peak RSS
+# and whether the visualization modules were loaded
+SCENARIOS = {
+    "import package": """
+import package.quizsolver
+""",
+    "import package + UI": """
+import package.quizsolver
+import matplotlib.pyplot
+""",
+    "headless solve": """
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizGenerator
+quiz_generator = QuizGenerator(questions_count=200)
+quiz_solver = QuizSolver(setup=QuizSolverSetup(headless=True), strategy_in_use="Alpha")
+for _ in range(50):
+    quiz = quiz_generator.generate_quiz(num_questions=40)
+    score = quiz_generator.compute_score(quiz=quiz_solver.give_answers(quiz=quiz))
+    quiz_solver.process_score_feedback(score=score, max_score=1.0)
+""",
+}
+
+RUNNER = """
+import sys, time, json, resource
+start = time.perf_counter()
+exec({code!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "matplotlib": "matplotlib" in sys.modules,
+}}))
+"""
+
+
+def run_scenario(code: str) -> dict:
+    """Run a scenario in a fresh interpreter and return its measurements."""
+    output = subprocess.run([sys.executable, "-c", RUNNER.format(code=code)],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import time and memory with and without visualization modules")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per scenario, the fastest one is reported")
+    args = parser.parse_args()
+    print(f"{'scenario':>20} {'time [ms]':>10} {'max RSS [MB]':>13} {'matplotlib':>11}")
+    for name, code in SCENARIOS.items():
+        results = [run_scenario(code) for _ in range(args.repeats)]
+        best = min(results, key=lambda result: result["seconds"])
+        print(f"{name:>20} {best['seconds'] * 1e3:>10.1f} {best['max_rss_kb'] / 1024:>13.1f} "
+              f"{str(best['matplotlib']):>11}")
@@ -0,0 +1,196 @@
+import os
+import copy
+import time
+import random
+import argparse
+import tempfile
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizGenerator
+
+
+def create_setup(strategy: str, journal_path: str | None, *, journal_sync_epochs: int = 1) -> QuizSolverSetup:
+    """Create a headless setup with the given preferred strategy and journal."""
+    return QuizSolverSetup(headless=True, preferred_strategy=strategy, targeted_score=1.0, max_epochs=10 ** 9,
+                           journal_path=journal_path, journal_sync_epochs=journal_sync_epochs)
+
+
+class GeneratorRandom:
+    """
+    Run the quiz generator on its own stream of the random module, so the quiz solver
+    finds the random generator as it left it and the journal does not store its state.
+    """
+    def __init__(self, seed: int):
+        random_state = random.getstate()
+        random.seed(seed)
+        self._state = random.getstate()
+        random.setstate(random_state)
+
+    def __enter__(self):
+        self._solver_state = random.getstate()
+        random.setstate(self._state)
+
+    def __exit__(self, *args):
+        self._state = random.getstate()
+        random.setstate(self._solver_state)
+
+
+def run_epoch(quiz_solver: QuizSolver, quiz_generator: QuizGenerator, epoch: int,
+              generator_random: GeneratorRandom | None = None):
+    """
+    Run one epoch. Every third epoch answers the questions one by one, every other epoch
+    runs the quiz generator on its own random stream if one is given.
+    """
+    separate = generator_random is not None and epoch % 2 == 0
+    if separate:
+        with generator_random:
+            quiz = quiz_generator.generate_quiz(num_questions=max(1, quiz_generator.questions_count // 5))
+    else:
+        quiz = quiz_generator.generate_quiz(num_questions=max(1, quiz_generator.questions_count // 5))
+    if epoch % 3 == 0:
+        response = {"questions": [quiz_solver.give_answer(quiz_question=quiz_question)
+                                  for quiz_question in quiz["questions"]]}
+    else:
+        response = quiz_solver.give_answers(quiz=quiz)
+    if separate:
+        with generator_random:
+            score = quiz_generator.compute_score(quiz=response)
+    else:
+        score = quiz_generator.compute_score(quiz=response)
+    quiz_solver.process_score_feedback(score=score, max_score=1.0)
+
+
+def solver_state(quiz_solver: QuizSolver) -> tuple:
+    """Get a copy of the state of a quiz solver which must be equal after recovery."""
+    return copy.deepcopy((quiz_solver.epoch, quiz_solver._strategy_in_use.name, quiz_solver.latest_result,
+                          quiz_solver.state.checkpoint_state(),
+                          {name: strategy.checkpoint_state() for name, strategy in quiz_solver.strategies.items()},
+                          [question.uid_bytes for question in quiz_solver.questions.values()]))
+
+
+def check_recovery(*, strategy: str, questions_count: int, checkpoint_epoch: int | None, epochs: int,
+                   torn: bool, directory: str):
+    """
+    Run a journaled quiz solver, saving a checkpoint at checkpoint_epoch, and abandon it in the middle
+    of an epoch. A new quiz solver recovered from the checkpoint and the journal must be in the state
+    of the abandoned solver after its last finished epoch. If torn is set, the last record is damaged,
+    as if the machine crashed while writing it, and the last epoch is lost.
+    The recovered solver must keep journaling, so it can be recovered again.
+    """
+    journal_path = os.path.join(directory, f"{strategy}.journal")
+    checkpoint_path = os.path.join(directory, f"{strategy}.checkpoint")
+    for path in (journal_path, checkpoint_path):
+        if os.path.exists(path):
+            os.remove(path)
+    quiz_generator = QuizGenerator(questions_count=questions_count)
+    generator_random = GeneratorRandom(seed=1)
+    quiz_solver = QuizSolver(setup=create_setup(strategy, journal_path), strategy_in_use=strategy)
+    states = []
+    for epoch in range(epochs):
+        if epoch == checkpoint_epoch:
+            quiz_solver.save_checkpoint(checkpoint_path)
+        run_epoch(quiz_solver, quiz_generator, epoch, generator_random)
+        states.append((solver_state(quiz_solver), random.getstate()))
+    journal_length = os.path.getsize(journal_path)
+    # Unfinished epoch
+    quiz_solver.give_answers(quiz=quiz_generator.generate_quiz(num_questions=max(1, questions_count // 5)))
+    quiz_solver.journal._file.flush()
+    expected_state, expected_random_state = states[-1]
+    if torn:
+        with open(journal_path, "r+b") as file:
+            file.truncate(journal_length - 3)
+        expected_state, expected_random_state = states[-2]
+    # A new quiz solver which does not recover must not empty the journal
+    careless_solver = QuizSolver(setup=create_setup(strategy, journal_path), strategy_in_use=strategy)
+    try:
+        careless_solver.give_answers(quiz={"questions": []})
+    except ValueError:
+        pass
+    else:
+        raise ValueError(f"Quiz solver of {strategy} opened an existing journal without recovering it.")
+    recovered_solver = QuizSolver(setup=create_setup(strategy, journal_path), strategy_in_use=strategy)
+    replayed_epochs = recovered_solver.recover(checkpoint_path)
+    if solver_state(recovered_solver) != expected_state or random.getstate() != expected_random_state:
+        raise ValueError(f"Recovered {strategy} solver differs from the crashed solver "
+                         f"(checkpoint at epoch {checkpoint_epoch}, torn: {torn}).")
+    if replayed_epochs != expected_state[0] - (checkpoint_epoch or 0):
+        raise ValueError(f"Recovered {strategy} solver replayed {replayed_epochs} epochs.")
+    for epoch in range(epochs, epochs + 10):
+        run_epoch(recovered_solver, quiz_generator, epoch)
+    expected_state, expected_random_state = solver_state(recovered_solver), random.getstate()
+    recovered_solver.close()
+    recovered_again = QuizSolver(setup=create_setup(strategy, journal_path), strategy_in_use=strategy)
+    recovered_again.recover(checkpoint_path)
+    if solver_state(recovered_again) != expected_state or random.getstate() != expected_random_state:
+        raise ValueError(f"Solver recovered twice differs from the recovered solver ({strategy}).")
+    recovered_again.close()
+    quiz_solver.close()
+
+
+def create_quiz_question(i: int, answers_per_question: int) -> dict:
+    """Create a quiz question with unique question and answer texts."""
+    return {
+        "question": f"question {i}",
+        "answers": [{"answer": f"answer {i} {j}"} for j in range(answers_per_question)]
+    }
+
+
+def measure_epochs(*, questions_count: int, mode: str, epochs: int, directory: str,
+                   answers_per_question: int = 4) -> tuple[float, float]:
+    """
+    Measure the time of an epoch (give_answers and process_score_feedback of a quiz with 20 %
+    of the bank) with the given persistence mode: "none", "journal" (flushed to disk every epoch),
+    "journal/10" (flushed every 10 epochs) or "checkpoint" (full checkpoint after every epoch).
+    Returns:
+        tuple: Time per epoch in milliseconds and bytes written per epoch.
+    """
+    journal_path = os.path.join(directory, "measure.journal")
+    checkpoint_path = os.path.join(directory, "measure.checkpoint")
+    for path in (journal_path, checkpoint_path):
+        if os.path.exists(path):
+            os.remove(path)
+    quiz_solver = QuizSolver(setup=create_setup("Beta", journal_path if mode.startswith("journal") else None,
+                                                journal_sync_epochs=10 if mode == "journal/10" else 1),
+                             strategy_in_use="Beta")
+    bank = [create_quiz_question(i, answers_per_question) for i in range(questions_count)]
+    quiz_solver.give_answers(quiz={"questions": bank})
+    quiz_solver.process_score_feedback(score=0.5, max_score=1.0)
+    if mode == "checkpoint":
+        quiz_solver.save_checkpoint(checkpoint_path)
+    elif mode.startswith("journal"):
+        quiz_solver.save_checkpoint(checkpoint_path)
+        written_before = os.path.getsize(journal_path)
+    elapsed = 0.0
+    written = 0
+    for _ in range(epochs):
+        quiz = {"questions": random.sample(bank, questions_count // 5)}
+        start = time.perf_counter()
+        quiz_solver.give_answers(quiz=quiz)
+        quiz_solver.process_score_feedback(score=random.random(), max_score=1.0)
+        if mode == "checkpoint":
+            quiz_solver.save_checkpoint(checkpoint_path)
+            written += os.path.getsize(checkpoint_path)
+        elapsed += time.perf_counter() - start
+    if mode.startswith("journal"):
+        written = os.path.getsize(journal_path) - written_before
+    quiz_solver.close()
+    return elapsed / epochs * 1e3, written / epochs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Journal of epochs for crash recovery")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000],
+                        help="Numbers of questions in the bank")
+    parser.add_argument("--epochs", type=int, default=20, help="Number of measured epochs")
+    args = parser.parse_args()
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as directory:
+        for strategy in ("Alpha", "NegativeAlpha", "Beta", "NegativeBeta"):
+            for checkpoint_epoch in (None, 0, 40):
+                for torn in (False, True):
+                    check_recovery(strategy=strategy, questions_count=50, checkpoint_epoch=checkpoint_epoch,
+                                   epochs=120, torn=torn, directory=directory)
+        print(f"{'bank':>9} {'mode':>11} {'epoch [ms]':>11} {'written [kB/epoch]':>19}")
+        for questions_count in args.sizes:
+            for mode in ("none", "journal", "journal/10", "checkpoint"):
+                elapsed, written = measure_epochs(questions_count=questions_count, mode=mode,
+                                                  epochs=args.epochs, directory=directory)
+                print(f"{questions_count:>9} {mode:>11} {elapsed:>11.2f} {written / 1e3:>19.1f}")
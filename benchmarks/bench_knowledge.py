@@ -0,0 +1,198 @@
+import os
+import time
+import random
+import argparse
+import tempfile
+import multiprocessing
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizGenerator
+from package.quizsolver.knowledgebase import KnowledgeBase
+
+DIGEST_SIZE = 32
+
+
+def create_setup(strategy: str, knowledge_base_path: str, max_epochs: int) -> QuizSolverSetup:
+    """Create a headless setup with the given preferred strategy, knowledge base and limit of epochs."""
+    return QuizSolverSetup(headless=True, preferred_strategy=strategy, targeted_score=1.0, max_epochs=max_epochs,
+                           knowledge_base_path=knowledge_base_path)
+
+
+def solve(quiz_solver: QuizSolver, quiz_generator: QuizGenerator) -> tuple[int, float, bool]:
+    """
+    Solve quizzes of 20 % of the bank until all questions of the bank are solved
+    or max_epochs of the setup is reached. A quiz answered correctly does not stop the run,
+    the bank is solved only when all of its questions were presented and solved.
+    Returns:
+        tuple: Number of epochs, the lowest score and whether the bank was solved.
+    """
+    epochs = 0
+    min_score = 1.0
+    while epochs < quiz_solver.setup.max_epochs:
+        quiz = quiz_generator.generate_quiz(num_questions=max(1, quiz_generator.questions_count // 5))
+        score = quiz_generator.compute_score(quiz=quiz_solver.give_answers(quiz=quiz))
+        min_score = min(min_score, score)
+        epochs += 1
+        result = quiz_solver.process_score_feedback(score=score, max_score=1.0)
+        if result["all_questions_solved"] and len(quiz_solver.questions) == quiz_generator.questions_count:
+            return epochs, min_score, True
+    return epochs, min_score, False
+
+
+def check_knowledge_transfer(*, strategy: str, questions_count: int, path: str,
+                             max_epochs: int) -> tuple[int | None, int | None]:
+    """
+    Solve a bank with an empty knowledge base, then solve it again with a new quiz solver.
+    The second quiz solver must start every question solved and answer all quizzes correctly,
+    it only needs the epochs until every question of the bank was presented.
+    Returns:
+        tuple: Numbers of epochs of the first and the second quiz solver, None if the first quiz solver
+            did not solve the bank in max_epochs (the second one is not run then).
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    quiz_generator = QuizGenerator(questions_count=questions_count)
+    first_solver = QuizSolver(setup=create_setup(strategy, path, max_epochs), strategy_in_use=strategy)
+    first_epochs, _, solved = solve(first_solver, quiz_generator)
+    first_solver.close()
+    if not solved:
+        return None, None
+    second_solver = QuizSolver(setup=create_setup(strategy, path, max_epochs), strategy_in_use=strategy)
+    second_epochs, min_score, solved = solve(second_solver, quiz_generator)
+    if not solved:
+        raise ValueError(f"Quiz solver with the knowledge of {strategy} did not solve the bank.")
+    if min_score != 1.0:
+        raise ValueError(f"Quiz solver with the knowledge of {strategy} scored {min_score}.")
+    if second_solver.questions_from_knowledge_base != len(second_solver.questions) - \
+            sum(len(question.answers) == 1 for question in second_solver.questions.values()):
+        raise ValueError(f"Not all questions solved by {strategy} were found in the knowledge base.")
+    second_solver.close()
+    return first_epochs, second_epochs
+
+
+def create_entry(i: int) -> tuple[bytes, list[bytes], list[bytes]]:
+    """Create a deterministic entry of a question with 1 correct and 3 incorrect answers."""
+    generator = random.Random(i)
+    return generator.randbytes(DIGEST_SIZE), [generator.randbytes(DIGEST_SIZE)], \
+        [generator.randbytes(DIGEST_SIZE) for _ in range(3)]
+
+
+def write_entries(path: str, first: int, count: int, batch_size: int):
+    """Record entries in batches, the knowledge base grows several times."""
+    knowledge_base = KnowledgeBase(path, hash_algorithm="sha3_256", digest_size=DIGEST_SIZE)
+    for start in range(first, first + count, batch_size):
+        knowledge_base.record([create_entry(i) for i in range(start, min(start + batch_size, first + count))])
+    knowledge_base.close()
+
+
+def read_entries(path: str, count: int, timeout: float) -> int:
+    """
+    Look up entries until all of them are found. Entries found must be complete and correct.
+    Returns:
+        int: Number of passes over the entries.
+    """
+    entries = [create_entry(i) for i in range(count)]
+    knowledge_base = KnowledgeBase(path, hash_algorithm="sha3_256", digest_size=DIGEST_SIZE, readonly=True)
+    passes = 0
+    deadline = time.monotonic() + timeout
+    while True:
+        passes += 1
+        found = 0
+        for uid, correct_uids, incorrect_uids in entries:
+            knowledge = knowledge_base.lookup(uid)
+            if knowledge is None:
+                continue
+            if knowledge != (correct_uids, incorrect_uids):
+                raise ValueError(f"Reader found a damaged entry in pass {passes}.")
+            found += 1
+        if found == count:
+            knowledge_base.close()
+            return passes
+        if time.monotonic() > deadline:
+            raise ValueError(f"Reader found only {found} of {count} entries.")
+
+
+def check_concurrent_access(*, path: str, writers: int, readers: int, count: int):
+    """
+    Record entries by several writer processes while several reader processes look them up.
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    # Create the knowledge base before the readers open it
+    KnowledgeBase(path, hash_algorithm="sha3_256", digest_size=DIGEST_SIZE).close()
+    per_writer = count // writers
+    with multiprocessing.Pool(writers + readers) as pool:
+        reader_results = [pool.apply_async(read_entries, (path, per_writer * writers, 120.0)) for _ in range(readers)]
+        writer_results = [pool.apply_async(write_entries, (path, i * per_writer, per_writer, 97))
+                          for i in range(writers)]
+        for result in writer_results:
+            result.get()
+        passes = [result.get() for result in reader_results]
+    knowledge_base = KnowledgeBase(path, hash_algorithm="sha3_256", digest_size=DIGEST_SIZE, readonly=True)
+    if len(knowledge_base) != per_writer * writers:
+        raise ValueError(f"Knowledge base contains {len(knowledge_base)} entries, "
+                         f"expected {per_writer * writers}.")
+    knowledge_base.close()
+    return passes
+
+
+def measure_knowledge_base(*, count: int, path: str, lookups: int = 10000) -> dict:
+    """
+    Measure recording of entries, opening the knowledge base and looking up entries.
+    Returns:
+        dict: Times in microseconds per entry, time of opening in milliseconds and the size in megabytes.
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    entries = [create_entry(i) for i in range(count)]
+    knowledge_base = KnowledgeBase(path, hash_algorithm="sha3_256", digest_size=DIGEST_SIZE)
+    start = time.perf_counter()
+    for first in range(0, count, 1000):
+        knowledge_base.record(entries[first:first + 1000])
+    record_time = time.perf_counter() - start
+    knowledge_base.close()
+    start = time.perf_counter()
+    knowledge_base = KnowledgeBase(path, hash_algorithm="sha3_256", digest_size=DIGEST_SIZE, readonly=True)
+    open_time = time.perf_counter() - start
+    sample = random.sample(entries, min(lookups, count))
+    start = time.perf_counter()
+    for uid, _, _ in sample:
+        knowledge_base.lookup(uid)
+    lookup_time = time.perf_counter() - start
+    missing = [create_entry(count + i)[0] for i in range(len(sample))]
+    start = time.perf_counter()
+    for uid in missing:
+        knowledge_base.lookup(uid)
+    miss_time = time.perf_counter() - start
+    knowledge_base.close()
+    return {"record": record_time / count * 1e6, "open": open_time * 1e3,
+            "lookup": lookup_time / len(sample) * 1e6, "miss": miss_time / len(missing) * 1e6,
+            "size": os.path.getsize(path) / 2 ** 20}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Knowledge base of solved questions shared between runs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="Numbers of questions in the knowledge base")
+    parser.add_argument("--questions", type=int, default=20, help="Number of questions of the solved bank")
+    parser.add_argument("--max-epochs", type=int, default=20000,
+                        help="Runs which do not solve the bank in this number of epochs are reported unsolved")
+    args = parser.parse_args()
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "quizsolver.knowledge")
+        print(f"{'strategy':>13} {'epochs without':>15} {'epochs with knowledge':>22}")
+        for strategy in ("Alpha", "NegativeAlpha", "Beta", "NegativeBeta"):
+            first_epochs, second_epochs = check_knowledge_transfer(strategy=strategy,
+                                                                   questions_count=args.questions, path=path,
+                                                                   max_epochs=args.max_epochs)
+            if first_epochs is None:
+                print(f"{strategy:>13} {'unsolved':>15} {'-':>22}")
+            else:
+                print(f"{strategy:>13} {first_epochs:>15} {second_epochs:>22}")
+        passes = check_concurrent_access(path=path, writers=3, readers=4, count=30000)
+        print(f"4 readers and 3 writers: consistent, readers needed {passes} passes")
+        print(f"{'entries':>9} {'record [us]':>12} {'open [ms]':>10} {'lookup [us]':>12} "
+              f"{'miss [us]':>10} {'size [MB]':>10}")
+        for count in args.sizes:
+            result = measure_knowledge_base(count=count, path=path)
+            print(f"{count:>9} {result['record']:>12.2f} {result['open']:>10.3f} {result['lookup']:>12.2f} "
+                  f"{result['miss']:>10.2f} {result['size']:>10.1f}")
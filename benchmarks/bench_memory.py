@@ -0,0 +1,43 @@
+import gc
+import argparse
+import tracemalloc
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizGenerator
+
+
+def measure_bytes_per_question(*, questions_count: int, answers_per_question: int) -> float:
+    """
+    Measure memory retained by a QuizSolver per question of its question bank.
+    The texts of questions and answers are allocated by the generator before tracing starts,
+    so the result covers the object model and the strategy state, not the text itself.
+    Returns:
+        float: Retained bytes per question.
+    """
+    quiz_generator = QuizGenerator(questions_count=questions_count,
+                                   min_answers_per_question=answers_per_question,
+                                   max_answers_per_question=answers_per_question)
+    gc.collect()
+    tracemalloc.start()
+    quiz_solver = QuizSolver(setup=QuizSolverSetup(redraw_console_interval=-1, render_plots_interval=-1,
+                                                   preferred_strategy="Alpha"),
+                             strategy_in_use="Alpha")
+    baseline, _ = tracemalloc.get_traced_memory()
+    quiz = quiz_generator.generate_quiz(num_questions=questions_count)
+    response = quiz_solver.give_answers(quiz=quiz)
+    # Drop everything except the question bank of the solver
+    del quiz, response
+    quiz_solver._latest_quiz.clear()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (current - baseline) / questions_count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Memory of the question bank per question")
+    parser.add_argument("--questions", type=int, default=20000, help="Number of questions in the bank")
+    args = parser.parse_args()
+    print(f"{'answers':>8} {'bytes per question':>19}")
+    for answers_per_question in (4, 16):
+        bytes_per_question = measure_bytes_per_question(questions_count=args.questions,
+                                                        answers_per_question=answers_per_question)
+        print(f"{answers_per_question:>8} {bytes_per_question:>19.0f}")
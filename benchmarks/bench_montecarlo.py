@@ -0,0 +1,52 @@
+import time
+import argparse
+from package.quizsolver import QuizSolverSetup, MonteCarloRunner
+from package.quizsolver.montecarlo import available_cpu_count
+
+
+def create_runner(*, runs: int, workers: int, questions_count: int, strategy: str | None) -> MonteCarloRunner:
+    """Create a runner of quizzes of 20 % of the bank with the given preferred strategy."""
+    return MonteCarloRunner(setup=QuizSolverSetup(targeted_score=1.0, preferred_strategy=strategy), runs=runs,
+                            workers=workers, questions_count=questions_count,
+                            questions_per_quiz=max(1, questions_count // 5))
+
+
+def measure_runner(*, runs: int, workers: int, questions_count: int, strategy: str | None) -> tuple[dict, list, float]:
+    """
+    Run the runs with the given number of worker processes.
+    Returns:
+        tuple: Statistics, epochs of the runs ordered by seed and the wall time in seconds.
+    """
+    runner = create_runner(runs=runs, workers=workers, questions_count=questions_count, strategy=strategy)
+    start = time.perf_counter()
+    statistics = runner.run()
+    elapsed = time.perf_counter() - start
+    epochs = [result["epochs"] for result in sorted(runner.results, key=lambda result: result["seed"])]
+    return statistics, epochs, elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo runs of independent seeded solves in a process pool")
+    parser.add_argument("--runs", type=int, default=64, help="Number of runs")
+    parser.add_argument("--questions", type=int, default=200, help="Number of questions in the bank")
+    args = parser.parse_args()
+    cpus = available_cpu_count()
+    # 2 workers at least, so the independence of the results from the number of workers is checked
+    worker_counts = sorted({1, 2, max(1, cpus // 2), cpus})
+    print(f"{'workers':>8} {'wall [s]':>9} {'runs/s':>8} {'speedup':>8} {'solved':>7} {'mean':>9} {'median':>8} "
+          f"{'p95':>8}")
+    expected_epochs = None
+    serial_time = None
+    for workers in worker_counts:
+        statistics, epochs, elapsed = measure_runner(runs=args.runs, workers=workers,
+                                                     questions_count=args.questions, strategy=None)
+        # Runs are seeded, the distribution does not depend on the number of workers
+        if expected_epochs is None:
+            expected_epochs, serial_time = epochs, elapsed
+        elif epochs != expected_epochs:
+            raise ValueError(f"Runs with {workers} workers differ from the runs with 1 worker.")
+        # Epoch statistics cover solved runs only, there are none if no run was solved
+        epochs_columns = " ".join(f"{statistics[name]:>{width}.1f}" if statistics[name] is not None
+                                  else f"{'-':>{width}}" for name, width in (("mean", 9), ("median", 8), ("p95", 8)))
+        print(f"{workers:>8} {elapsed:>9.2f} {args.runs / elapsed:>8.2f} {serial_time / elapsed:>8.2f} "
+              f"{statistics['solved_runs']:>7} {epochs_columns}")
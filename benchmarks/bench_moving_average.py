@@ -0,0 +1,104 @@
+import gc
+import time
+import random
+import argparse
+import tracemalloc
+from package.quizsolver.movingaverage import MovingAverage
+
+
+def legacy_median(moving_average: MovingAverage) -> float:
+    """Compute the median of the window by sorting it, the way MovingAverage.median used to."""
+    window_size = moving_average.window_size
+    sorted_values = sorted(moving_average.window_values())
+    mid = window_size // 2
+    if window_size % 2 == 0:
+        return (sorted_values[mid - 1] + sorted_values[mid]) / 2.0
+    else:
+        return sorted_values[mid]
+
+
+def measure_modes(*, window_size: int, values_count: int) -> dict[str, float]:
+    """
+    Measure time of adding a value and reading the moving average in each mode.
+    Returns:
+        dict: Times in microseconds per value by mode.
+    """
+    values = [random.uniform(0, 1) for _ in range(values_count)]
+    result = {}
+    for mode in MovingAverage.MODES:
+        moving_average = MovingAverage(initial_value=0.25, window_size=window_size, mode=mode, history_size=0)
+        start = time.perf_counter()
+        for value in values:
+            moving_average.add_value(value, 10.0)
+            moving_average.moving_average
+        result[mode] = (time.perf_counter() - start) / values_count * 1e6
+    return result
+
+
+def measure_median(*, window_size: int, values_count: int) -> tuple[float, float, float]:
+    """
+    Measure time of adding a value (which records the median in the history)
+    and of reading the median from the heaps and by sorting the window.
+    Returns:
+        tuple: Times in microseconds per value of add_value, the heap median and the sorted median.
+    """
+    moving_average = MovingAverage(initial_value=0.25, window_size=window_size)
+    add_value_time = heap_median_time = sorted_median_time = 0.0
+    for _ in range(values_count):
+        value = random.uniform(0, 1)
+        start = time.perf_counter()
+        moving_average.add_value(value)
+        add_value_time += time.perf_counter() - start
+        start = time.perf_counter()
+        moving_average.median
+        heap_median_time += time.perf_counter() - start
+        start = time.perf_counter()
+        legacy_median(moving_average)
+        sorted_median_time += time.perf_counter() - start
+    return (add_value_time / values_count * 1e6, heap_median_time / values_count * 1e6,
+            sorted_median_time / values_count * 1e6)
+
+
+def measure_memory(*, window_size: int, values_count: int, history_size: int, history_policy: str) -> float:
+    """
+    Measure memory retained by a moving average after adding values.
+    Returns:
+        float: Retained bytes.
+    """
+    values = [random.uniform(0, 1) for _ in range(values_count)]
+    gc.collect()
+    tracemalloc.start()
+    moving_average = MovingAverage(initial_value=0.25, history_size=history_size, history_policy=history_policy)
+    moving_average.set_window_size(window_size)
+    for value in values:
+        moving_average.add_value(value)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of the rolling median of MovingAverage")
+    parser.add_argument("--window-sizes", type=int, nargs="+", default=[7, 100, 1000, 10000], help="Window sizes")
+    parser.add_argument("--values", type=int, default=5000, help="Number of added values per window size")
+    args = parser.parse_args()
+    random.seed(0)
+    print(f"{'window':>7} {'add_value [us]':>15} {'heap median [us]':>17} {'sorted median [us]':>19}")
+    for window_size in args.window_sizes:
+        add_value_time, heap_median_time, sorted_median_time = measure_median(window_size=window_size,
+                                                                              values_count=args.values)
+        print(f"{window_size:>7} {add_value_time:>15.2f} {heap_median_time:>17.2f} {sorted_median_time:>19.2f}")
+    print()
+    print(f"{'window':>7} {'values':>7} {'history':>8} {'policy':>12} {'bytes':>9}")
+    for window_size in (3, 7, 1000):
+        for history_size, history_policy in ((0, "drop_oldest"), (1000, "drop_oldest"), (1000, "halve"),
+                                             (10000, "drop_oldest")):
+            retained = measure_memory(window_size=window_size, values_count=20000, history_size=history_size,
+                                      history_policy=history_policy)
+            print(f"{window_size:>7} {20000:>7} {history_size:>8} {history_policy:>12} {retained:>9.0f}")
+    print()
+    print(f"{'window':>7} " + " ".join(f"{mode + ' [us]':>16}" for mode in MovingAverage.MODES))
+    for window_size in args.window_sizes:
+        times = measure_modes(window_size=window_size, values_count=args.values)
+        print(f"{window_size:>7} " + " ".join(f"{times[mode]:>16.2f}" for mode in MovingAverage.MODES))
@@ -0,0 +1,161 @@
+import time
+import random
+import argparse
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizGenerator
+from package.quizsolver.plotrenderer import PALETTE, PLOT_ROWS, ANSWERS_PER_ROW, MAX_PLOTTED_ANSWERS
+
+
+def legacy_bars(strategy) -> tuple[list[float], list[str]]:
+    """Build the answer bars by walking the questions, the way plot() used to."""
+    colors = []
+    answers = []
+    answers_count = 0
+    is_beta = strategy.name == "Beta"
+    for question in strategy._quizsolver.questions.values():
+        if answers_count >= MAX_PLOTTED_ANSWERS:
+            break
+        is_in_training_group = is_beta and question in strategy.training_minibatch
+        for answer in question.answers:
+            if answers_count >= MAX_PLOTTED_ANSWERS:
+                break
+            counter1 = strategy._counters["1"][answer.index] if is_beta else strategy._counter[answer.index]
+            counter2 = strategy._counters["2"][answer.index] if is_beta else 0
+            if counter1 > 0:
+                colors.append('blue' if is_in_training_group else 'black')
+                answers.append(counter1)
+            elif counter2 > 0:
+                colors.append('cornflowerblue' if is_in_training_group else 'gray')
+                answers.append(counter2)
+            else:
+                colors.append('lightgray')
+                answers.append(0.5)
+        answers_count += len(question.answers) + 4
+        colors.extend(['lightgray'] * 4)
+        answers.extend([0] * 4)
+    answers = (answers + [0] * MAX_PLOTTED_ANSWERS)[:MAX_PLOTTED_ANSWERS]
+    colors = (colors + ['black'] * MAX_PLOTTED_ANSWERS)[:MAX_PLOTTED_ANSWERS]
+    return answers, colors
+
+
+def legacy_draw(axes: list, heights: list[float], colors: list[str]):
+    """Clear the answer subplots and create new bars, the way plot() used to."""
+    for i in range(1, PLOT_ROWS):
+        axes[i].clear()
+        start_index = (i - 1) * ANSWERS_PER_ROW
+        end_index = start_index + ANSWERS_PER_ROW
+        axes[i].xaxis.set_visible(False)
+        axes[i].bar(range(ANSWERS_PER_ROW), heights[start_index:end_index],
+                    color=colors[start_index:end_index], alpha=0.7)
+
+
+def create_quiz_solver(strategy: str, questions_count: int, epochs: int) -> tuple[QuizSolver, QuizGenerator]:
+    """Create a quiz solver with the given strategy in use and train it for some epochs."""
+    quiz_generator = QuizGenerator(questions_count=questions_count)
+    quiz_solver = QuizSolver(setup=QuizSolverSetup(redraw_console_interval=-1, render_plots_interval=-1,
+                                                   preferred_strategy=strategy, targeted_score=1.0),
+                             strategy_in_use=strategy)
+    quiz_solver.give_answers(quiz=quiz_generator.generate_quiz(num_questions=questions_count))
+    quiz_solver.process_score_feedback(score=0.0, max_score=1.0)
+    for _ in range(epochs):
+        quiz = quiz_generator.generate_quiz(num_questions=min(questions_count, 40))
+        score = quiz_generator.compute_score(quiz=quiz_solver.give_answers(quiz=quiz))
+        quiz_solver.process_score_feedback(score=score, max_score=1.0)
+    return quiz_solver, quiz_generator
+
+
+def check_bars(questions_counts: list[int], epochs: int):
+    """
+    Compare the answer bars built from the state columns with the bars built by walking
+    the questions for banks which fit into the answer bars.
+    """
+    for strategy in ("Alpha", "Beta"):
+        for questions_count in questions_counts:
+            quiz_solver, _ = create_quiz_solver(strategy, questions_count, epochs)
+            snapshot = quiz_solver._strategy_in_use.plot_snapshot()
+            heights, colors = legacy_bars(quiz_solver._strategy_in_use)
+            if list(snapshot["heights"]) != heights or [PALETTE[index] for index in snapshot["colors"]] != colors:
+                raise ValueError(f"Answer bars of {strategy} differ from legacy bars for {questions_count} questions.")
+
+
+def measure_refresh(*, strategy: str, questions_count: int, renders: int) -> tuple[float, float, int]:
+    """
+    Measure time of a plot refresh in process, building the bars by walking the questions
+    and creating new bars, and with the persistent artists of StrategyX.plot.
+    Run with MPLBACKEND=Agg to measure drawing without a window.
+    Returns:
+        tuple: Milliseconds per legacy and per incremental refresh and the number of full redraws.
+    """
+    import matplotlib.pyplot as plt
+    quiz_solver, quiz_generator = create_quiz_solver(strategy, questions_count, 5)
+    strategy = quiz_solver._strategy_in_use
+    figure, axes = plt.subplots(PLOT_ROWS, 1, figsize=(13, 5.5))
+    legacy_time = incremental_time = 0.0
+    strategy.plot()
+    for _ in range(renders):
+        quiz = quiz_generator.generate_quiz(num_questions=min(questions_count, 40))
+        score = quiz_generator.compute_score(quiz=quiz_solver.give_answers(quiz=quiz))
+        quiz_solver.process_score_feedback(score=score, max_score=1.0)
+        start = time.perf_counter()
+        heights, colors = legacy_bars(strategy)
+        legacy_draw(axes, heights, colors)
+        figure.canvas.draw()
+        legacy_time += time.perf_counter() - start
+        start = time.perf_counter()
+        strategy.plot()
+        incremental_time += time.perf_counter() - start
+    plt.close(figure)
+    return legacy_time / renders * 1e3, incremental_time / renders * 1e3, strategy.plot_canvas.full_redraws
+
+
+def measure_render_plots(*, strategy: str, out_of_process: bool, renders: int, questions_count: int) -> tuple[float, int]:
+    """
+    Measure time the solver spends in QuizSolver.render_plots per epoch.
+    Run with MPLBACKEND=Agg to measure drawing without a window.
+    Returns:
+        tuple: Milliseconds per render on the solver side and the number of dropped frames.
+    """
+    quiz_generator = QuizGenerator(questions_count=questions_count)
+    quiz_solver = QuizSolver(setup=QuizSolverSetup(redraw_console_interval=-1, render_plots_interval=-1,
+                                                   preferred_strategy=strategy, targeted_score=1.0,
+                                                   render_plots_out_of_process=out_of_process),
+                             strategy_in_use=strategy)
+    elapsed = 0.0
+    for epoch in range(renders + 10):
+        quiz = quiz_generator.generate_quiz(num_questions=questions_count // 5)
+        score = quiz_generator.compute_score(quiz=quiz_solver.give_answers(quiz=quiz))
+        quiz_solver.process_score_feedback(score=score, max_score=1.0)
+        # Skip the first renders which start the renderer and create the figure
+        start = time.perf_counter()
+        quiz_solver.render_plots()
+        if epoch >= 10:
+            elapsed += time.perf_counter() - start
+    dropped_frames = quiz_solver.plot_renderer.dropped_frames if out_of_process else 0
+    quiz_solver.close()
+    return elapsed / renders * 1e3, dropped_frames
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time of plot rendering on the solver side")
+    parser.add_argument("--renders", type=int, default=50, help="Number of measured renders")
+    parser.add_argument("--questions", type=int, default=1000, help="Number of questions in the bank")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 10000, 100000],
+                        help="Numbers of questions in the bank for the refresh time")
+    args = parser.parse_args()
+    random.seed(0)
+    check_bars([1, 37, 200], 30)
+    print(f"{'strategy':>9} {'bank':>7} {'legacy [ms/refresh]':>20} {'incremental [ms/refresh]':>25} {'full redraws':>13}")
+    for strategy in ("Alpha", "Beta"):
+        for questions_count in args.sizes:
+            legacy_time, incremental_time, full_redraws = measure_refresh(strategy=strategy,
+                                                                          questions_count=questions_count,
+                                                                          renders=args.renders)
+            print(f"{strategy:>9} {questions_count:>7} {legacy_time:>20.2f} {incremental_time:>25.2f} "
+                  f"{full_redraws:>13}")
+    print()
+    print(f"{'strategy':>9} {'renderer':>15} {'solver side [ms/render]':>24} {'dropped frames':>15}")
+    for strategy in ("Alpha", "Beta"):
+        for out_of_process in (False, True):
+            elapsed, dropped_frames = measure_render_plots(strategy=strategy, out_of_process=out_of_process,
+                                                           renders=args.renders, questions_count=args.questions)
+            renderer = "out of process" if out_of_process else "in process"
+            print(f"{strategy:>9} {renderer:>15} {elapsed:>24.3f} {dropped_frames:>15}")
@@ -0,0 +1,68 @@
+import gc
+import time
+import argparse
+import tracemalloc
+from package.quizsolver.common import create_hash_function, hash_string, hash_strings, compute_uids
+
+
+def build_index(*, questions: list[tuple[str, list[str]]], algorithm: str, digest_size: int | None,
+                hex_keys: bool) -> tuple[dict, float]:
+    """
+    Build a question index keyed by question uids.
+    Returns:
+        tuple: The index and the build time in microseconds per question.
+    """
+    hash_function = create_hash_function(algorithm, digest_size)
+    index = {}
+    start = time.perf_counter()
+    for i, (question_text, answer_texts) in enumerate(questions):
+        uid_bytes, _ = compute_uids(hash_string(question_text, hash_function), hash_strings(answer_texts, hash_function))
+        index[uid_bytes.hex() if hex_keys else uid_bytes] = i
+    return index, (time.perf_counter() - start) / len(questions) * 1e6
+
+
+def measure(*, questions: list[tuple[str, list[str]]], algorithm: str, digest_size: int | None,
+            hex_keys: bool) -> tuple[float, float, float]:
+    """
+    Measure memory of the index keys and throughput of building and querying the index.
+    Returns:
+        tuple: Index memory in bytes per question, build time and lookup time in microseconds per question.
+    """
+    gc.collect()
+    tracemalloc.start()
+    index, _ = build_index(questions=questions, algorithm=algorithm, digest_size=digest_size, hex_keys=hex_keys)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del index
+    gc.collect()
+    # Measure throughput without tracemalloc overhead
+    index, build_time = build_index(questions=questions, algorithm=algorithm, digest_size=digest_size,
+                                    hex_keys=hex_keys)
+    keys = list(index.keys())
+    start = time.perf_counter()
+    for key in keys:
+        index[key]
+    lookup_time = (time.perf_counter() - start) / len(keys) * 1e6
+    return memory / len(questions), build_time, lookup_time
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of question index digests and key types")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000], help="Numbers of questions")
+    parser.add_argument("--answers", type=int, default=4, help="Number of answers per question")
+    args = parser.parse_args()
+    configurations = [
+        ("sha3_256", None, True),
+        ("sha3_256", None, False),
+        ("blake2b", 16, True),
+        ("blake2b", 16, False),
+    ]
+    print(f"{'questions':>10} {'digest':>12} {'keys':>6} {'memory [B/q]':>13} {'build [us/q]':>13} {'lookup [us/q]':>14}")
+    for size in args.sizes:
+        questions = [(f"question {i}", [f"answer {i} {j}" for j in range(args.answers)]) for i in range(size)]
+        for algorithm, digest_size, hex_keys in configurations:
+            memory, build_time, lookup_time = measure(questions=questions, algorithm=algorithm,
+                                                      digest_size=digest_size, hex_keys=hex_keys)
+            digest = f"{algorithm}-{digest_size}" if digest_size is not None else algorithm
+            print(f"{size:>10} {digest:>12} {'hex' if hex_keys else 'bytes':>6} "
+                  f"{memory:>13.1f} {build_time:>13.2f} {lookup_time:>14.3f}")
@@ -0,0 +1,65 @@
+import time
+import random
+import argparse
+from package.quizsolver import QuizSolverSetup, QuizSolver
+
+
+def create_quiz_question(i: int, answers_per_question: int) -> dict:
+    """Create a quiz question with unique question and answer texts."""
+    return {
+        "question": f"question {i}",
+        "answers": [{"answer": f"answer {i} {j}"} for j in range(answers_per_question)]
+    }
+
+
+def measure_epoch_bookkeeping(*, questions_count: int, quiz_size: int, epochs: int,
+                              solved_fraction: float, answers_per_question: int = 4) -> float:
+    """
+    Measure time of QuizSolver.process_score_feedback per epoch for a bank of the given size.
+    Most questions of the bank are solved and every quiz brings one new question,
+    which is the worst case for bookkeeping scanning the whole bank.
+    The moving average window is fixed, so it does not grow with the bank.
+    Returns:
+        float: Time in microseconds per epoch.
+    """
+    quiz_solver = QuizSolver(setup=QuizSolverSetup(redraw_console_interval=-1, render_plots_interval=-1,
+                                                   preferred_strategy="Alpha", targeted_score=1.0,
+                                                   max_epochs=10 ** 9, moving_average_window_size_override=7),
+                             strategy_in_use="Alpha")
+    # Fill the question bank
+    chunk_size = 100000
+    for first in range(0, questions_count, chunk_size):
+        quiz_solver.give_answers(quiz={"questions": [create_quiz_question(i, answers_per_question)
+                                                     for i in range(first, min(first + chunk_size, questions_count))]})
+        quiz_solver._latest_quiz.clear()
+    # Solve most questions of the bank, the unsolved ones are at the end
+    for i, question in enumerate(quiz_solver.questions.values()):
+        if i >= questions_count * solved_fraction:
+            break
+        quiz_solver.mark_question_solved(question=question)
+    elapsed = 0.0
+    for epoch in range(epochs):
+        quiz = {"questions": [create_quiz_question(random.randrange(questions_count), answers_per_question)
+                              for _ in range(quiz_size - 1)]}
+        quiz["questions"].append(create_quiz_question(questions_count + epoch, answers_per_question))
+        quiz_solver.give_answers(quiz=quiz)
+        start = time.perf_counter()
+        quiz_solver.process_score_feedback(score=0.5, max_score=1.0)
+        elapsed += time.perf_counter() - start
+    return elapsed / epochs * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scaling of per-epoch bookkeeping with the question bank size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000],
+                        help="Numbers of questions in the bank")
+    parser.add_argument("--quiz-size", type=int, default=100, help="Number of questions per quiz")
+    parser.add_argument("--epochs", type=int, default=50, help="Number of measured epochs")
+    parser.add_argument("--solved-fraction", type=float, default=0.99, help="Fraction of solved questions")
+    args = parser.parse_args()
+    random.seed(0)
+    print(f"{'bank':>9} {'quiz':>6} {'feedback [us/epoch]':>20}")
+    for questions_count in args.sizes:
+        elapsed = measure_epoch_bookkeeping(questions_count=questions_count, quiz_size=args.quiz_size,
+                                            epochs=args.epochs, solved_fraction=args.solved_fraction)
+        print(f"{questions_count:>9} {args.quiz_size:>6} {elapsed:>20.1f}")
@@ -0,0 +1,112 @@
+import time
+import random
+import argparse
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizGenerator
+
+
+def reference_score(quiz_generator: QuizGenerator, quiz: dict) -> float:
+    """Score a quiz by comparing the correct fields answer by answer, as compute_score did before."""
+    correctly_answered = 0
+    for q in quiz["questions"]:
+        original_question = quiz_generator.get_question(int(q["question"][4:-5]))
+        if all(given_answer["correct"] == original_answer["correct"]
+               for given_answer, original_answer in zip(q["answers"], original_question["answers"])):
+            correctly_answered += 1
+    return correctly_answered / len(quiz["questions"])
+
+
+def create_response(quiz_generator: QuizGenerator, quiz: dict, probability_correct: float) -> dict:
+    """Answer a quiz, every question is answered correctly with the given probability."""
+    questions = []
+    for quiz_question in quiz["questions"]:
+        question = quiz_generator.get_question(int(quiz_question["question"][4:-5]))
+        answers = [{"answer": answer["answer"], "correct": answer["correct"]} for answer in question["answers"]]
+        if random.random() >= probability_correct:
+            answer = random.choice(answers)
+            answer["correct"] = not answer["correct"]
+        questions.append({"question": question["question"], "answers": answers})
+    response = {"questions": questions}
+    if "id" in quiz:
+        response["id"] = quiz["id"]
+    return response
+
+
+def check_scores(*, compact: bool):
+    """
+    Compare compute_score and compute_scores with the reference for quizzes with and without
+    an id, quizzes scored twice and answers of a quiz solver.
+    """
+    quiz_generator = QuizGenerator(questions_count=500, min_answers_per_question=1, max_answers_per_question=6,
+                                   probability_of_choose_one_type=0.4, probability_of_choose_one_or_more_type=0.3,
+                                   probability_of_choose_zero_or_more_type=0.3, compact=compact)
+    responses = []
+    for _ in range(100):
+        quiz = quiz_generator.generate_quiz(num_questions=random.randint(1, 50))
+        if random.random() < 0.3:
+            del quiz["id"]
+        responses.append(create_response(quiz_generator, quiz, random.random()))
+    expected = [reference_score(quiz_generator, response) for response in responses]
+    if quiz_generator.compute_scores(quizzes=responses[:50]) != expected[:50]:
+        raise ValueError(f"compute_scores differs from the reference (compact: {compact}).")
+    if [quiz_generator.compute_score(quiz=response) for response in responses[50:]] != expected[50:]:
+        raise ValueError(f"compute_score differs from the reference (compact: {compact}).")
+    # Scoring again finds the questions by their texts
+    if quiz_generator.compute_scores(quizzes=responses) != expected:
+        raise ValueError(f"compute_scores of scored quizzes differs from the reference (compact: {compact}).")
+    quiz_solver = QuizSolver(setup=QuizSolverSetup(headless=True, preferred_strategy="Alpha", targeted_score=1.0,
+                                                   max_epochs=10 ** 9),
+                             strategy_in_use="Alpha")
+    for _ in range(50):
+        response = quiz_solver.give_answers(quiz=quiz_generator.generate_quiz(num_questions=100))
+        if "id" not in response:
+            raise ValueError("Response of the quiz solver has no quiz id.")
+        score = quiz_generator.compute_score(quiz=response)
+        if score != reference_score(quiz_generator, response):
+            raise ValueError(f"Score of the quiz solver differs from the reference (compact: {compact}).")
+        quiz_solver.process_score_feedback(score=score, max_score=1.0)
+
+
+def measure_scores(*, questions_count: int, quiz_size: int, quizzes_count: int, compact: bool) -> dict:
+    """
+    Measure scoring answered quizzes one by one with the reference and compute_score, and all at once
+    with compute_scores.
+    Returns:
+        dict: Times per quiz in milliseconds.
+    """
+    quiz_generator = QuizGenerator(questions_count=questions_count, compact=compact)
+
+    def create_responses() -> list[dict]:
+        return [create_response(quiz_generator, quiz_generator.generate_quiz(num_questions=quiz_size), 0.5)
+                for _ in range(quizzes_count)]
+    responses = create_responses()
+    start = time.perf_counter()
+    for response in responses:
+        reference_score(quiz_generator, response)
+    reference_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for response in responses:
+        quiz_generator.compute_score(quiz=response)
+    single_time = time.perf_counter() - start
+    responses = create_responses()
+    start = time.perf_counter()
+    quiz_generator.compute_scores(quizzes=responses)
+    batch_time = time.perf_counter() - start
+    return {"reference": reference_time / quizzes_count * 1e3, "single": single_time / quizzes_count * 1e3,
+            "batch": batch_time / quizzes_count * 1e3}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scoring of answered quizzes by the quiz generator")
+    parser.add_argument("--questions", type=int, default=100000, help="Number of questions in the bank")
+    parser.add_argument("--quizzes", type=int, default=200, help="Number of scored quizzes")
+    args = parser.parse_args()
+    random.seed(0)
+    for compact in (False, True):
+        check_scores(compact=compact)
+    print(f"{'mode':>8} {'quiz':>6} {'reference [ms]':>15} {'compute_score [ms]':>19} {'compute_scores [ms]':>20}")
+    for compact in (False, True):
+        for quiz_size in (40, 1000):
+            result = measure_scores(questions_count=args.questions, quiz_size=quiz_size, quizzes_count=args.quizzes,
+                                    compact=compact)
+            print(f"{'compact' if compact else 'default':>8} {quiz_size:>6} {result['reference']:>15.3f} "
+                  f"{result['single']:>19.3f} {result['batch']:>20.3f}")
@@ -0,0 +1,129 @@
+import os
+import time
+import random
+import argparse
+import tempfile
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizSource
+
+
+def create_setup(strategy: str, journal_path: str | None = None) -> QuizSolverSetup:
+    """Create a headless setup with the given preferred strategy."""
+    return QuizSolverSetup(headless=True, preferred_strategy=strategy, targeted_score=1.0, max_epochs=10 ** 9,
+                           journal_path=journal_path)
+
+
+class Run:
+    """
+    A quiz solver solving the quizzes of a seeded quiz source, one epoch at a time.
+    """
+    def __init__(self, *, strategy: str, seed: int, questions_count: int, compact: bool = False,
+                 journal_path: str | None = None):
+        self.source = QuizSource(seed=seed, questions_count=questions_count, min_answers_per_question=2,
+                                 max_answers_per_question=5, probability_of_choose_one_type=1.0, compact=compact)
+        self.quiz_solver = QuizSolver(setup=create_setup(strategy, journal_path), strategy_in_use=strategy,
+                                      random_generator=self.source.solver_random)
+        self.quizzes = iter(self.source)
+        self.transcript = []
+
+    def epoch(self) -> dict:
+        """Answer the next quiz and process its score, the result is recorded in the transcript."""
+        response = self.quiz_solver.give_answers(quiz=next(self.quizzes))
+        result = self.quiz_solver.process_score_feedback(score=self.source.score(response), max_score=1.0)
+        self.transcript.append((response["questions"], result["score"], result["strategy_in_use"]))
+        return result
+
+    def state(self) -> tuple:
+        """Get the state which must be equal in reproduced runs."""
+        return (self.quiz_solver.epoch, self.quiz_solver.state.checkpoint_state(),
+                {name: strategy.checkpoint_state() for name, strategy in self.quiz_solver.strategies.items()},
+                self.quiz_solver.random.getstate())
+
+
+def check_reproducible(*, strategy: str, questions_count: int, epochs: int, compact: bool):
+    """
+    Two runs with the same seed must give the same answers and end in the same state, even if
+    they run interleaved and the random module is used in between. A run with another seed must differ.
+    """
+    global_state = random.getstate()
+    first = Run(strategy=strategy, seed=7, questions_count=questions_count, compact=compact)
+    second = Run(strategy=strategy, seed=7, questions_count=questions_count, compact=compact)
+    other = Run(strategy=strategy, seed=8, questions_count=questions_count, compact=compact)
+    for _ in range(epochs):
+        first.epoch()
+    if random.getstate() != global_state:
+        raise ValueError(f"Seeded {strategy} run used the random module.")
+    for _ in range(epochs):
+        random.random()
+        second.epoch()
+        other.epoch()
+    if first.transcript != second.transcript or first.state() != second.state():
+        raise ValueError(f"Seeded {strategy} runs differ (compact: {compact}).")
+    if first.transcript == other.transcript:
+        raise ValueError(f"{strategy} runs with different seeds are equal (compact: {compact}).")
+
+
+def check_checkpoint_and_journal(*, strategy: str, questions_count: int, directory: str):
+    """
+    A checkpoint restores the injected random generator of the quiz solver, and recovery from the journal
+    replays the run, including a strategy with its own random generator.
+    """
+    checkpoint_path = os.path.join(directory, "source.checkpoint")
+    journal_path = os.path.join(directory, "source.journal")
+    for path in (checkpoint_path, journal_path):
+        if os.path.exists(path):
+            os.remove(path)
+    run = Run(strategy=strategy, seed=3, questions_count=questions_count, journal_path=journal_path)
+    run.quiz_solver.strategies[strategy].random = random.Random(11)
+    for _ in range(30):
+        run.epoch()
+    run.quiz_solver.save_checkpoint(checkpoint_path)
+    for _ in range(30):
+        run.epoch()
+    expected_state = run.state()
+    expected_strategy_random = run.quiz_solver.strategies[strategy].random.getstate()
+    run.quiz_solver.close()
+    recovered = QuizSolver(setup=create_setup(strategy, journal_path), strategy_in_use=strategy,
+                           random_generator=random.Random())
+    recovered.strategies[strategy].random = random.Random()
+    recovered.recover(checkpoint_path)
+    recovered_state = (recovered.epoch, recovered.state.checkpoint_state(),
+                       {name: strategy.checkpoint_state() for name, strategy in recovered.strategies.items()},
+                       recovered.random.getstate())
+    if recovered_state != expected_state or \
+            recovered.strategies[strategy].random.getstate() != expected_strategy_random:
+        raise ValueError(f"Recovered {strategy} solver with injected random generators differs.")
+    recovered.close()
+
+
+def measure_runs(*, strategy: str, questions_count: int, seeds: int, max_epochs: int) -> tuple[list, float]:
+    """
+    Solve the bank of seeded runs.
+    Returns:
+        tuple: Epochs needed by each seed and the time of all runs in seconds.
+    """
+    start = time.perf_counter()
+    epochs = []
+    for seed in range(seeds):
+        run = Run(strategy=strategy, seed=seed, questions_count=questions_count)
+        while run.quiz_solver.epoch < max_epochs and not run.epoch()["all_questions_solved"]:
+            pass
+        epochs.append(run.quiz_solver.epoch)
+    return epochs, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reproducible runs of seeded quiz sources and quiz solvers")
+    parser.add_argument("--questions", type=int, default=50, help="Number of questions in the bank")
+    parser.add_argument("--seeds", type=int, default=5, help="Number of measured seeds")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        for strategy in ("Alpha", "NegativeAlpha", "Beta", "NegativeBeta"):
+            for compact in (False, True):
+                check_reproducible(strategy=strategy, questions_count=args.questions, epochs=150, compact=compact)
+        for strategy in ("Alpha", "Beta"):
+            check_checkpoint_and_journal(strategy=strategy, questions_count=args.questions, directory=directory)
+    print(f"{'strategy':>13} {'epochs per seed':>40} {'time [s]':>9}")
+    for strategy in ("Alpha", "NegativeAlpha", "Beta", "NegativeBeta"):
+        epochs, elapsed = measure_runs(strategy=strategy, questions_count=args.questions, seeds=args.seeds,
+                                       max_epochs=20000)
+        print(f"{strategy:>13} {str(epochs):>40} {elapsed:>9.2f}")
@@ -0,0 +1,91 @@
+import io
+import sys
+import time
+import random
+import argparse
+import datetime
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizGenerator
+
+
+def legacy_print_statistics(quiz_solver: QuizSolver, console):
+    """
+    Format the statistics and redraw the whole screen, the way print_statistics used to.
+    Without a console (no terminal) the statistics are printed, like the fallback of print_statistics.
+    """
+    result = "\n".join(quiz_solver.status_lines()) + "\n"
+    if console is None:
+        print(result)
+        return
+    try:
+        console.clear()
+        console.print(result)
+        console.update()
+    except Exception:
+        print(result)
+
+
+def measure_epochs(*, mode: str, terminal: bool, epochs: int, questions_count: int) -> tuple[float, int]:
+    """
+    Measure time of QuizSolver.process_score_feedback per epoch including console statistics
+    redrawn after every epoch (redraw_console_interval=0).
+    Modes: "legacy" checks a datetime interval and redraws the whole screen with consoledraw,
+    "renderer" rewrites the changed lines between epochs and "background" samples the solver
+    on a background thread. Without a terminal, standard output is replaced by a buffer.
+    Returns:
+        tuple: Time in microseconds per epoch and the number of rewritten lines.
+    """
+    stdout = sys.stdout
+    if not terminal:
+        sys.stdout = io.StringIO()
+    try:
+        quiz_generator = QuizGenerator(questions_count=questions_count)
+        setup = QuizSolverSetup(redraw_console_interval=-1 if mode == "legacy" else 0, render_plots_interval=-1,
+                                preferred_strategy="Alpha", targeted_score=1.0, max_epochs=10 ** 9,
+                                render_status_in_background=mode == "background")
+        quiz_solver = QuizSolver(setup=setup, strategy_in_use="Alpha")
+        console = None
+        if mode == "legacy":
+            from consoledraw import Console
+            try:
+                console = Console(hideCursor=False)
+            except OSError:
+                # Console reads the terminal size, which fails when standard output is not a terminal
+                console = None
+        console_redrawn_at = datetime.datetime.min
+        elapsed = 0.0
+        for _ in range(epochs):
+            quiz = quiz_generator.generate_quiz(num_questions=questions_count // 5)
+            score = quiz_generator.compute_score(quiz=quiz_solver.give_answers(quiz=quiz))
+            start = time.perf_counter()
+            quiz_solver.process_score_feedback(score=score, max_score=1.0)
+            if mode == "legacy":
+                now = datetime.datetime.now()
+                if now - console_redrawn_at > datetime.timedelta(seconds=0):
+                    legacy_print_statistics(quiz_solver, console)
+                    console_redrawn_at = now
+            elapsed += time.perf_counter() - start
+        rewritten_lines = quiz_solver.status_renderer.rewritten_lines
+        quiz_solver.close()
+    finally:
+        sys.stdout = stdout
+    return elapsed / epochs * 1e6, rewritten_lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cost of console statistics on the epoch path")
+    parser.add_argument("--epochs", type=int, default=500, help="Number of measured epochs")
+    parser.add_argument("--questions", type=int, default=200, help="Number of questions in the bank")
+    args = parser.parse_args()
+    results = []
+    for terminal in (True, False):
+        if terminal and not sys.stdout.isatty():
+            continue
+        for mode in ("legacy", "renderer", "background"):
+            random.seed(0)
+            elapsed, rewritten_lines = measure_epochs(mode=mode, terminal=terminal, epochs=args.epochs,
+                                                      questions_count=args.questions)
+            results.append((mode, terminal, elapsed, rewritten_lines))
+    print()
+    print(f"{'mode':>11} {'terminal':>9} {'feedback [us/epoch]':>20} {'rewritten lines':>16}")
+    for mode, terminal, elapsed, rewritten_lines in results:
+        print(f"{mode:>11} {str(terminal):>9} {elapsed:>20.1f} {rewritten_lines:>16}")
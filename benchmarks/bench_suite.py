@@ -0,0 +1,252 @@
+import sys
+import json
+import math
+import time
+import argparse
+import datetime
+import platform
+import itertools
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+try:
+    import resource
+except ImportError:
+    # Peak memory is not measured on systems without the resource module
+    resource = None
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizSource
+
+RESULTS_VERSION = 2
+STRATEGIES = ("Alpha", "NegativeAlpha", "Beta", "NegativeBeta")
+PRESETS = {
+    "quick": {"sizes": [100, 1000], "answers": [4], "fractions": [0.2]},
+    "full": {"sizes": [100, 1000, 10000, 100000, 1000000], "answers": [2, 4, 8], "fractions": [0.05, 0.2, 0.5]},
+}
+# Latencies are counted in buckets of 1/16 of an octave, percentiles are accurate to about 4 %
+LATENCY_BUCKETS_PER_OCTAVE = 16
+# Metrics compared with the baseline, a higher value is worse. Fewer solved runs are always a regression.
+COMPARED_METRICS = ("epochs_mean", "epoch_ms", "latency_p50_us", "latency_p99_us", "peak_memory_mb")
+
+
+def peak_memory_kb() -> int | None:
+    """Get the peak resident memory of the process in kilobytes, None if it cannot be measured."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def latency_percentile(histogram: dict[int, int], percentile: float) -> float:
+    """
+    Get a percentile of latencies counted by run_solve.
+    Returns:
+        float: Upper bound of the bucket of the percentile in microseconds.
+    """
+    target = math.ceil(sum(histogram.values()) * percentile / 100)
+    seen = 0
+    for bucket in sorted(histogram):
+        seen += histogram[bucket]
+        if seen >= target:
+            return 2 ** ((bucket + 1) / LATENCY_BUCKETS_PER_OCTAVE) / 1e3
+    return 0.0
+
+
+def run_solve(config: dict, seed: int, max_epochs: int, time_limit: float) -> dict:
+    """
+    Solve the bank of a seeded quiz source with the strategy of the configuration, answering
+    questions one by one with QuizSolver.give_answer. The bank is solved when every question
+    was presented and solved. Runs in its own process, so the peak memory belongs to this run.
+    Args:
+        config (dict): Bank size, answers per question, quiz fraction and strategy.
+        seed (int): Seed of the quiz source and the quiz solver.
+        max_epochs (int): The run stops unsolved after this number of epochs.
+        time_limit (float): The run stops unsolved after this number of seconds.
+    Returns:
+        dict: Epochs, whether the bank was solved, time of the quiz solver, histogram of give_answer
+            latencies and the growth of the peak memory in kilobytes.
+    """
+    memory_before = peak_memory_kb()
+    source = QuizSource(seed=seed, questions_count=config["size"], min_answers_per_question=config["answers"],
+                        max_answers_per_question=config["answers"], compact=True,
+                        questions_per_quiz=max(1, int(config["size"] * config["fraction"])))
+    quiz_solver = QuizSolver(setup=QuizSolverSetup(headless=True, preferred_strategy=config["strategy"],
+                                                   targeted_score=1.0, max_epochs=10 ** 9),
+                             strategy_in_use=config["strategy"], random_generator=source.solver_random)
+    histogram: dict[int, int] = {}
+    solver_time = 0
+    solved = False
+    deadline = time.monotonic() + time_limit
+    for quiz in source:
+        questions = []
+        for quiz_question in quiz["questions"]:
+            start = time.perf_counter_ns()
+            questions.append(quiz_solver.give_answer(quiz_question=quiz_question))
+            elapsed = time.perf_counter_ns() - start
+            solver_time += elapsed
+            bucket = int(math.log2(max(elapsed, 1)) * LATENCY_BUCKETS_PER_OCTAVE)
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+        score = source.score({"id": quiz["id"], "questions": questions})
+        start = time.perf_counter_ns()
+        result = quiz_solver.process_score_feedback(score=score, max_score=1.0)
+        solver_time += time.perf_counter_ns() - start
+        if result["all_questions_solved"] and len(quiz_solver.questions) == config["size"]:
+            solved = True
+            break
+        if quiz_solver.epoch >= max_epochs or time.monotonic() > deadline:
+            break
+    memory_after = peak_memory_kb()
+    return {"epochs": quiz_solver.epoch, "solved": solved, "solver_time": solver_time / 1e9,
+            "histogram": histogram,
+            "peak_memory_kb": memory_after - memory_before if memory_before is not None else None}
+
+
+def summarize(config: dict, runs: list[dict]) -> dict:
+    """Aggregate the runs of a configuration into the result stored in the JSON file."""
+    epochs = np.array([run["epochs"] for run in runs], dtype=np.float64)
+    # Unsolved runs stopped at the limits, their epochs would make a strategy that stops solving look faster
+    solved_epochs = np.array([run["epochs"] for run in runs if run["solved"]], dtype=np.float64)
+    histogram: dict[int, int] = {}
+    for run in runs:
+        for bucket, count in run["histogram"].items():
+            histogram[bucket] = histogram.get(bucket, 0) + count
+    peak_memory = [run["peak_memory_kb"] for run in runs if run["peak_memory_kb"] is not None]
+    return {
+        "config": config,
+        "runs": len(runs),
+        "solved_runs": sum(run["solved"] for run in runs),
+        "epochs": [run["epochs"] for run in runs],
+        "epochs_mean": float(solved_epochs.mean()) if len(solved_epochs) else None,
+        "epochs_median": float(np.median(solved_epochs)) if len(solved_epochs) else None,
+        "epoch_ms": sum(run["solver_time"] for run in runs) / max(1, epochs.sum()) * 1e3,
+        "latency_p50_us": latency_percentile(histogram, 50),
+        "latency_p90_us": latency_percentile(histogram, 90),
+        "latency_p99_us": latency_percentile(histogram, 99),
+        "peak_memory_mb": max(peak_memory) / 1024 if peak_memory else None,
+    }
+
+
+def run_suite(*, sizes: list[int], answers: list[int], fractions: list[float], strategies: list[str],
+              seeds: int, max_epochs: int, time_limit: float) -> dict:
+    """
+    Run every combination of the swept parameters with seeds 0 to seeds - 1.
+    Runs are executed one after another, each in a new process, so they do not share memory
+    and do not compete for the CPU.
+    Returns:
+        dict: The results in the format of the JSON file.
+    """
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context, max_tasks_per_child=1) as executor:
+        for size, answers_per_question, fraction, strategy in itertools.product(sizes, answers, fractions,
+                                                                                 strategies):
+            config = {"size": size, "answers": answers_per_question, "fraction": fraction, "strategy": strategy}
+            runs = [executor.submit(run_solve, config, seed, max_epochs, time_limit).result()
+                    for seed in range(seeds)]
+            result = summarize(config, runs)
+            print_result(result)
+            results.append(result)
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "parameters": {"seeds": seeds, "max_epochs": max_epochs, "time_limit": time_limit},
+        "results": results,
+    }
+
+
+def config_key(config: dict) -> tuple:
+    """Key of a configuration for matching results of two suites."""
+    return config["size"], config["answers"], config["fraction"], config["strategy"]
+
+
+def compare(baseline: dict, current: dict, *, threshold: float) -> list[str]:
+    """
+    Compare the results of two suites run with the same parameters.
+    A metric is a regression if it is more than threshold (relative) above the baseline,
+    fewer solved runs than in the baseline are a regression too.
+    Returns:
+        list of str: Descriptions of the regressions.
+    """
+    if baseline.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Baseline has version {baseline.get('version')}, expected {RESULTS_VERSION}.")
+    baseline_results = {config_key(result["config"]): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        baseline_result = baseline_results.get(config_key(result["config"]))
+        if baseline_result is None:
+            continue
+        solved_runs, baseline_solved_runs = result["solved_runs"], baseline_result["solved_runs"]
+        marker = "REGRESSION" if solved_runs < baseline_solved_runs else ""
+        print(f"{str(config_key(result['config'])):>40} {'solved_runs':>16} {baseline_solved_runs:>12} "
+              f"{solved_runs:>12} {'':>9} {marker}")
+        if solved_runs < baseline_solved_runs:
+            regressions.append(f"{config_key(result['config'])} solved_runs: {baseline_solved_runs} -> {solved_runs}")
+        for metric in COMPARED_METRICS:
+            value, baseline_value = result[metric], baseline_result[metric]
+            if value is None or baseline_value is None or baseline_value <= 0:
+                continue
+            change = value / baseline_value - 1
+            marker = "REGRESSION" if change > threshold else ""
+            print(f"{str(config_key(result['config'])):>40} {metric:>16} {baseline_value:>12.3f} "
+                  f"{value:>12.3f} {change * 100:>+8.1f}% {marker}")
+            if change > threshold:
+                regressions.append(f"{config_key(result['config'])} {metric}: {baseline_value:.3f} -> {value:.3f}")
+    return regressions
+
+
+def print_result(result: dict):
+    """Print a row of the results table."""
+    config = result["config"]
+    memory = f"{result['peak_memory_mb']:.1f}" if result["peak_memory_mb"] is not None else "-"
+    epochs_mean = f"{result['epochs_mean']:.1f}" if result["epochs_mean"] is not None else "-"
+    epochs_median = f"{result['epochs_median']:.1f}" if result["epochs_median"] is not None else "-"
+    print(f"{config['size']:>8} {config['answers']:>7} {config['fraction']:>8} {config['strategy']:>13} "
+          f"{result['solved_runs']:>4}/{result['runs']:<4} {epochs_mean:>10} "
+          f"{epochs_median:>8} {result['epoch_ms']:>9.3f} {result['latency_p50_us']:>8.2f} "
+          f"{result['latency_p99_us']:>8.2f} {memory:>8}", flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="End-to-end benchmark suite: epochs to solve, time and memory")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick",
+                        help="Swept bank sizes, answers per question and quiz fractions")
+    parser.add_argument("--sizes", type=int, nargs="+", help="Bank sizes, overrides the preset")
+    parser.add_argument("--answers", type=int, nargs="+", help="Answers per question, overrides the preset")
+    parser.add_argument("--fractions", type=float, nargs="+", help="Quiz sizes as fractions of the bank, "
+                                                                    "overrides the preset")
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=list(STRATEGIES))
+    parser.add_argument("--seeds", type=int, default=3, help="Number of seeded runs of each configuration")
+    parser.add_argument("--max-epochs", type=int, default=5000, help="Runs stop unsolved after this many epochs")
+    parser.add_argument("--time-limit", type=float, default=60.0, help="Runs stop unsolved after this many seconds")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--results", help="Compare the results in this JSON file instead of running the suite")
+    parser.add_argument("--compare", help="Compare the results with the baseline in this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Relative increase of a metric over the baseline reported as a regression")
+    args = parser.parse_args()
+    if args.results is not None:
+        with open(args.results) as file:
+            current = json.load(file)
+    else:
+        preset = PRESETS[args.preset]
+        print(f"{'bank':>8} {'answers':>7} {'fraction':>8} {'strategy':>13} {'solved':>9} {'epochs':>10} "
+              f"{'median':>8} {'epoch[ms]':>9} {'p50[us]':>8} {'p99[us]':>8} {'mem[MB]':>8}")
+        current = run_suite(sizes=args.sizes or preset["sizes"], answers=args.answers or preset["answers"],
+                            fractions=args.fractions or preset["fractions"], strategies=args.strategies,
+                            seeds=args.seeds, max_epochs=args.max_epochs, time_limit=args.time_limit)
+        if args.output is not None:
+            with open(args.output, "w") as file:
+                json.dump(current, file, indent=2)
+    if args.compare is not None:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if baseline.get("parameters") != current.get("parameters"):
+            print(f"Warning: parameters differ from the baseline {baseline.get('parameters')}.")
+        regressions = compare(baseline, current, threshold=args.threshold)
+        print(f"{len(regressions)} regressions")
+        for regression in regressions:
+            print(f"  {regression}")
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,63 @@
+import time
+import random
+import argparse
+from package.quizsolver import QuizSolverSetup, QuizSolver, QuizGenerator
+from package.quizsolver.common import IndexedSet
+
+
+def legacy_pick_training_minibatch(training_batch: list, how_many_to_pick: int) -> list:
+    """Pick a minibatch from a list based training batch the way StrategyB used to."""
+    training_minibatch = random.sample(training_batch, k=min(how_many_to_pick, len(training_batch)))
+    questions_to_remove = []
+    for question in training_batch:
+        if question in training_minibatch:
+            questions_to_remove.append(question)
+    for question in questions_to_remove:
+        training_batch.remove(question)
+    return training_minibatch
+
+
+def create_quiz_solver(questions_count: int) -> QuizSolver:
+    """Create a quiz solver with StrategyB in use and a bank of the given number of questions."""
+    quiz_generator = QuizGenerator(questions_count=questions_count)
+    quiz_solver = QuizSolver(setup=QuizSolverSetup(redraw_console_interval=-1, render_plots_interval=-1,
+                                                   preferred_strategy="Beta", targeted_score=1.0),
+                             strategy_in_use="Beta")
+    quiz_solver.give_answers(quiz=quiz_generator.generate_quiz(num_questions=questions_count))
+    quiz_solver._latest_quiz.clear()
+    return quiz_solver
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of StrategyB training batch and minibatch handling")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000], help="Training batch sizes")
+    parser.add_argument("--minibatch-size", type=int, default=100, help="Questions picked per minibatch")
+    parser.add_argument("--picks", type=int, default=20, help="Number of measured minibatch picks")
+    args = parser.parse_args()
+    random.seed(0)
+    print(f"{'batch':>8} {'structure':>10} {'pick [ms]':>10} {'membership [ns/question]':>25}")
+    for size in args.sizes:
+        quiz_solver = create_quiz_solver(size)
+        strategy = quiz_solver.strategies["Beta"]
+        questions = list(quiz_solver.questions.values())
+        # Legacy: training batch and minibatch are lists
+        training_batch = list(questions)
+        start = time.perf_counter()
+        for _ in range(args.picks):
+            training_minibatch = legacy_pick_training_minibatch(training_batch, args.minibatch_size)
+        pick_time = (time.perf_counter() - start) / args.picks * 1e3
+        start = time.perf_counter()
+        sum(question in training_minibatch for question in questions)
+        membership_time = (time.perf_counter() - start) / len(questions) * 1e9
+        print(f"{size:>8} {'list':>10} {pick_time:>10.3f} {membership_time:>25.1f}")
+        # Current: training batch and minibatch are swap-remove sets
+        strategy.training_batch = IndexedSet(questions)
+        start = time.perf_counter()
+        for _ in range(args.picks):
+            strategy.pick_training_minibatch(how_many_to_pick=args.minibatch_size)
+        pick_time = (time.perf_counter() - start) / args.picks * 1e3
+        training_minibatch = strategy.training_minibatch
+        start = time.perf_counter()
+        sum(question in training_minibatch for question in questions)
+        membership_time = (time.perf_counter() - start) / len(questions) * 1e9
+        print(f"{size:>8} {'indexed':>10} {pick_time:>10.3f} {membership_time:>25.1f}")
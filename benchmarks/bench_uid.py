@@ -0,0 +1,44 @@
+import time
+import random
+import argparse
+from package.quizsolver.common import hash_string, hash_strings, compute_uids
+
+
+def legacy_xor_hash_bytes(b1: bytes, b2: bytes) -> bytes:
+    """Byte-wise XOR as used before the batched uid engine."""
+    return bytes(a ^ b for a, b in zip(b1, b2))
+
+
+def legacy_compute_uids(question_text: str, answer_texts: list[str]) -> tuple[bytes, list[bytes]]:
+    """Compute question and answer uids the way RawQuestion used to."""
+    question_hash = hash_string(question_text)
+    answer_hashes = [hash_string(answer_text) for answer_text in answer_texts]
+    uid = question_hash
+    for answer_hash in answer_hashes:
+        uid = legacy_xor_hash_bytes(uid, answer_hash)
+    return uid, [legacy_xor_hash_bytes(uid, answer_hash) for answer_hash in answer_hashes]
+
+
+def batched_compute_uids(question_text: str, answer_texts: list[str]) -> tuple[bytes, list[bytes]]:
+    """Compute question and answer uids with the batched uid engine."""
+    return compute_uids(hash_string(question_text), hash_strings(answer_texts))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of question and answer uid computation")
+    parser.add_argument("--questions", type=int, default=100000, help="Number of questions")
+    args = parser.parse_args()
+    print(f"{'answers':>8} {'legacy [us]':>12} {'batched [us]':>13} {'speedup':>8}")
+    for answers_per_question in (4, 8, 16):
+        questions = [(f"question {i}", [f"answer {i} {j} {random.random()}" for j in range(answers_per_question)])
+                     for i in range(args.questions)]
+        start = time.perf_counter()
+        legacy = [legacy_compute_uids(question_text, answer_texts) for question_text, answer_texts in questions]
+        legacy_time = (time.perf_counter() - start) / args.questions * 1e6
+        start = time.perf_counter()
+        batched = [batched_compute_uids(question_text, answer_texts) for question_text, answer_texts in questions]
+        batched_time = (time.perf_counter() - start) / args.questions * 1e6
+        # Both schemes must produce byte-identical uids
+        if legacy != batched:
+            raise ValueError("Batched uids differ from legacy uids.")
+        print(f"{answers_per_question:>8} {legacy_time:>12.2f} {batched_time:>13.2f} {legacy_time / batched_time:>8.1f}x")
@@ -4,13 +4,7 @@ import argparse
 from package.quizsolver import *
 
 
-def run_quizsolver():
-    # Parse command-line arguments
-    # There is an argument "strategy" to choose the strategy in use
-    parser = argparse.ArgumentParser(description="Quiz Solver")
-    parser.add_argument("--strategy", type=str, default="A4", help="Strategy to use for solving the quiz")
-    args = parser.parse_args()
-
+def run_quizsolver(args):
     quiz_setup = QuizSolverSetup()
     quiz_setup.redraw_console_interval = 0
     quiz_setup.render_plots_interval = 5
@@ -34,10 +28,7 @@ def run_quizsolver():
         quiz_questions_count = max(1, int(quiz_questions_multiplier * quiz_generator.questions_count))   
         quiz = quiz_generator.generate_quiz(num_questions=quiz_questions_count)
 
-        solved_questions = []
-        for raw_question in quiz["questions"]:
-            solved_questions.append(quiz_solver.give_answer(quiz_question=raw_question))
-        solved_quiz = {"questions": solved_questions}
+        solved_quiz = quiz_solver.give_answers(quiz=quiz)
 
         score = quiz_generator.compute_score(quiz=solved_quiz)            
 
@@ -48,9 +39,41 @@ def run_quizsolver():
     return quiz_solved["epoch"]
 
 
+def run_monte_carlo(args):
+    # Independent headless runs of the same quiz in all processes, results are printed as they finish
+    quiz_setup = QuizSolverSetup()
+    quiz_setup.targeted_score = 1.0
+    runner = MonteCarloRunner(setup=quiz_setup, runs=args.runs, strategy_in_use=args.strategy,
+                              first_seed=args.seed, workers=args.workers,
+                              questions_count=200,
+                              min_answers_per_question=4,
+                              max_answers_per_question=4,
+                              probability_of_choose_one_type=1.0,
+                              probability_of_choose_one_or_more_type=0.0,
+                              probability_of_choose_zero_or_more_type=0.0,
+                              questions_per_quiz=max(1, int(0.2 * 200)))
+    print(f"Solving {args.runs} quizzes in {runner.workers} processes...")
+    for i, result in enumerate(runner, start=1):
+        print(f"[{i}/{args.runs}] seed {result['seed']}: {result['epochs']} epochs "
+              f"{'' if result['solved'] else '(unsolved) '}({result['time']:.2f} s)")
+    print(json.dumps(runner.statistics(), indent=4))
+
+
 if __name__ == "__main__":
-    result = []
-    for i in range(1):
-        result.append(run_quizsolver())
-    print(sorted(result))
-    time.sleep(8)
\ No newline at end of file
+    # Parse command-line arguments
+    # There is an argument "strategy" to choose the strategy in use
+    parser = argparse.ArgumentParser(description="Quiz Solver")
+    parser.add_argument("--strategy", type=str, default="A4", help="Strategy to use for solving the quiz")
+    parser.add_argument("--runs", type=int, default=1,
+                        help="Number of runs, more than 1 runs headless in a pool of processes")
+    parser.add_argument("--workers", type=int, default=None, help="Number of processes, all CPUs by default")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first of several runs")
+    args = parser.parse_args()
+    if args.runs > 1:
+        run_monte_carlo(args)
+    else:
+        result = []
+        for i in range(1):
+            result.append(run_quizsolver(args))
+        print(sorted(result))
+        time.sleep(8)
\ No newline at end of file
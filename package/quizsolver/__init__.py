@@ -3,11 +3,15 @@ from __future__ import absolute_import
 from .quizsolversetup import QuizSolverSetup
 from .quizsolver import QuizSolver
 from .quizgenerator import QuizGenerator
+from .quizsource import QuizSource
+from .montecarlo import MonteCarloRunner
 
 __all__ = (
     "QuizSolverSetup",
     "QuizSolver",
     "QuizGenerator",
+    "QuizSource",
+    "MonteCarloRunner",
 )
 
 
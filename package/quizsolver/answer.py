@@ -3,20 +3,23 @@ import math
 import json
 import time
 import argparse
-from .common import hash_string
+from functools import reduce
+from .common import hash_string, xor_hash_bytes
 from .rawanswer import RawAnswer
 
 class Answer:
+    __slots__ = ("raw_answers", "is_correct", "index")
+
     def __init__(self, *, raw_answers: list[RawAnswer]):
         """
         Initialize an Answer with its raw answers.
         Args:
             raw_answers (list[RawAnswer]): List of RawAnswer objects associated with this answer.
         """
-        self.raw_answers = raw_answers
+        self.raw_answers: tuple[RawAnswer, ...] = tuple(raw_answers)
         self.is_correct: bool| None = None
-        # custom data for strategies
-        self.data: dict = {}
+        # dense answer id assigned by the state store (state of strategies is stored there)
+        self.index: int = -1
     
     # def duplicate(self) -> 'Answer':
     #     """
@@ -27,6 +30,15 @@ class Answer:
     #     new_answer.is_correct = self.is_correct
     #     return new_answer
 
+    @property
+    def uid_bytes(self) -> bytes:
+        """
+        Get the unique identifier of the answer: the uid of its raw answer,
+        or the XOR of the uids of its raw answers if the answer combines several.
+        Returns: Unique identifier as bytes.
+        """
+        return reduce(xor_hash_bytes, [raw_answer.uid_bytes for raw_answer in self.raw_answers])
+
     @property
     def answer_text(self) -> str:
         """
@@ -43,23 +55,20 @@ class Answer:
         """
         return {
             "answers": [raw_answer.to_dict() for raw_answer in self.raw_answers],
-            "is_correct": self.is_correct,
-            "data": self.data
+            "index": self.index,
+            "is_correct": self.is_correct
         }
     
-    def to_response_list_of_raw_answers(self, *, strategy_name: str,
-                                        most_probable_key: str = "most_probable") -> list[dict]:
+    def to_response_list_of_raw_answers(self, *, is_most_probable: bool) -> list[dict]:
         """
         Get list of raw answer dictionaries for response.
+        Args:
+            is_most_probable (bool): Whether this answer is the most probable answer of its question.
         Returns: List of dictionaries representing raw answers.
         """
         result = []
         for raw_answer in self.raw_answers:
             result.append(raw_answer.to_dict())
             # Add correct field based on most probable answer for the strategy
-            if strategy_name in self.data:
-                most_probable = self.data[strategy_name].get(most_probable_key, None)
-                result[-1]["correct"] = most_probable
-            else:
-                raise ValueError("Cannot determine correctness of the answer.")
+            result[-1]["correct"] = is_most_probable
         return result
\ No newline at end of file
@@ -0,0 +1,314 @@
+import os
+import sys
+import json
+import struct
+from array import array
+from itertools import islice
+from typing import Iterable
+from .common import RawQuestionType
+from .question import Question
+
+# File layout: magic, length of the header, JSON header, then the columns.
+# The header holds all scalar values of the state and the name, type, offset and length of each column.
+# Columns are raw arrays in native byte order, each starting at a multiple of COLUMN_ALIGNMENT.
+CHECKPOINT_MAGIC = b"QSCKPT01"
+CHECKPOINT_VERSION = 1
+COLUMN_ALIGNMENT = 8
+_HEADER_LENGTH = struct.Struct("<Q")
+
+
+def _split_columns(state, path: str, columns: list) -> object:
+    """
+    Replace arrays and bytes in a nested state by references to columns.
+    Args:
+        state: The nested state (dict, list or value).
+        path (str): Name of the state within the whole state.
+        columns (list): Collected (name, typecode, buffer) of the columns.
+    Returns:
+        The state with references to columns, which can be stored as JSON.
+    """
+    if isinstance(state, dict):
+        return {key: _split_columns(value, f"{path}.{key}" if path else key, columns) for key, value in state.items()}
+    if isinstance(state, (list, tuple)):
+        return [_split_columns(value, f"{path}.{i}", columns) for i, value in enumerate(state)]
+    if isinstance(state, array):
+        columns.append((path, state.typecode, state))
+        return {"$column": path}
+    if isinstance(state, (bytes, bytearray)):
+        columns.append((path, "bytes", state))
+        return {"$column": path}
+    return state
+
+
+def _join_columns(state, columns: dict) -> object:
+    """
+    Replace references to columns in a nested state by the columns.
+    """
+    if isinstance(state, dict):
+        if "$column" in state:
+            return columns[state["$column"]]
+        return {key: _join_columns(value, columns) for key, value in state.items()}
+    if isinstance(state, list):
+        return [_join_columns(value, columns) for value in state]
+    return state
+
+
+def encode_state(state: dict) -> list:
+    """
+    Encode a state into buffers which are written one after another:
+    length of the header, JSON header, then the columns.
+    Args:
+        state (dict): Nested state of dicts, lists, JSON scalars, arrays (array.array) and bytes.
+            Arrays and bytes are stored as columns, everything else in the header.
+    Returns:
+        list: The buffers (bytes, bytearray or array), the columns are not copied.
+    """
+    columns = []
+    header = {
+        "version": CHECKPOINT_VERSION,
+        "byteorder": sys.byteorder,
+        "state": _split_columns(state, "", columns),
+        "columns": []
+    }
+    # Offsets of the columns are relative to the end of the header
+    offset = 0
+    for name, typecode, buffer in columns:
+        length = len(buffer) * (buffer.itemsize if isinstance(buffer, array) else 1)
+        header["columns"].append({"name": name, "typecode": typecode, "offset": offset, "length": length})
+        offset += -(-length // COLUMN_ALIGNMENT) * COLUMN_ALIGNMENT
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    header_bytes += b" " * (-(len(CHECKPOINT_MAGIC) + _HEADER_LENGTH.size + len(header_bytes)) % COLUMN_ALIGNMENT)
+    buffers = [_HEADER_LENGTH.pack(len(header_bytes)), header_bytes]
+    for (name, typecode, buffer), column in zip(columns, header["columns"]):
+        buffers.append(buffer)
+        padding = -column["length"] % COLUMN_ALIGNMENT
+        if padding:
+            buffers.append(b"\0" * padding)
+    return buffers
+
+
+def decode_state(data: memoryview, *, name: str) -> dict:
+    """
+    Decode a state encoded by encode_state.
+    Args:
+        data (memoryview): The encoded state, it may be followed by other data.
+        name (str): Name of the data used in error messages.
+    Returns:
+        dict: The nested state, columns are returned as arrays (array.array) and bytes.
+    """
+    if len(data) < _HEADER_LENGTH.size:
+        raise ValueError(f"{name} is truncated.")
+    header_length, = _HEADER_LENGTH.unpack_from(data, 0)
+    position = _HEADER_LENGTH.size
+    if position + header_length > len(data):
+        raise ValueError(f"{name} is truncated.")
+    header = json.loads(bytes(data[position:position + header_length]))
+    position += header_length
+    if header["version"] != CHECKPOINT_VERSION:
+        raise ValueError(f'Unsupported version of {name}: {header["version"]}. '
+                         f'Supported version is {CHECKPOINT_VERSION}.')
+    if header["byteorder"] != sys.byteorder:
+        raise ValueError(f'Byte order "{header["byteorder"]}" of {name} does not match '
+                         f'the byte order of this machine "{sys.byteorder}".')
+    columns = {}
+    for column in header["columns"]:
+        start = position + column["offset"]
+        end = start + column["length"]
+        if end > len(data):
+            raise ValueError(f"{name} is truncated.")
+        if column["typecode"] == "bytes":
+            columns[column["name"]] = bytes(data[start:end])
+        else:
+            values = array(column["typecode"])
+            values.frombytes(data[start:end])
+            columns[column["name"]] = values
+    return _join_columns(header["state"], columns)
+
+
+def write_checkpoint(path: str, state: dict):
+    """
+    Write a state atomically: the checkpoint is written to a temporary file next to the target,
+    flushed to disk and then renamed over the target, so the target is either the previous
+    or the new checkpoint, never a partially written one.
+    Args:
+        path (str): Path of the checkpoint.
+        state (dict): Nested state of dicts, lists, JSON scalars, arrays (array.array) and bytes.
+            Arrays and bytes are stored as columns, everything else in the header.
+    """
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(CHECKPOINT_MAGIC)
+        for buffer in encode_state(state):
+            file.write(buffer)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
+    # Persist the rename
+    fsync_directory(path)
+
+
+def fsync_directory(path: str):
+    """
+    Flush the directory entry of a file to disk, so a rename or creation of the file survives a crash.
+    Does nothing on systems which cannot open directories.
+    Args:
+        path (str): Path of the file.
+    """
+    if hasattr(os, "O_DIRECTORY"):
+        directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def random_state_dict(random_state: tuple) -> dict:
+    """
+    Convert a state of a random generator (random.Random.getstate) to a dictionary
+    which can be stored by checkpoints and the journal.
+    """
+    version, internal_state, gauss_next = random_state
+    return {"version": version, "internal_state": array('L', internal_state), "gauss_next": gauss_next}
+
+
+def random_state_from_dict(state: dict) -> tuple:
+    """
+    Convert a dictionary returned by random_state_dict back to a state of a random generator.
+    """
+    return state["version"], tuple(state["internal_state"]), state["gauss_next"]
+
+
+def read_checkpoint(path: str) -> dict:
+    """
+    Read a state written by write_checkpoint.
+    Args:
+        path (str): Path of the checkpoint.
+    Returns:
+        dict: The nested state, columns are returned as arrays (array.array) and bytes.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if data[:len(CHECKPOINT_MAGIC)] != CHECKPOINT_MAGIC:
+        raise ValueError(f'"{path}" is not a quiz solver checkpoint.')
+    return decode_state(memoryview(data)[len(CHECKPOINT_MAGIC):], name=f'Checkpoint "{path}"')
+
+
+class QuestionBankColumns:
+    def __init__(self):
+        """
+        Initialize empty columns of the texts, types, hashes and uids of the questions of a question bank.
+        Questions are only appended to the bank and never change, so the columns are kept
+        between checkpoints and only questions added since the previous checkpoint are encoded.
+        """
+        self.questions_count: int = 0
+        self.digest_size: int = 0
+        # Texts are stored UTF-8 encoded one after another, text i spans offsets[i]:offsets[i + 1]
+        self.question_text_offsets: array = array('q', [0])
+        self.question_texts: bytearray = bytearray()
+        # Index of the type of each question in RawQuestionType
+        self.question_types: array = array('b')
+        # Hashes and uids are stored one after another, digest_size bytes each
+        self.question_raw_hashes: bytearray = bytearray()
+        self.question_uids: bytearray = bytearray()
+        self.raw_answer_counts: array = array('i')
+        self.raw_answer_text_offsets: array = array('q', [0])
+        self.raw_answer_texts: bytearray = bytearray()
+        self.raw_answer_uids: bytearray = bytearray()
+
+    def update(self, questions: dict[bytes, Question]):
+        """
+        Encode the questions added to the bank since the previous update.
+        Args:
+            questions (dict): Questions of the bank in the order of their ids.
+        """
+        self.append(islice(questions.values(), self.questions_count, None))
+
+    def append(self, questions: Iterable[Question]):
+        """
+        Encode questions and append them to the columns.
+        Args:
+            questions (Iterable of Question): The questions in the order of their ids.
+        """
+        types = {question_type: index for index, question_type in enumerate(RawQuestionType)}
+        for question in questions:
+            raw_question = question._raw_question
+            self.digest_size = len(raw_question.uid_bytes)
+            self.question_texts += raw_question.question_text.encode('utf-8')
+            self.question_text_offsets.append(len(self.question_texts))
+            self.question_types.append(types[raw_question.type])
+            self.question_raw_hashes += raw_question.raw_hash_bytes
+            self.question_uids += raw_question.uid_bytes
+            self.raw_answer_counts.append(len(raw_question.raw_answers))
+            for raw_answer in raw_question.raw_answers:
+                self.raw_answer_texts += raw_answer.answer_text.encode('utf-8')
+                self.raw_answer_text_offsets.append(len(self.raw_answer_texts))
+                self.raw_answer_uids += raw_answer.uid_bytes
+            self.questions_count += 1
+
+    def checkpoint_state(self) -> dict:
+        """
+        Get the columns for a checkpoint.
+        """
+        return {
+            "questions_count": self.questions_count,
+            "digest_size": self.digest_size,
+            "question_text_offsets": self.question_text_offsets,
+            "question_texts": self.question_texts,
+            "question_types": self.question_types,
+            "question_raw_hashes": self.question_raw_hashes,
+            "question_uids": self.question_uids,
+            "raw_answer_counts": self.raw_answer_counts,
+            "raw_answer_text_offsets": self.raw_answer_text_offsets,
+            "raw_answer_texts": self.raw_answer_texts,
+            "raw_answer_uids": self.raw_answer_uids
+        }
+
+    @classmethod
+    def from_checkpoint_state(cls, state: dict) -> 'QuestionBankColumns':
+        """
+        Create the columns from a state returned by checkpoint_state.
+        """
+        columns = cls()
+        columns.questions_count = state["questions_count"]
+        columns.digest_size = state["digest_size"]
+        columns.question_text_offsets = state["question_text_offsets"]
+        columns.question_texts = bytearray(state["question_texts"])
+        columns.question_types = state["question_types"]
+        columns.question_raw_hashes = bytearray(state["question_raw_hashes"])
+        columns.question_uids = bytearray(state["question_uids"])
+        columns.raw_answer_counts = state["raw_answer_counts"]
+        columns.raw_answer_text_offsets = state["raw_answer_text_offsets"]
+        columns.raw_answer_texts = bytearray(state["raw_answer_texts"])
+        columns.raw_answer_uids = bytearray(state["raw_answer_uids"])
+        return columns
+
+    def restore_questions(self) -> list[Question]:
+        """
+        Create the questions of the bank without hashing their texts again.
+        Returns:
+            list of Question: The questions in the order of their ids (ids are not assigned).
+        """
+        types = tuple(RawQuestionType)
+        digest_size = self.digest_size
+        question_texts = bytes(self.question_texts)
+        question_text_offsets = self.question_text_offsets
+        question_raw_hashes = bytes(self.question_raw_hashes)
+        question_uids = bytes(self.question_uids)
+        raw_answer_texts = bytes(self.raw_answer_texts)
+        raw_answer_text_offsets = self.raw_answer_text_offsets
+        raw_answer_uids = bytes(self.raw_answer_uids)
+        questions = []
+        first_raw_answer = 0
+        for i in range(self.questions_count):
+            raw_answers = range(first_raw_answer, first_raw_answer + self.raw_answer_counts[i])
+            first_raw_answer += len(raw_answers)
+            questions.append(Question.restore(
+                question_text=question_texts[question_text_offsets[i]:question_text_offsets[i + 1]].decode('utf-8'),
+                type=types[self.question_types[i]],
+                raw_hash_bytes=question_raw_hashes[i * digest_size:(i + 1) * digest_size],
+                uid_bytes=question_uids[i * digest_size:(i + 1) * digest_size],
+                answer_texts=[raw_answer_texts[raw_answer_text_offsets[j]:raw_answer_text_offsets[j + 1]].decode('utf-8')
+                              for j in raw_answers],
+                answer_uids=[raw_answer_uids[j * digest_size:(j + 1) * digest_size] for j in raw_answers]
+            ))
+        return questions
@@ -1,4 +1,7 @@
+import hashlib
 from hashlib import sha3_256
+from functools import partial
+from typing import Callable
 from itertools import combinations, chain
 from enum import Enum
 
@@ -14,11 +17,48 @@ def powerset(iterable):
     s = list(iterable)
     return chain.from_iterable(combinations(s, r) for r in range(len(s)+1))
 
-def hash_string(s: str) -> bytes:
-    """Generate a SHA3-256 hash of the input string."""
-    return sha3_256(s.encode('utf-8')).digest()
+def create_hash_function(algorithm: str = "sha3_256", digest_size: int | None = None) -> Callable:
+    """
+    Create a hash function (hashlib constructor) for the given algorithm.
+    Args:
+        algorithm (str): Name of a hashlib algorithm, e.g. "sha3_256" or "blake2b".
+        digest_size (int | None): Digest size in bytes. Only blake2b and blake2s support a custom digest size.
+    Returns:
+        Callable: Function taking bytes and returning a hashlib hash object.
+    """
+    if algorithm not in hashlib.algorithms_available:
+        raise ValueError(f'Unsupported hash algorithm: "{algorithm}".')
+    hash_function = getattr(hashlib, algorithm, None) or partial(hashlib.new, algorithm)
+    if digest_size is None:
+        return hash_function
+    if algorithm in ("blake2b", "blake2s"):
+        return partial(hash_function, digest_size=digest_size)
+    if hash_function().digest_size != digest_size:
+        raise ValueError(f'Hash algorithm "{algorithm}" does not support digest size {digest_size}.')
+    return hash_function
+
+def hash_string(s: str, hash_function: Callable = sha3_256) -> bytes:
+    """Generate a hash (SHA3-256 by default) of the input string."""
+    return hash_function(s.encode('utf-8')).digest()
+
+def hash_strings(strings: list[str], hash_function: Callable = sha3_256) -> list[bytes]:
+    """Generate hashes (SHA3-256 by default) of all input strings at once."""
+    return [hash_function(s.encode('utf-8')).digest() for s in strings]
     
 
+def question_fingerprint(quiz_question: dict) -> tuple:
+    """
+    Compute a lightweight fingerprint of a quiz question without hashing its content.
+    The fingerprint is built from the question text, type and answer texts (in the received order).
+    Args:
+        quiz_question (dict): The quiz question as received in the quiz.
+    Returns:
+        tuple: Hashable fingerprint of the quiz question.
+    """
+    return (quiz_question.get("question", ""),
+            quiz_question.get("type", "chooseOne"),
+            tuple([quiz_answer.get("answer", "") for quiz_answer in quiz_question.get("answers", ())]))
+
 def xor_hex_strings(s1: str, s2: str) -> str:
     """XOR two hex strings of equal length."""
     if len(s1) != len(s2):
@@ -32,7 +72,28 @@ def xor_hash_bytes(b1: bytes, b2: bytes) -> bytes:
     """XOR two byte sequences of equal length."""
     if len(b1) != len(b2):
         raise ValueError("Byte sequences must be of equal length to XOR.")
-    return bytes(a ^ b for a, b in zip(b1, b2))
+    return (int.from_bytes(b1) ^ int.from_bytes(b2)).to_bytes(len(b1))
+
+def compute_uids(question_hash: bytes, answer_hashes: list[bytes]) -> tuple[bytes, list[bytes]]:
+    """
+    Compute the uid of a question and the uids of its answers in one pass.
+    The question uid is the XOR of the question hash and all answer hashes,
+    the answer uid is the XOR of the question uid and the answer hash.
+    The digests are combined as integers instead of byte by byte.
+    Args:
+        question_hash (bytes): Hash of the question.
+        answer_hashes (list of bytes): Hashes of the answers, all of the same length as the question hash.
+    Returns:
+        tuple: The question uid and the list of answer uids in the order of the answer hashes.
+    """
+    digest_size = len(question_hash)
+    from_bytes = int.from_bytes
+    answer_ints = [from_bytes(answer_hash) for answer_hash in answer_hashes]
+    uid_int = from_bytes(question_hash)
+    for answer_int in answer_ints:
+        uid_int ^= answer_int
+    answer_uids = [(uid_int ^ answer_int).to_bytes(digest_size) for answer_int in answer_ints]
+    return uid_int.to_bytes(digest_size), answer_uids
 
 def inverse_square_likelyhood(*, value: float, min: float, max: float, 
                               min_likelyhood: float, max_likelyhood: float) -> float:
@@ -84,4 +145,72 @@ def minmax(values, key) -> tuple[float, object, float, object]:
         if k > max_value:
             max_value = k
             max_index = i
-    return min_value, values[min_index], max_value, values[max_index]
\ No newline at end of file
+    return min_value, values[min_index], max_value, values[max_index]
+
+PROGRESS_BAR_LENGTH = 50
+# Progress bars of every possible progress, they are built once as statistics are rendered often
+_PROGRESS_BARS = tuple("[" + "#" * used + "-" * (PROGRESS_BAR_LENGTH - used) + "]"
+                       for used in range(PROGRESS_BAR_LENGTH + 1))
+
+def progress_bar(progress: float) -> str:
+    """
+    Get a text progress bar.
+    Args:
+        progress (float): Progress between 0.0 and 1.0, values outside are clamped.
+    Returns:
+        str: The progress bar, e.g. "[#####-----]".
+    """
+    used = int(progress * PROGRESS_BAR_LENGTH)
+    return _PROGRESS_BARS[min(max(used, 0), PROGRESS_BAR_LENGTH)]
+
+class IndexedSet:
+    """
+    Set of hashable items with O(1) add, remove and membership test.
+    Items are also kept in a list (attribute "items") so they can be sampled randomly.
+    Removal swaps the removed item with the last item, so the order of items is not preserved.
+    """
+    __slots__ = ("items", "_positions")
+
+    def __init__(self, items=()):
+        self.items: list = []
+        self._positions: dict = {}
+        self.update(items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item) -> bool:
+        return item in self._positions
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def add(self, item):
+        """Add an item if it is not present yet."""
+        if item in self._positions:
+            return
+        self._positions[item] = len(self.items)
+        self.items.append(item)
+
+    def update(self, items):
+        """Add all items which are not present yet."""
+        for item in items:
+            self.add(item)
+
+    def remove(self, item):
+        """Remove an item. Raises KeyError if the item is not present."""
+        position = self._positions.pop(item)
+        last_item = self.items.pop()
+        if last_item is not item:
+            self.items[position] = last_item
+            self._positions[last_item] = position
+
+    def discard(self, item):
+        """Remove an item if it is present."""
+        if item in self._positions:
+            self.remove(item)
+
+    def clear(self):
+        """Remove all items."""
+        self.items.clear()
+        self._positions.clear()
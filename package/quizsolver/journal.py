@@ -0,0 +1,128 @@
+import os
+import zlib
+import struct
+from .checkpoint import encode_state, decode_state, fsync_directory
+
+# File layout: magic, then records one after another.
+# Each record is a frame (length and CRC-32 of the payload, sequence number) followed by the payload,
+# which is a state encoded like a checkpoint.
+JOURNAL_MAGIC = b"QSJRNL01"
+_FRAME = struct.Struct("<IIQ")
+
+
+def read_journal(path: str) -> list[tuple[int, dict, int]]:
+    """
+    Read the records of a journal. Reading stops at the first incomplete or damaged record,
+    which is the record being written when the process or the machine crashed.
+    Args:
+        path (str): Path of the journal.
+    Returns:
+        list of tuple: The records as (sequence, record, end) where end is the length
+            of the journal up to the end of the record in bytes.
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb") as file:
+        data = file.read()
+    if len(data) < len(JOURNAL_MAGIC):
+        return []
+    if data[:len(JOURNAL_MAGIC)] != JOURNAL_MAGIC:
+        raise ValueError(f'"{path}" is not a quiz solver journal.')
+    view = memoryview(data)
+    records = []
+    position = len(JOURNAL_MAGIC)
+    while position + _FRAME.size <= len(data):
+        length, crc, sequence = _FRAME.unpack_from(data, position)
+        start = position + _FRAME.size
+        payload = view[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        position = start + length
+        records.append((sequence, decode_state(payload, name=f'Record {sequence} of journal "{path}"'), position))
+    return records
+
+
+class Journal:
+    def __init__(self, path: str, *, sync_epochs: int = 1, length: int = 0, reset: bool = False):
+        """
+        Open an append-only journal of the changes of the quiz solver between checkpoints.
+        Records are written to the operating system at the end of every epoch, so they survive
+        a crash of the process, and flushed to disk once per sync_epochs epochs, so a crash
+        of the machine loses at most sync_epochs epochs.
+        Args:
+            path (str): Path of the journal.
+            sync_epochs (int): Number of epochs between flushes of the journal to disk.
+            length (int): Length of the valid part of an existing journal to keep (see read_journal).
+                0 starts a new journal.
+            reset (bool): Remove the part of an existing journal after length. Without it, an existing
+                journal longer than length is not opened, so its records are not lost by accident.
+        """
+        if sync_epochs < 1:
+            raise ValueError(f"Invalid sync_epochs: {sync_epochs}. sync_epochs must be at least 1.")
+        if not reset and os.path.exists(path) and os.path.getsize(path) > max(length, len(JOURNAL_MAGIC)):
+            raise ValueError(f'Journal "{path}" contains records. Call QuizSolver.recover() to continue '
+                             f'from them, or remove the journal to start anew.')
+        self.path = path
+        self.sync_epochs = sync_epochs
+        self.records_written: int = 0
+        self.syncs: int = 0
+        self._unsynced_epochs: int = 0
+        created = not os.path.exists(path)
+        self._file = open(path, "r+b" if not created else "w+b")
+        if length < len(JOURNAL_MAGIC):
+            self._file.truncate(0)
+            self._file.write(JOURNAL_MAGIC)
+        else:
+            self._file.truncate(length)
+            self._file.seek(length)
+        self._sync()
+        if created:
+            fsync_directory(path)
+
+    def append(self, sequence: int, record: dict):
+        """
+        Append a record. The record is buffered until the end of the epoch.
+        Args:
+            sequence (int): Sequence number of the record.
+            record (dict): The record, a state which can be stored by a checkpoint.
+        """
+        payload = b"".join(encode_state(record))
+        self._file.write(_FRAME.pack(len(payload), zlib.crc32(payload), sequence))
+        self._file.write(payload)
+        self.records_written += 1
+
+    def end_epoch(self):
+        """
+        Write the records of the epoch to the operating system and flush them to disk
+        if sync_epochs epochs passed since the previous flush.
+        """
+        self._unsynced_epochs += 1
+        if self._unsynced_epochs >= self.sync_epochs:
+            self._sync()
+        else:
+            self._file.flush()
+
+    def _sync(self):
+        """
+        Flush all records to disk.
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced_epochs = 0
+        self.syncs += 1
+
+    def reset(self):
+        """
+        Remove all records, e.g. after they were included in a checkpoint.
+        """
+        self._file.truncate(len(JOURNAL_MAGIC))
+        self._file.seek(len(JOURNAL_MAGIC))
+        self._sync()
+
+    def close(self):
+        """
+        Flush all records to disk and close the journal.
+        """
+        if not self._file.closed:
+            self._sync()
+            self._file.close()
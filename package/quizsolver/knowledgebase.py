@@ -0,0 +1,309 @@
+import os
+import mmap
+import struct
+from contextlib import contextmanager
+try:
+    import fcntl
+except ImportError:
+    # Without flock (e.g. on Windows) only one process may write to a knowledge base at a time
+    fcntl = None
+
+# File layout: header, table of slots, data.
+# The file never changes its size, when the table or the data is full the knowledge base is rewritten
+# into a larger file which replaces it and the old file is marked as moved, so readers reopen it.
+# Each slot holds the offset of a record (0 for an empty slot) and the uid of its question,
+# slots are found by linear probing starting at the slot given by the first bytes of the uid.
+# A record holds the number of correct and incorrect answers followed by their uids.
+KNOWLEDGE_BASE_MAGIC = b"QSKNOW01"
+KNOWLEDGE_BASE_VERSION = 1
+_HEADER = struct.Struct("<8sHHIQQQQ16s")
+# Offsets of the fields of the header written after the file is created (readers do not lock the file,
+# so a field is never rewritten together with fields which do not change)
+_FLAGS_OFFSET = 10
+_COUNT_OFFSET = 24
+_DATA_END_OFFSET = 40
+_FLAG_MOVED = 1
+_OFFSET = struct.Struct("<Q")
+_RECORD = struct.Struct("<HH")
+# Initial number of slots and bytes of data per slot
+INITIAL_CAPACITY = 1024
+DATA_PER_SLOT = 128
+# The table is grown when it is more than half full
+MAX_LOAD_FACTOR = 0.5
+
+
+def _align(length: int) -> int:
+    """
+    Round a length up to a multiple of 8 bytes.
+    """
+    return -(-length // 8) * 8
+
+
+class KnowledgeBase:
+    def __init__(self, path: str, *, hash_algorithm: str, digest_size: int, readonly: bool = False):
+        """
+        Open a persistent knowledge base of solved questions shared by quiz solvers of all processes.
+        For each question uid it records the uids of the correct and of the eliminated answers.
+        The file is memory-mapped, so only the pages of looked up questions are read into memory
+        and any number of processes can read it concurrently without locks. Writers lock the file.
+        A missing knowledge base is created unless it is opened read-only.
+        Args:
+            path (str): Path of the knowledge base.
+            hash_algorithm (str): Name of the hash algorithm of the uids.
+            digest_size (int): Size of the uids in bytes.
+            readonly (bool): Whether the knowledge base is only read.
+        """
+        if len(hash_algorithm.encode("ascii")) > 16:
+            raise ValueError(f'Hash algorithm name "{hash_algorithm}" is longer than 16 characters.')
+        self.path = path
+        self.hash_algorithm = hash_algorithm
+        self.digest_size = digest_size
+        self.readonly = readonly
+        self._slot_size = 8 + _align(digest_size)
+        self._table_offset = _HEADER.size
+        self._file = None
+        self._mmap: mmap.mmap | None = None
+        self.capacity: int = 0
+        self._open()
+
+    def _open(self):
+        """
+        Open and map the file of the knowledge base, creating it if it is missing.
+        """
+        if not self.readonly and not os.path.exists(self.path):
+            self._create(self.path, capacity=INITIAL_CAPACITY, data_capacity=INITIAL_CAPACITY * DATA_PER_SLOT,
+                         replace=False)
+        self._file = open(self.path, "rb" if self.readonly else "r+b")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE)
+        magic, version, _, digest_size, capacity, _, _, _, algorithm = _HEADER.unpack_from(self._mmap, 0)
+        if magic != KNOWLEDGE_BASE_MAGIC:
+            raise ValueError(f'"{self.path}" is not a quiz solver knowledge base.')
+        if version != KNOWLEDGE_BASE_VERSION:
+            raise ValueError(f"Unsupported knowledge base version: {version}. "
+                             f"Supported version is {KNOWLEDGE_BASE_VERSION}.")
+        algorithm = algorithm.rstrip(b"\0").decode("ascii")
+        if digest_size != self.digest_size or algorithm != self.hash_algorithm:
+            raise ValueError(f'Knowledge base uses hash algorithm "{algorithm}" with digest size {digest_size}, '
+                             f'the quiz solver uses "{self.hash_algorithm}" with digest size {self.digest_size}.')
+        self.capacity = capacity
+
+    def _close_mapping(self):
+        """
+        Unmap and close the file of the knowledge base.
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _reopen_if_moved(self):
+        """
+        Reopen the knowledge base if another writer replaced it by a larger file.
+        """
+        if self._mmap[_FLAGS_OFFSET] & _FLAG_MOVED:
+            self._close_mapping()
+            self._open()
+
+    def _create(self, path: str, *, capacity: int, data_capacity: int, entries: list | None = None,
+                replace: bool = True):
+        """
+        Write a new file of a knowledge base with the given entries and move it to the path.
+        Args:
+            path (str): Path of the new knowledge base.
+            capacity (int): Number of slots, a power of two.
+            data_capacity (int): Number of bytes for records.
+            entries (list | None): (uid, correct uids, incorrect uids) of the questions.
+            replace (bool): Whether an existing file is replaced, otherwise the existing file is kept
+                (another process created it first).
+        """
+        size = self._table_offset + capacity * self._slot_size + data_capacity
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w+b") as file:
+            file.truncate(size)
+            with mmap.mmap(file.fileno(), size) as mapping:
+                _HEADER.pack_into(mapping, 0, KNOWLEDGE_BASE_MAGIC, KNOWLEDGE_BASE_VERSION, 0, self.digest_size,
+                                  capacity, 0, data_capacity, 0, self.hash_algorithm.encode("ascii"))
+                for uid, correct_uids, incorrect_uids in entries or ():
+                    self._insert(mapping, uid, correct_uids, incorrect_uids)
+                mapping.flush()
+            os.fsync(file.fileno())
+        if replace:
+            os.replace(temporary_path, path)
+            return
+        try:
+            os.link(temporary_path, path)
+        except FileExistsError:
+            pass
+        os.remove(temporary_path)
+
+    @contextmanager
+    def _locked(self):
+        """
+        Hold the exclusive lock of the current file of the knowledge base.
+        """
+        while True:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            if not self._mmap[_FLAGS_OFFSET] & _FLAG_MOVED:
+                break
+            # Another writer replaced the file while this writer was waiting for the lock
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._close_mapping()
+            self._open()
+        try:
+            yield
+        finally:
+            if fcntl is not None and self._file is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+    def _find_slot(self, mapping, capacity: int, uid: bytes) -> tuple[int, int]:
+        """
+        Find the slot of a question or the empty slot where it would be inserted.
+        Returns:
+            tuple: Position of the slot in the file and the offset of its record (0 if the slot is empty).
+        """
+        mask = capacity - 1
+        slot_size = self._slot_size
+        slot = int.from_bytes(uid[:8], "little") & mask
+        while True:
+            position = self._table_offset + slot * slot_size
+            offset, = _OFFSET.unpack_from(mapping, position)
+            if offset == 0 or mapping[position + 8:position + 8 + len(uid)] == uid:
+                return position, offset
+            slot = (slot + 1) & mask
+
+    def _insert(self, mapping, uid: bytes, correct_uids: list[bytes], incorrect_uids: list[bytes]) -> bool:
+        """
+        Insert a question into a mapping with enough free slots and data, unless it is already known.
+        The space of the record is reserved first, then the record and the uid are written and the offset
+        of the record is written last, so readers never see a slot pointing to an incomplete record
+        and a crash while inserting only leaves unused data.
+        Returns:
+            bool: Whether the question was inserted.
+        """
+        capacity, count, _, data_end = _HEADER.unpack_from(mapping, 0)[4:8]
+        position, offset = self._find_slot(mapping, capacity, uid)
+        if offset != 0:
+            return False
+        digest_size = self.digest_size
+        _OFFSET.pack_into(mapping, _DATA_END_OFFSET, data_end + self._record_size(correct_uids, incorrect_uids))
+        _OFFSET.pack_into(mapping, _COUNT_OFFSET, count + 1)
+        offset = self._table_offset + capacity * self._slot_size + data_end
+        start = offset + _RECORD.size
+        _RECORD.pack_into(mapping, offset, len(correct_uids), len(incorrect_uids))
+        mapping[start:start + (len(correct_uids) + len(incorrect_uids)) * digest_size] = \
+            b"".join(correct_uids) + b"".join(incorrect_uids)
+        mapping[position + 8:position + 8 + digest_size] = uid
+        _OFFSET.pack_into(mapping, position, offset)
+        return True
+
+    def _record_size(self, correct_uids: list[bytes], incorrect_uids: list[bytes]) -> int:
+        """
+        Size of a record in the data, aligned to 8 bytes.
+        """
+        return _align(_RECORD.size + (len(correct_uids) + len(incorrect_uids)) * self.digest_size)
+
+    def _read_record(self, mapping, offset: int) -> tuple[list[bytes], list[bytes]]:
+        """
+        Read the correct and incorrect answer uids of a record.
+        """
+        correct_count, incorrect_count = _RECORD.unpack_from(mapping, offset)
+        digest_size = self.digest_size
+        start = offset + _RECORD.size
+        uids = [mapping[i:i + digest_size]
+                for i in range(start, start + (correct_count + incorrect_count) * digest_size, digest_size)]
+        return uids[:correct_count], uids[correct_count:]
+
+    def _entries(self) -> list[tuple[bytes, list[bytes], list[bytes]]]:
+        """
+        Read all questions of the current file.
+        """
+        mapping = self._mmap
+        entries = []
+        for slot in range(self.capacity):
+            position = self._table_offset + slot * self._slot_size
+            offset, = _OFFSET.unpack_from(mapping, position)
+            if offset != 0:
+                entries.append((mapping[position + 8:position + 8 + self.digest_size],
+                                *self._read_record(mapping, offset)))
+        return entries
+
+    def __len__(self) -> int:
+        """
+        Number of known questions.
+        """
+        self._reopen_if_moved()
+        return _HEADER.unpack_from(self._mmap, 0)[5]
+
+    def lookup(self, uid: bytes) -> tuple[list[bytes], list[bytes]] | None:
+        """
+        Look up a question.
+        Args:
+            uid (bytes): Uid of the question.
+        Returns:
+            tuple | None: Uids of the correct answers and of the eliminated answers,
+                None if the question is not known.
+        """
+        self._reopen_if_moved()
+        position, offset = self._find_slot(self._mmap, self.capacity, uid)
+        if offset == 0:
+            return None
+        return self._read_record(self._mmap, offset)
+
+    def record(self, entries: list[tuple[bytes, list[bytes], list[bytes]]]) -> int:
+        """
+        Record solved questions at once. Questions which are already known are kept as they are.
+        Args:
+            entries (list of tuple): (uid, correct uids, incorrect uids) of the questions.
+        Returns:
+            int: Number of newly recorded questions.
+        """
+        if self.readonly:
+            raise ValueError(f'Knowledge base "{self.path}" is opened read-only.')
+        if len(entries) == 0:
+            return 0
+        needed_data = sum(self._record_size(correct_uids, incorrect_uids)
+                          for _, correct_uids, incorrect_uids in entries)
+        with self._locked():
+            # Other writers may fill the new file before it is locked, so the space is checked again after growing
+            while True:
+                count, data_capacity, data_end = _HEADER.unpack_from(self._mmap, 0)[5:8]
+                capacity = self.capacity
+                while count + len(entries) > capacity * MAX_LOAD_FACTOR:
+                    capacity *= 2
+                new_data_capacity = max(data_capacity, capacity * DATA_PER_SLOT)
+                while data_end + needed_data > new_data_capacity:
+                    new_data_capacity *= 2
+                if capacity == self.capacity and new_data_capacity == data_capacity:
+                    break
+                self._grow(capacity=capacity, data_capacity=new_data_capacity)
+            recorded = 0
+            for uid, correct_uids, incorrect_uids in entries:
+                recorded += self._insert(self._mmap, uid, correct_uids, incorrect_uids)
+            return recorded
+
+    def _grow(self, *, capacity: int, data_capacity: int):
+        """
+        Rewrite the knowledge base into a larger file while holding the lock of the current file,
+        replace the current file and mark it as moved.
+        """
+        self._create(self.path, capacity=capacity, data_capacity=data_capacity, entries=self._entries())
+        old_mmap, old_file = self._mmap, self._file
+        self._mmap[_FLAGS_OFFSET] |= _FLAG_MOVED
+        self._mmap, self._file = None, None
+        self._open()
+        # Lock the new file before releasing the old one, the caller unlocks the new file
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            fcntl.flock(old_file.fileno(), fcntl.LOCK_UN)
+        old_mmap.close()
+        old_file.close()
+
+    def close(self):
+        """
+        Close the knowledge base.
+        """
+        self._close_mapping()
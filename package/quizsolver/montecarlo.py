@@ -0,0 +1,143 @@
+import os
+import copy
+import time
+import numpy as np
+from typing import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from .quizsolversetup import QuizSolverSetup
+from .quizsolver import QuizSolver
+from .quizsource import QuizSource
+
+# Percentiles of the epochs reported by MonteCarloRunner.statistics
+PERCENTILES = (5, 25, 75, 95, 99)
+# Number of quizzes after which a run stops unsolved unless the source options set quizzes_count,
+# a strategy which stalls would otherwise keep a worker busy until max_epochs of the setup
+DEFAULT_QUIZZES_COUNT = 100000
+
+
+def solve_seeded(seed: int, setup: QuizSolverSetup, strategy_in_use: str, source_options: dict) -> dict:
+    """
+    Solve the quizzes of a seeded quiz source until the quiz solver finishes
+    or the source runs out of quizzes (DEFAULT_QUIZZES_COUNT unless quizzes_count is given).
+    The quiz solver runs headless and uses the solver random generator of the source,
+    so the result depends on the seed only.
+    Args:
+        seed (int): Seed of the quiz source.
+        setup (QuizSolverSetup): Setup of the quiz solver, headless is forced.
+        strategy_in_use (str): Initial strategy of the quiz solver.
+        source_options (dict): Keyword arguments of QuizSource except seed.
+    Returns:
+        dict: Seed, epochs, latest score, whether the run was solved (the targeted score was reached
+            or all questions were solved before the limits of epochs and quizzes), whether all questions
+            were solved and the time in seconds.
+    """
+    start = time.perf_counter()
+    setup = copy.copy(setup)
+    setup.headless = True
+    source = QuizSource(seed=seed, **{"quizzes_count": DEFAULT_QUIZZES_COUNT, **source_options})
+    quiz_solver = QuizSolver(setup=setup, strategy_in_use=strategy_in_use, random_generator=source.solver_random)
+    result: dict = {"finished": False}
+    for quiz in source:
+        score = source.score(quiz_solver.give_answers(quiz=quiz))
+        result = quiz_solver.process_score_feedback(score=score, max_score=1.0)
+        if result["finished"]:
+            break
+    quiz_solver.close()
+    return {"seed": seed, "epochs": quiz_solver.epoch, "score": result.get("score"),
+            "solved": result.get("targeted_score_reached", False) or result.get("all_questions_solved", False),
+            "all_questions_solved": result.get("all_questions_solved", False),
+            "time": time.perf_counter() - start}
+
+
+def available_cpu_count() -> int:
+    """
+    Get the number of CPUs the process may run on.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class MonteCarloRunner:
+    def __init__(self, *, setup: QuizSolverSetup, runs: int, strategy_in_use: str = "Alpha",
+                 first_seed: int = 0, workers: int | None = None, **source_options):
+        """
+        Run many independent seeded solves in a pool of processes to get the distribution
+        of the epochs needed to solve a quiz. Run i uses the seed first_seed + i, so the results
+        do not depend on the number of workers or the order in which the runs finish.
+        Args:
+            setup (QuizSolverSetup): Setup of the quiz solvers, they always run headless.
+            runs (int): Number of runs.
+            strategy_in_use (str): Initial strategy of the quiz solvers.
+            first_seed (int): Seed of the first run.
+            workers (int | None): Number of processes, all available CPUs if None.
+            **source_options: Keyword arguments of QuizSource except seed (bank, quiz size, limit of quizzes,
+                see solve_seeded for the default limit).
+        """
+        if runs < 1:
+            raise ValueError(f"Invalid runs: {runs}. runs must be at least 1.")
+        if workers is not None and workers < 1:
+            raise ValueError(f"Invalid workers: {workers}. workers must be at least 1.")
+        self.setup = setup
+        self.runs = runs
+        self.strategy_in_use = strategy_in_use
+        self.first_seed = first_seed
+        self.workers = workers if workers is not None else min(runs, available_cpu_count())
+        self.source_options = source_options
+        # Results of the finished runs in the order they finished
+        self.results: list[dict] = []
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Start the runs and yield the result of each run as soon as it finishes (see solve_seeded).
+        The remaining runs are cancelled if the iteration is stopped early.
+        """
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(solve_seeded, seed, self.setup, self.strategy_in_use, self.source_options)
+                       for seed in range(self.first_seed, self.first_seed + self.runs)]
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    self.results.append(result)
+                    yield result
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def run(self) -> dict:
+        """
+        Run all runs and get their statistics.
+        Returns:
+            dict: The statistics, see statistics().
+        """
+        for _ in self:
+            pass
+        return self.statistics()
+
+    def statistics(self) -> dict:
+        """
+        Get statistics of the epochs of the finished runs. The epochs are those of the solved runs only,
+        unsolved runs stopped at the limits and would make a strategy which stalls look faster.
+        Returns:
+            dict: Number of runs, solved runs, runs with all questions solved, mean, standard deviation,
+                minimum, median, maximum and percentiles (p5 to p99) of the epochs of the solved runs
+                (None if no run was solved) and the total time of the runs in seconds.
+        """
+        if not self.results:
+            raise ValueError("No finished runs.")
+        epochs = np.array([result["epochs"] for result in self.results if result["solved"]], dtype=np.float64)
+        statistics = {
+            "runs": len(self.results),
+            "solved_runs": len(epochs),
+            "all_questions_solved_runs": sum(result["all_questions_solved"] for result in self.results),
+            "mean": float(epochs.mean()) if len(epochs) else None,
+            "std": float(epochs.std()) if len(epochs) else None,
+            "min": int(epochs.min()) if len(epochs) else None,
+            "median": float(np.median(epochs)) if len(epochs) else None,
+            "max": int(epochs.max()) if len(epochs) else None,
+            "time": sum(result["time"] for result in self.results),
+        }
+        percentiles = np.percentile(epochs, PERCENTILES) if len(epochs) else [None] * len(PERCENTILES)
+        for percentile, value in zip(PERCENTILES, percentiles):
+            statistics[f"p{percentile}"] = float(value) if value is not None else None
+        return statistics
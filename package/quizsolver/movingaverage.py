@@ -1,57 +1,174 @@
-import matplotlib.pyplot as plt
+import heapq
+from array import array
+from .common import epsilon
 
 class MovingAverage:
-    def __init__(self, *, initial_value: float = 0.0, window_size: int = 32, max_window_size: int = 10000):
+    MODES = ("simple", "weighted", "exponential")
+
+    def __init__(self, *, initial_value: float = 0.0, window_size: int = 32, max_window_size: int = 10000,
+                 history_size: int = 10000, history_policy: str = "drop_oldest",
+                 mode: str = "simple", alpha: float | None = None):
         """
         Initialize the MovingAverage with a specified window size.
+        Values are stored in a ring buffer with a power of two capacity of at least twice the window size.
+        The ring grows when the window grows. Values which are older than the ring retained
+        are replaced by the initial value when the window grows over them.
         Args:
             window_size (int): The size of the moving average window.
-            max_window_size (int): The maximum size of the internal storage.
+            max_window_size (int): The maximum size of the window.
             initial_value (float): The initial value to fill the window.
+            history_size (int): Maximum number of recorded moving averages and medians (0 disables the history).
+            history_policy (str): What to do when the history is full, "drop_oldest" drops the oldest entries,
+                "halve" drops every other entry and records only every other value from then on.
+            mode (str): How the moving average is computed, "simple" averages the values in the window
+                (weights are ignored), "weighted" averages the values in the window by their weights,
+                "exponential" is an exponentially weighted moving average of all values and their weights.
+            alpha (float | None): Smoothing factor of the exponential mode in (0, 1].
+                If None, 2 / (window_size + 1) is used and follows changes of the window size.
         """
+        if window_size > max_window_size:
+            raise ValueError(f'Window size {window_size} exceeds maximum of {max_window_size}.')
+        if history_policy not in ("drop_oldest", "halve"):
+            raise ValueError(f'Invalid history policy: {history_policy}. Must be one of: drop_oldest, halve.')
+        if mode not in self.MODES:
+            raise ValueError(f'Invalid moving average mode: {mode}. Must be one of: {", ".join(self.MODES)}.')
+        if alpha is not None and not 0.0 < alpha <= 1.0:
+            raise ValueError(f'Invalid alpha: {alpha}. Alpha must be in (0, 1].')
+        self.mode: str = mode
         self.window_size: int = window_size
         self.max_window_size = max_window_size
-        self.values: list[float] = [initial_value] * max_window_size
-        self.values_weights: list[float] = [1.0] * max_window_size
+        # Value used for the window before any values were added (and for values the ring no longer retains)
+        self._fill_value: float = initial_value
+        capacity = self._ring_capacity(window_size)
+        self._mask: int = capacity - 1
+        self.values: array = array('d', [initial_value]) * capacity
+        self.values_weights: array = array('d', [1.0]) * capacity
         self.index = 0
         self.cumulative_sum = initial_value * window_size
+        # Running sums of the weighted mode (over the window) and of the exponential mode (over all values)
+        self.weighted_sum: float = initial_value * window_size
+        self.weight_total: float = float(window_size)
+        self._alpha_follows_window_size: bool = alpha is None
+        self.alpha: float = alpha if alpha is not None else 2.0 / (window_size + 1)
+        self._exponential_sum: float = initial_value
+        self._exponential_weight: float = 1.0
+        # Order statistics of the window for the rolling median.
+        # Values are keyed by (value, position) where position counts added values
+        # (initial values have negative positions). The lower half of the window is stored
+        # in a max-heap of negated keys, the upper half in a min-heap. Keys leaving the window
+        # are not removed from the heaps immediately, they are skipped once they reach the top.
+        self._position: int = 0
+        self._lower_half: list[tuple[float, int]] = []
+        self._upper_half: list[tuple[float, int]] = []
+        self._lower_half_size: int = 0
+        self._upper_half_size: int = 0
+        self._rebuild_median_heaps()
         # For plotting history
         self.history_figure_initialized = False
         self.history_figure = None
-        self.history_of_moving_averages: list[float] = []
-        self.history_of_medians: list[float] = []
+        self.history_size: int = history_size
+        self.history_policy: str = history_policy
+        # With the "halve" policy only every history_stride-th value is recorded
+        self.history_stride: int = 1
+        self._values_until_history_record: int = 1
+        # With the "drop_oldest" policy up to twice the history size is kept and the oldest half
+        # is dropped at once when the arrays are full
+        self._history_of_moving_averages: array = array('d')
+        self._history_of_medians: array = array('d')
+
+    @staticmethod
+    def _ring_capacity(window_size: int) -> int:
+        """
+        Get the capacity of the ring buffer for a window size: the smallest power of two
+        which holds the window twice (at least 8).
+        """
+        return max(8, 1 << (2 * window_size - 1).bit_length())
 
     def add_value(self, value: float, value_weight: float = 1.0) -> None:
         """
         Add a new value to the moving average calculation.
         Args:
             value (float): The new value to add.
+            value_weight (float): Weight of the value in the weighted and exponential modes.
         Returns:
             float: The updated moving average.
         """
-        # Update cumulative sum
-        old_index = (self.index - self.window_size) % self.max_window_size
-        self.cumulative_sum += (value * value_weight) - (self.values[old_index] * self.values_weights[old_index])
+        # Update cumulative sum and running sums
+        old_index = (self.index - self.window_size) & self._mask
+        old_value = self.values[old_index]
+        old_value_weight = self.values_weights[old_index]
+        self.cumulative_sum += value - old_value
+        self.weighted_sum += (value * value_weight) - (old_value * old_value_weight)
+        self.weight_total += value_weight - old_value_weight
+        alpha = self.alpha
+        self._exponential_sum = (1.0 - alpha) * self._exponential_sum + alpha * value_weight * value
+        self._exponential_weight = (1.0 - alpha) * self._exponential_weight + alpha * value_weight
         self.values[self.index] = value
         self.values_weights[self.index] = value_weight
-        self.index = (self.index + 1) % self.max_window_size
+        self.index = (self.index + 1) & self._mask
+        # Update order statistics of the window
+        self._remove_from_median_heaps(old_value, self._position - self.window_size)
+        self._position += 1
+        self._add_to_median_heaps(value, self._position - 1)
+        # Recompute the weighted sums once per turn of the ring to drop accumulated rounding errors
+        # and whenever the weight total gets close to zero, where rounding errors dominate
+        if self.index == 0 or self.weight_total <= epsilon:
+            self._recompute_weighted_sums()
         # Record history
-        len_history_of_moving_averages = len(self.history_of_moving_averages)
-        if len_history_of_moving_averages < self.max_window_size:
-            self.history_of_moving_averages.append(self.moving_average)
-            self.history_of_medians.append(self.median)
-        else:
-            self.history_of_moving_averages[len_history_of_moving_averages % self.max_window_size] = self.moving_average
-            self.history_of_medians[len_history_of_moving_averages % self.max_window_size] = self.median
+        if self.history_size > 0:
+            self._record_history()
+
+    def _record_history(self):
+        """
+        Record the current moving average and median in the history according to the history policy.
+        """
+        self._values_until_history_record -= 1
+        if self._values_until_history_record > 0:
+            return
+        self._values_until_history_record = self.history_stride
+        history_of_moving_averages = self._history_of_moving_averages
+        history_of_medians = self._history_of_medians
+        if self.history_policy == "halve":
+            if len(history_of_moving_averages) == self.history_size:
+                # Keep every other entry and record half as often from now on
+                self._history_of_moving_averages = history_of_moving_averages = history_of_moving_averages[::2]
+                self._history_of_medians = history_of_medians = history_of_medians[::2]
+                self.history_stride *= 2
+                self._values_until_history_record = self.history_stride
+        elif len(history_of_moving_averages) == 2 * self.history_size:
+            del history_of_moving_averages[:self.history_size]
+            del history_of_medians[:self.history_size]
+        history_of_moving_averages.append(self.moving_average)
+        history_of_medians.append(self.median)
+
+    @property
+    def history_of_moving_averages(self) -> list[float]:
+        """
+        Get the recorded moving averages from the oldest to the newest.
+        """
+        return self._history_of_moving_averages[-self.history_size:].tolist() if self.history_size > 0 else []
+
+    @property
+    def history_of_medians(self) -> list[float]:
+        """
+        Get the recorded medians from the oldest to the newest.
+        """
+        return self._history_of_medians[-self.history_size:].tolist() if self.history_size > 0 else []
 
     def reset(self):
         """
         Reset the moving average to its initial state.
         """
-        self.values = [0.0] * self.max_window_size
-        self.values_weights = [1.0] * self.max_window_size
+        self._fill_value = 0.0
+        self.values = array('d', [0.0]) * len(self.values)
+        self.values_weights = array('d', [1.0]) * len(self.values_weights)
         #self.index = 0
         self.cumulative_sum = 0.0
+        self.weighted_sum = 0.0
+        self.weight_total = float(self.window_size)
+        self._exponential_sum = 0.0
+        self._exponential_weight = 1.0
+        self._rebuild_median_heaps()
         #self.history_of_moving_averages.clear()
         #self.history_of_medians.clear()
     
@@ -62,14 +179,24 @@ class MovingAverage:
         Returns:
             float: The current moving average.
         """
+        if self.mode == "weighted":
+            if self.weight_total <= 0.0:
+                return 0.0
+            return self.weighted_sum / self.weight_total
+        if self.mode == "exponential":
+            if self._exponential_weight <= 0.0:
+                return 0.0
+            return self._exponential_sum / self._exponential_weight
         return self.cumulative_sum / self.window_size
-        total_weight = sum(self.values_weights[(self.index - i - 1) % self.max_window_size] for i in range(self.window_size))
-        if total_weight == 0:
-            return 0.0
-        weighted_sum = sum(self.values[(self.index - i - 1) % self.max_window_size] * \
-                           self.values_weights[(self.index - i - 1) % self.max_window_size] \
-                           for i in range(self.window_size))
-        return weighted_sum / total_weight
+
+    def window_values(self) -> list[float]:
+        """
+        Get the values in the current window from the oldest to the newest.
+        Returns:
+            list of float: The values in the window.
+        """
+        return [self.values[position & self._mask]
+                for position in range(self._position - self.window_size, self._position)]
     
     @property
     def median(self) -> float:
@@ -78,14 +205,112 @@ class MovingAverage:
         Returns:
             float: The median value.
         """
-        relevant_values = [self.values[(self.index - i - 1) % self.max_window_size] for i in range(self.window_size)]
-        sorted_values = sorted(relevant_values)
-        mid = self.window_size // 2
+        lower_half = self._lower_half
+        self._prune_median_heap(lower_half, negated=True)
         if self.window_size % 2 == 0:
-            return (sorted_values[mid - 1] + sorted_values[mid]) / 2.0
+            upper_half = self._upper_half
+            self._prune_median_heap(upper_half, negated=False)
+            return (-lower_half[0][0] + upper_half[0][0]) / 2.0
         else:
-            return sorted_values[mid]
-        
+            return -lower_half[0][0]
+
+    def _recompute_weighted_sums(self):
+        """
+        Recompute the weighted sum and the weight total of the values in the current window.
+        """
+        weighted_sum = 0.0
+        weight_total = 0.0
+        for position in range(self._position - self.window_size, self._position):
+            value_weight = self.values_weights[position & self._mask]
+            weighted_sum += self.values[position & self._mask] * value_weight
+            weight_total += value_weight
+        self.weighted_sum = weighted_sum
+        self.weight_total = weight_total
+
+    def _rebuild_median_heaps(self):
+        """
+        Rebuild the heaps of the rolling median from the values in the current window.
+        """
+        window_start = self._position - self.window_size
+        keys = sorted((self.values[position & self._mask], position)
+                      for position in range(window_start, self._position))
+        # The lower half holds the extra value of an odd window
+        self._lower_half_size = (len(keys) + 1) // 2
+        self._upper_half_size = len(keys) - self._lower_half_size
+        self._lower_half = [(-value, -position) for value, position in keys[:self._lower_half_size]]
+        self._upper_half = keys[self._lower_half_size:]
+        heapq.heapify(self._lower_half)
+        heapq.heapify(self._upper_half)
+
+    def _prune_median_heap(self, heap: list[tuple[float, int]], *, negated: bool):
+        """
+        Pop keys which already left the window from the top of a heap of the rolling median.
+        Args:
+            heap (list): The heap to prune.
+            negated (bool): Whether the heap stores negated keys (lower half).
+        """
+        window_start = self._position - self.window_size
+        if negated:
+            while heap and -heap[0][1] < window_start:
+                heapq.heappop(heap)
+        else:
+            while heap and heap[0][1] < window_start:
+                heapq.heappop(heap)
+
+    def _remove_from_median_heaps(self, value: float, position: int):
+        """
+        Account for a value leaving the window. The key stays in its heap until it reaches the top.
+        Args:
+            value (float): The value leaving the window.
+            position (int): The position of the value.
+        """
+        lower_half = self._lower_half
+        self._prune_median_heap(lower_half, negated=True)
+        if self._lower_half_size > 0 and (value, position) <= (-lower_half[0][0], -lower_half[0][1]):
+            self._lower_half_size -= 1
+        else:
+            self._upper_half_size -= 1
+
+    def _add_to_median_heaps(self, value: float, position: int):
+        """
+        Add a value entering the window and rebalance the heaps.
+        Must be called after the value leaving the window was removed and the position advanced.
+        Args:
+            value (float): The value entering the window.
+            position (int): The position of the value.
+        """
+        lower_half = self._lower_half
+        upper_half = self._upper_half
+        self._prune_median_heap(lower_half, negated=True)
+        if self._lower_half_size > 0:
+            goes_to_lower_half = (value, position) <= (-lower_half[0][0], -lower_half[0][1])
+        else:
+            # An empty lower half takes the key unless it belongs above the smallest key of the upper half
+            self._prune_median_heap(upper_half, negated=False)
+            goes_to_lower_half = self._upper_half_size == 0 or (value, position) <= upper_half[0]
+        if goes_to_lower_half:
+            heapq.heappush(lower_half, (-value, -position))
+            self._lower_half_size += 1
+        else:
+            heapq.heappush(upper_half, (value, position))
+            self._upper_half_size += 1
+        # Keep the lower half equal to or one larger than the upper half
+        if self._lower_half_size > self._upper_half_size + 1:
+            self._prune_median_heap(lower_half, negated=True)
+            negated_value, negated_position = heapq.heappop(lower_half)
+            heapq.heappush(upper_half, (-negated_value, -negated_position))
+            self._lower_half_size -= 1
+            self._upper_half_size += 1
+        elif self._upper_half_size > self._lower_half_size:
+            self._prune_median_heap(upper_half, negated=False)
+            heap_value, heap_position = heapq.heappop(upper_half)
+            heapq.heappush(lower_half, (-heap_value, -heap_position))
+            self._upper_half_size -= 1
+            self._lower_half_size += 1
+        # Drop keys which left the window when they pile up below the tops of the heaps
+        if len(lower_half) + len(upper_half) > 2 * self.window_size + 64:
+            self._rebuild_median_heaps()
+
     # def plot_history(self):
     #     """
     #     Plot the history of moving averages and medians.
@@ -113,13 +338,101 @@ class MovingAverage:
         """
         if new_window_size > self.max_window_size:
             raise ValueError(f'New window size {new_window_size} exceeds maximum of {self.max_window_size}.')
+        # Grow the ring buffer if it does not hold the new window twice
+        if self._ring_capacity(new_window_size) > len(self.values):
+            self._grow_ring(self._ring_capacity(new_window_size))
         if new_window_size < self.window_size:
             # Adjust cumulative sum when reducing window size
             for i in range(self.window_size - new_window_size):
-                self.cumulative_sum -= self.values[(self.index - self.window_size + i) % self.max_window_size]
+                self.cumulative_sum -= self.values[(self.index - self.window_size + i) & self._mask]
         else:
             # Adjust cumulative sum when increasing window size
             for i in range(new_window_size - self.window_size):
-                self.cumulative_sum += self.values[(self.index - new_window_size + i) % self.max_window_size]
+                self.cumulative_sum += self.values[(self.index - new_window_size + i) & self._mask]
         # Update the window size
-        self.window_size = new_window_size
\ No newline at end of file
+        self.window_size = new_window_size
+        if self._alpha_follows_window_size:
+            self.alpha = 2.0 / (new_window_size + 1)
+        self._recompute_weighted_sums()
+        self._rebuild_median_heaps()
+
+    def _grow_ring(self, capacity: int):
+        """
+        Move the values to a larger ring buffer. Positions older than the old ring retained
+        are filled with the initial value.
+        Args:
+            capacity (int): The new capacity, a power of two.
+        """
+        old_capacity = len(self.values)
+        values = array('d', [self._fill_value]) * capacity
+        values_weights = array('d', [1.0]) * capacity
+        mask = capacity - 1
+        for position in range(self._position - old_capacity, self._position):
+            values[position & mask] = self.values[position & self._mask]
+            values_weights[position & mask] = self.values_weights[position & self._mask]
+        self.values = values
+        self.values_weights = values_weights
+        self._mask = mask
+        self.index = self._position & mask
+
+    def checkpoint_state(self) -> dict:
+        """
+        Get the state of the moving average for a checkpoint.
+        The heaps of the rolling median are not stored, they are rebuilt from the window.
+        Returns:
+            dict: Scalars and arrays of the state.
+        """
+        return {
+            "mode": self.mode,
+            "window_size": self.window_size,
+            "max_window_size": self.max_window_size,
+            "fill_value": self._fill_value,
+            "values": self.values,
+            "values_weights": self.values_weights,
+            "index": self.index,
+            "position": self._position,
+            "cumulative_sum": self.cumulative_sum,
+            "weighted_sum": self.weighted_sum,
+            "weight_total": self.weight_total,
+            "alpha_follows_window_size": self._alpha_follows_window_size,
+            "alpha": self.alpha,
+            "exponential_sum": self._exponential_sum,
+            "exponential_weight": self._exponential_weight,
+            "history_size": self.history_size,
+            "history_policy": self.history_policy,
+            "history_stride": self.history_stride,
+            "values_until_history_record": self._values_until_history_record,
+            "history_of_moving_averages": self._history_of_moving_averages,
+            "history_of_medians": self._history_of_medians
+        }
+
+    @classmethod
+    def from_checkpoint_state(cls, state: dict) -> 'MovingAverage':
+        """
+        Create a moving average from a state returned by checkpoint_state.
+        Args:
+            state (dict): The state.
+        Returns:
+            MovingAverage: The moving average behaving exactly like the checkpointed one.
+        """
+        moving_average = cls(initial_value=state["fill_value"], window_size=state["window_size"],
+                             max_window_size=state["max_window_size"], history_size=state["history_size"],
+                             history_policy=state["history_policy"], mode=state["mode"],
+                             alpha=None if state["alpha_follows_window_size"] else state["alpha"])
+        moving_average.values = array('d', state["values"])
+        moving_average.values_weights = array('d', state["values_weights"])
+        moving_average._mask = len(moving_average.values) - 1
+        moving_average.index = state["index"]
+        moving_average._position = state["position"]
+        moving_average.cumulative_sum = state["cumulative_sum"]
+        moving_average.weighted_sum = state["weighted_sum"]
+        moving_average.weight_total = state["weight_total"]
+        moving_average.alpha = state["alpha"]
+        moving_average._exponential_sum = state["exponential_sum"]
+        moving_average._exponential_weight = state["exponential_weight"]
+        moving_average.history_stride = state["history_stride"]
+        moving_average._values_until_history_record = state["values_until_history_record"]
+        moving_average._history_of_moving_averages = array('d', state["history_of_moving_averages"])
+        moving_average._history_of_medians = array('d', state["history_of_medians"])
+        moving_average._rebuild_median_heaps()
+        return moving_average
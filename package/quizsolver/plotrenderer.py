@@ -0,0 +1,332 @@
+import queue
+import multiprocessing
+import numpy as np
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .statestore import StateStore
+
+# Layout of the strategy plots: the history of the moving average in the first row
+# and bars of the answers of the first questions in the remaining rows
+PLOT_ROWS = 5
+ANSWERS_PER_ROW = 400
+MAX_PLOTTED_ANSWERS = (PLOT_ROWS - 1) * ANSWERS_PER_ROW
+# Number of empty bars separating the answers of consecutive questions
+QUESTION_GAP = 4
+# Colors of the bars, snapshots refer to them by their index.
+# In the aggregated view a bar gets the color with the highest index among its answers.
+PALETTE = ("lightgray", "gray", "black", "cornflowerblue", "blue")
+PALETTE_INDEX = {color: index for index, color in enumerate(PALETTE)}
+# Half of the width of a bar
+BAR_HALF_WIDTH = 0.4
+
+
+def is_plot_aggregated(state: 'StateStore') -> bool:
+    """
+    Check if the answers of the question bank do not fit into the answer bars,
+    so every bar shows the average of a block of answers of the whole bank.
+    """
+    return state.answers_count + QUESTION_GAP * state.questions_count > MAX_PLOTTED_ANSWERS
+
+
+def create_answer_bars(state: 'StateStore', values: np.ndarray,
+                       colors: np.ndarray) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Lay out the values of the answers as answer bars.
+    If the bank fits, every answer gets its own bar and the answers of consecutive questions
+    are separated by QUESTION_GAP empty bars. Otherwise every bar aggregates a block
+    of consecutive answers of the whole bank: its height is the mean of their values
+    and its color the color with the highest index in PALETTE among them.
+    Args:
+        state (StateStore): State store of the quiz solver.
+        values (ndarray): Bar height of each answer, indexed by answer id.
+        colors (ndarray): Index of the bar color in PALETTE of each answer.
+    Returns:
+        tuple: Heights (float32) and color indices (uint8) of MAX_PLOTTED_ANSWERS bars
+        and the number of answers per bar.
+    """
+    heights = np.zeros(MAX_PLOTTED_ANSWERS, dtype=np.float32)
+    bar_colors = np.full(MAX_PLOTTED_ANSWERS, PALETTE_INDEX["black"], dtype=np.uint8)
+    answers_count = len(values)
+    if answers_count == 0:
+        return heights, bar_colors, 1
+    if is_plot_aggregated(state):
+        answers_per_bar = -(-answers_count // MAX_PLOTTED_ANSWERS)
+        starts = np.arange(0, answers_count, answers_per_bar)
+        sizes = np.diff(np.append(starts, answers_count))
+        heights[:len(starts)] = np.add.reduceat(values, starts) / sizes
+        bar_colors[:len(starts)] = np.maximum.reduceat(colors, starts)
+        return heights, bar_colors, answers_per_bar
+    # Every question takes the bars of its answers and QUESTION_GAP empty bars
+    offsets = np.frombuffer(state.question_offsets, dtype=np.int64)
+    answer_ids = np.arange(answers_count)
+    question_ids = np.searchsorted(offsets, answer_ids, side='right') - 1
+    heights[answer_ids + QUESTION_GAP * question_ids] = values
+    bar_colors[answer_ids + QUESTION_GAP * question_ids] = colors
+    ends = np.append(offsets[1:], state.answers_count)
+    gaps = (ends + QUESTION_GAP * np.arange(len(offsets)))[:, None] + np.arange(QUESTION_GAP)
+    bar_colors[gaps.ravel()] = PALETTE_INDEX["lightgray"]
+    return heights, bar_colors, 1
+
+def create_plot_snapshot(*, title: str, label: str, history: list[float], state: 'StateStore',
+                         values: np.ndarray, colors: np.ndarray) -> dict:
+    """
+    Create a compact snapshot of the data of a strategy plot.
+    Args:
+        title (str): Title of the first subplot.
+        label (str): Label of the moving average history.
+        history (list of float): History of the moving average.
+        state (StateStore): State store of the quiz solver.
+        values (ndarray): Bar height of each answer, indexed by answer id.
+        colors (ndarray): Index of the bar color in PALETTE of each answer.
+    Returns:
+        dict: The snapshot.
+    """
+    heights, bar_colors, answers_per_bar = create_answer_bars(state, values, colors)
+    if answers_per_bar > 1:
+        title += f' ({answers_per_bar} answers per bar)'
+    return {
+        "title": title,
+        "label": label,
+        "history": np.asarray(history, dtype=np.float64),
+        "heights": heights,
+        "colors": bar_colors
+    }
+
+
+def _axis_top(value: float) -> float:
+    """
+    Get the upper limit of an axis showing values up to the given value,
+    rounded up to a power of two so the limit changes rarely.
+    """
+    return 2.0 ** max(0, int(np.ceil(np.log2(max(value, 1.0)))))
+
+
+class PlotCanvas:
+    def __init__(self, figure, axes: list):
+        """
+        Initialize persistent artists of a strategy plot in a figure with PLOT_ROWS subplots.
+        The artists are created once and updated in place by draw(). Only the artists
+        are redrawn and blitted over the cached background of the figure; the whole figure
+        is redrawn when the limits of the axes have to change.
+        Args:
+            figure (Figure): The figure.
+            axes (list): Axes of the figure.
+        """
+        from matplotlib.collections import PolyCollection
+        from matplotlib.colors import to_rgba_array
+        self.figure = figure
+        self.axes = axes
+        self.full_redraws: int = 0
+        self._rgba_palette = to_rgba_array(PALETTE, alpha=0.7)
+        self._background = None
+        # First subplot: history of the moving average
+        self._title = axes[0].set_title("")
+        self._line, = axes[0].plot([], [], color='blue')
+        self._history_limits = (0.0, 1.0, 0.0)
+        axes[0].set_xlim(0, 1)
+        axes[0].set_ylim(0, 1)
+        # Other subplots: bars of the answers, each bar is a rectangle of a polygon collection
+        # with the corners (x - w, 0), (x - w, h), (x + w, h), (x + w, 0)
+        x = np.arange(ANSWERS_PER_ROW, dtype=np.float64)
+        self._vertices = np.zeros((PLOT_ROWS - 1, ANSWERS_PER_ROW, 4, 2))
+        self._vertices[:, :, 0:2, 0] = (x - BAR_HALF_WIDTH)[:, None]
+        self._vertices[:, :, 2:4, 0] = (x + BAR_HALF_WIDTH)[:, None]
+        self._bars = []
+        self._bar_tops = [1.0] * (PLOT_ROWS - 1)
+        for i in range(1, PLOT_ROWS):
+            axes[i].xaxis.set_visible(False)
+            axes[i].set_xlim(-1, ANSWERS_PER_ROW)
+            axes[i].set_ylim(0, 1)
+            bars = PolyCollection(self._vertices[i - 1], linewidths=0)
+            axes[i].add_collection(bars)
+            self._bars.append(bars)
+        self._artists = [self._title, self._line, *self._bars]
+        for artist in self._artists:
+            artist.set_animated(True)
+        figure.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        """
+        Cache the background after the whole figure is drawn and draw the artists on it.
+        """
+        self._background = self.figure.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        """
+        Draw the artists into their axes.
+        """
+        self.axes[0].draw_artist(self._title)
+        self.axes[0].draw_artist(self._line)
+        for i, bars in enumerate(self._bars, start=1):
+            self.axes[i].draw_artist(bars)
+
+    def _update_limits(self, history: np.ndarray, heights: np.ndarray) -> bool:
+        """
+        Change the limits of the axes if the data does not fit them or uses only a small part of them.
+        Returns:
+            bool: True if any limit changed.
+        """
+        changed = False
+        x_max, y_max, y_min = self._history_limits
+        if len(history) > 0:
+            low, high = float(history.min()), float(history.max())
+            if len(history) > x_max or low < y_min or high > y_max:
+                x_max = max(x_max, 2.0 ** np.ceil(np.log2(len(history))))
+                margin = max(high - low, 0.1) * 0.25
+                y_min, y_max = min(y_min, low - margin), max(y_max, high + margin)
+                self.axes[0].set_xlim(0, x_max)
+                self.axes[0].set_ylim(y_min, y_max)
+                self._history_limits = (x_max, y_max, y_min)
+                changed = True
+        for i, row_max in enumerate(heights.max(axis=1)):
+            top = _axis_top(float(row_max))
+            if top != self._bar_tops[i]:
+                self.axes[i + 1].set_ylim(0, top)
+                self._bar_tops[i] = top
+                changed = True
+        return changed
+
+    def draw(self, snapshot: dict):
+        """
+        Update the artists with a snapshot and show them.
+        Args:
+            snapshot (dict): The snapshot created by create_plot_snapshot.
+        """
+        canvas = self.figure.canvas
+        redraw = self._background is None or not canvas.supports_blit
+        # First subplot
+        self._title.set_text(snapshot["title"])
+        history = snapshot["history"]
+        self._line.set_data(np.arange(len(history)), history)
+        if self._line.get_label() != snapshot["label"]:
+            self._line.set_label(snapshot["label"])
+            self.axes[0].legend(handles=[self._line])
+            redraw = True
+        # Other subplots
+        heights = snapshot["heights"].reshape(PLOT_ROWS - 1, ANSWERS_PER_ROW)
+        colors = self._rgba_palette[snapshot["colors"]].reshape(PLOT_ROWS - 1, ANSWERS_PER_ROW, 4)
+        self._vertices[:, :, 1:3, 1] = heights[:, :, None]
+        for bars, vertices, row_colors in zip(self._bars, self._vertices, colors):
+            bars.set_verts(vertices)
+            bars.set_facecolors(row_colors)
+        redraw = self._update_limits(history, heights) or redraw
+        if redraw:
+            # Draws the background and then the artists in _on_draw
+            canvas.draw()
+            self.full_redraws += 1
+        else:
+            canvas.restore_region(self._background)
+            self._draw_artists()
+            canvas.blit(self.figure.bbox)
+        canvas.flush_events()
+
+
+def _render_plot_snapshots(snapshots: multiprocessing.Queue):
+    """
+    Main loop of the renderer process. Draws the latest snapshot from the queue
+    until None is received.
+    Args:
+        snapshots (Queue): Queue of snapshots.
+    """
+    import matplotlib.pyplot as plt
+    figure, axes = plt.subplots(PLOT_ROWS, 1, figsize=(13, 5.5))
+    canvas = PlotCanvas(figure, axes)
+    plt.show(block=False)
+    while True:
+        try:
+            snapshot = snapshots.get(timeout=0.1)
+        except queue.Empty:
+            # Keep the window responsive while waiting for snapshots
+            figure.canvas.flush_events()
+            continue
+        # Skip snapshots which are already outdated
+        while snapshot is not None:
+            try:
+                snapshot = snapshots.get_nowait()
+            except queue.Empty:
+                break
+        if snapshot is None:
+            break
+        canvas.draw(snapshot)
+    plt.close(figure)
+
+
+class PlotRenderer:
+    def __init__(self, *, queue_size: int = 2):
+        """
+        Initialize a renderer drawing snapshots of strategy plots in a separate process.
+        The solver publishes snapshots without waiting for the renderer. When the renderer
+        falls behind and the queue is full, the snapshot is dropped.
+        Args:
+            queue_size (int): Maximum number of snapshots waiting for the renderer.
+        """
+        if queue_size < 1:
+            raise ValueError(f"Invalid queue_size: {queue_size}. Queue size must be positive.")
+        self.queue_size = queue_size
+        self.published_frames: int = 0
+        self.dropped_frames: int = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._snapshots: multiprocessing.Queue | None = None
+        self._process: multiprocessing.Process | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if the renderer process is running.
+        """
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        """
+        Start the renderer process if it was not started yet.
+        """
+        if self._process is not None:
+            return
+        self._snapshots = self._context.Queue(maxsize=self.queue_size)
+        self._process = self._context.Process(target=_render_plot_snapshots, args=(self._snapshots,),
+                                              name="QuizSolverPlotRenderer", daemon=True)
+        self._process.start()
+
+    def publish(self, snapshot: dict) -> bool:
+        """
+        Hand a snapshot over to the renderer process without waiting.
+        Snapshots are dropped if the renderer is behind or not running anymore
+        (e.g. its window could not be opened), the renderer is not restarted.
+        Args:
+            snapshot (dict): The snapshot created by create_plot_snapshot.
+        Returns:
+            bool: True if the snapshot was queued, False if it was dropped.
+        """
+        self.start()
+        if self._process.exitcode is not None:
+            self.dropped_frames += 1
+            return False
+        try:
+            self._snapshots.put_nowait(snapshot)
+        except queue.Full:
+            self.dropped_frames += 1
+            return False
+        self.published_frames += 1
+        return True
+
+    def close(self, *, timeout: float = 1.0):
+        """
+        Stop the renderer process.
+        Args:
+            timeout (float): Seconds to wait for the renderer to finish before it is terminated.
+        """
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            try:
+                self._snapshots.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+        self._snapshots.close()
+        self._process = None
+        self._snapshots = None
@@ -9,16 +9,47 @@ if TYPE_CHECKING:
 
 
 class Question:
+    __slots__ = ("_raw_question", "is_solved", "answers", "index", "answer_offset", "_response_template")
+
     def __init__(self, *, quizsolver: 'QuizSolver', quiz_question: dict):
-        self._quizsolver = quizsolver
-        self._raw_question = RawQuestion(quiz_question=quiz_question, parent_question=self)
-        self.type: RawQuestionType = self._raw_question.type
+        self._raw_question = RawQuestion(quiz_question=quiz_question, parent_question=self,
+                                         hash_function=quizsolver.hash_function)
         self.is_solved: bool = False
         self.answers: list[Answer] = []
-        # custom data for strategies
-        self.data: dict = {}
+        # dense question id and id of the first answer assigned by the state store
+        # (state of strategies is stored there)
+        self.index: int = -1
+        self.answer_offset: int = -1
+        # parts of the response dictionaries which do not change, built when the question is answered in a batch
+        self._response_template: tuple | None = None
         self.process_raw_answers()
 
+    @classmethod
+    def restore(cls, *, question_text: str, type: RawQuestionType, raw_hash_bytes: bytes, uid_bytes: bytes,
+                answer_texts: list[str], answer_uids: list[bytes]) -> 'Question':
+        """
+        Create a question from stored texts, hashes and uids without hashing the texts again.
+        Args:
+            question_text (str): Text of the question.
+            type (RawQuestionType): Type of the question.
+            raw_hash_bytes (bytes): Raw hash of the question.
+            uid_bytes (bytes): Unique identifier of the question.
+            answer_texts (list of str): Texts of the raw answers.
+            answer_uids (list of bytes): Unique identifiers of the raw answers.
+        Returns: The question with answers built from the raw answers (ids are not assigned).
+        """
+        question = cls.__new__(cls)
+        question._raw_question = RawQuestion.restore(parent_question=question, question_text=question_text,
+                                                     type=type, raw_hash_bytes=raw_hash_bytes, uid_bytes=uid_bytes,
+                                                     answer_texts=answer_texts, answer_uids=answer_uids)
+        question.is_solved = False
+        question.answers = []
+        question.index = -1
+        question.answer_offset = -1
+        question._response_template = None
+        question.process_raw_answers()
+        return question
+
     def process_raw_answers(self):
         """
         Process raw answers to create Answer objects.
@@ -49,6 +80,14 @@ class Question:
             self.is_solved = True
             self.answers[0].is_correct = True
 
+    @property
+    def type(self) -> RawQuestionType:
+        """
+        Get the type of the question.
+        Returns: Question type.
+        """
+        return self._raw_question.type
+
     @property
     def question_text(self) -> str:
         """
@@ -74,6 +113,14 @@ class Question:
         Returns: Unique identifier as a string.
         """
         return self._raw_question.uid
+
+    @property
+    def uid_bytes(self) -> bytes:
+        """
+        Get the unique identifier of the question as raw digest bytes.
+        Returns: Unique identifier as bytes.
+        """
+        return self._raw_question.uid_bytes
     
     def to_dict(self, strategy_name: str = "") -> dict:
         """
@@ -85,25 +132,74 @@ class Question:
             answers += answer.to_dict()
         return {
             "uid": self.uid,
-            "question": self._raw_question._original_value["question"],
+            "question": self._raw_question.question_text,
             "is_solved": self.is_solved,
             "type": self.type,
             "answers": [answer.to_dict() for answer in self.answers]
         }
     
-    def to_response_dict(self, *, strategy_name: str, most_probable_key: str = "most_probable") -> dict:
+    def to_response_dict(self, *, most_probable_answer: Answer) -> dict:
         """
         Get dictionary representation of the question for response.
+        Args:
+            most_probable_answer (Answer): The answer marked as correct in the response.
         Returns: Dictionary with question details and answers for response.
         """
         answers: list[dict] = []
         for answer in self.answers:
-            answers += answer.to_response_list_of_raw_answers(strategy_name=strategy_name,
-                                                              most_probable_key=most_probable_key)
+            answers += answer.to_response_list_of_raw_answers(is_most_probable=answer is most_probable_answer)
         return {
             "uid": self.uid,
-            "question": self._raw_question._original_value["question"],
+            "question": self._raw_question.question_text,
             "is_solved": self.is_solved,
             "type": self.type.value,
             "answers": answers
-        }
\ No newline at end of file
+        }
+
+    def response_template(self) -> tuple:
+        """
+        Get the parts of the response dictionary which do not depend on the most probable answer.
+        The template is built on first use and kept with the question.
+        Returns: Tuple of the uid, the question text, the type value, the raw answer dictionaries
+            of all answers marked as incorrect (in the order of to_response_dict) and the range
+            of the raw answer dictionaries of each answer.
+        """
+        if self._response_template is None:
+            incorrect_answers: list[dict] = []
+            ranges = []
+            for answer in self.answers:
+                start = len(incorrect_answers)
+                incorrect_answers += answer.to_response_list_of_raw_answers(is_most_probable=False)
+                ranges.append((start, len(incorrect_answers)))
+            self._response_template = (self.uid, self._raw_question.question_text, self.type.value,
+                                       incorrect_answers, tuple(ranges))
+        return self._response_template
+
+    @staticmethod
+    def to_response_dicts(questions: list['Question'], *, answer_positions: list[int]) -> list[dict]:
+        """
+        Get response dictionaries of a whole quiz from the response templates of its questions.
+        The dictionaries are equal to the ones of to_response_dict, but the raw answer dictionaries
+        of incorrect answers are shared between responses and must not be modified.
+        Args:
+            questions (list of Question): The questions of the quiz.
+            answer_positions (list of int): Position of the most probable answer in the answers of each question.
+        Returns: List of dictionaries for response in the order of the questions.
+        """
+        result = []
+        append = result.append
+        for question, position in zip(questions, answer_positions):
+            template = question._response_template or question.response_template()
+            uid, question_text, type_value, incorrect_answers, ranges = template
+            start, end = ranges[position]
+            append({
+                "uid": uid,
+                "question": question_text,
+                "is_solved": question.is_solved,
+                "type": type_value,
+                "answers": incorrect_answers[:start] +
+                           [{"answer": raw_answer["answer"], "correct": True}
+                            for raw_answer in incorrect_answers[start:end]] +
+                           incorrect_answers[end:]
+            })
+        return result
@@ -1,6 +1,14 @@
 import random
+import numpy as np
 from .common import RawQuestionType
 
+# Question types in the order of the codes stored by the compact question bank
+_QUESTION_TYPES = (RawQuestionType.CHOOSE_ONE.value,
+                   RawQuestionType.CHOOSE_ONE_OR_MORE.value,
+                   RawQuestionType.CHOOSE_ZERO_OR_MORE.value)
+# Number of latest quizzes whose question indexes are kept for scoring
+MAX_PENDING_QUIZZES = 1024
+
 
 class QuizGenerator:
     def __init__(self, *, questions_count: int = 200,
@@ -8,43 +16,64 @@ class QuizGenerator:
                  max_answers_per_question: int = 4, 
                  probability_of_choose_one_type: float = 1.0,
                  probability_of_choose_one_or_more_type: float = 0.0, 
-                 probability_of_choose_zero_or_more_type: float = 0.0):
+                 probability_of_choose_zero_or_more_type: float = 0.0,
+                 compact: bool = False,
+                 random_generator: random.Random | None = None,
+                 numpy_generator: np.random.Generator | None = None):
         """
         Initialize the QuizGenerator with a specified number of questions.
         Each question will have a random number of answers between min_answers and max_answers.
+        A compact generator keeps only the answer counts, the question types and the correct
+        answers in NumPy arrays, and creates the texts of a question when it is drawn into a quiz.
+        It builds a bank of a million questions in a fraction of a second, but questions_dict
+        and questions_list stay empty (see get_question).
+        Questions and quizzes are drawn by random_generator, the random module if none is given.
+        The compact bank is drawn by numpy_generator, which is seeded from random_generator if none is given.
         """
         # Initialize internal data structures
         self.questions_count = questions_count
+        self.compact = compact
+        self.random: random.Random = random_generator if random_generator is not None else random
         self.questions_dict: dict = {}
         self.questions_list: list[dict] = []
+        # Question indexes of the quizzes handed out and not scored yet by quiz id
+        self._pending_quizzes: dict[int, np.ndarray] = {}
+        self._next_quiz_id: int = 0
         total_probability = (probability_of_choose_one_type +
                              probability_of_choose_one_or_more_type +
                              probability_of_choose_zero_or_more_type)
+        if compact:
+            if numpy_generator is None:
+                numpy_generator = np.random.default_rng(self.random.getrandbits(64))
+            self._generate_compact_bank(numpy_generator, min_answers_per_question, max_answers_per_question,
+                                        probability_of_choose_one_type, probability_of_choose_one_or_more_type,
+                                        total_probability)
+            return
         # Generate questions
         for i in range(questions_count):
-            num_answers = random.randint(min_answers_per_question, max_answers_per_question)
-            random_value = random.uniform(0, total_probability)
+            num_answers = self.random.randint(min_answers_per_question, max_answers_per_question)
+            random_value = self.random.uniform(0, total_probability)
             question_type = None
             if random_value < probability_of_choose_one_type:
-                correct_answer_indexes = [random.randint(0, num_answers - 1)]
+                correct_answer_indexes = [self.random.randint(0, num_answers - 1)]
                 question_type = RawQuestionType.CHOOSE_ONE.value
             elif random_value < (probability_of_choose_one_type + probability_of_choose_one_or_more_type):
-                correct_answer_indexes = random.sample(range(num_answers), random.randint(1, num_answers))
+                correct_answer_indexes = self.random.sample(range(num_answers), self.random.randint(1, num_answers))
                 question_type = RawQuestionType.CHOOSE_ONE_OR_MORE.value
             else:
-                correct_answer_indexes = random.sample(range(num_answers), random.randint(0, num_answers))
+                correct_answer_indexes = self.random.sample(range(num_answers), self.random.randint(0, num_answers))
                 question_type = RawQuestionType.CHOOSE_ZERO_OR_MORE.value
             # Generate answers
             answers = []
             for j in range(num_answers):
                 if j in correct_answer_indexes:
                     answers.append({
-                        "answer": f"1 * {i} ~= {i + random.uniform(0.1111, 0.11119)}",
+                        "answer": f"1 * {i} ~= {i + self.random.uniform(0.1111, 0.11119)}",
                         "correct": True
                     })
                 else:
                     answers.append({
-                        "answer": f"1 * {i} ~= {i + random.randint(1, 1000) + random.uniform(0.0, 0.00009)}",
+                        "answer": f"1 * {i} ~= {i + self.random.randint(1, 1000) + self.random.uniform(0.0, 0.00009)}",
                         "correct": False
                     })
             # Generate question
@@ -56,27 +85,127 @@ class QuizGenerator:
             # Store question in both dict and list
             self.questions_dict[f"1 * {i} ~= ?"] = question
             self.questions_list.append(question)
+        # Answer counts, offsets and correct flags of the answers for scoring, like the compact bank
+        self._question_indexes = {question["question"]: i for i, question in enumerate(self.questions_list)}
+        self.answer_counts = np.fromiter((len(question["answers"]) for question in self.questions_list),
+                                         dtype=np.int64, count=questions_count)
+        self.answer_offsets = np.zeros(questions_count + 1, dtype=np.int64)
+        np.cumsum(self.answer_counts, out=self.answer_offsets[1:])
+        self.correct_answers = np.fromiter((answer["correct"] for question in self.questions_list
+                                            for answer in question["answers"]),
+                                           dtype=np.bool_, count=int(self.answer_offsets[-1]))
+
+    def _generate_compact_bank(self, generator: np.random.Generator,
+                               min_answers_per_question: int, max_answers_per_question: int,
+                               probability_of_choose_one_type: float,
+                               probability_of_choose_one_or_more_type: float, total_probability: float):
+        """
+        Generate the compact question bank: the number of answers and the type code of every question,
+        offsets of the answers of every question and one correct flag per answer.
+        """
+        questions_count = self.questions_count
+        self.answer_counts = generator.integers(min_answers_per_question, max_answers_per_question + 1,
+                                                size=questions_count, dtype=np.int64)
+        self.answer_offsets = np.zeros(questions_count + 1, dtype=np.int64)
+        np.cumsum(self.answer_counts, out=self.answer_offsets[1:])
+        random_values = generator.uniform(0, total_probability, size=questions_count)
+        self.question_types = np.full(questions_count, 2, dtype=np.int8)
+        self.question_types[random_values < probability_of_choose_one_type + probability_of_choose_one_or_more_type] = 1
+        self.question_types[random_values < probability_of_choose_one_type] = 0
+        answers_count = int(self.answer_offsets[-1])
+        answer_questions = np.repeat(np.arange(questions_count), self.answer_counts)
+        self.correct_answers = np.zeros(answers_count, dtype=np.bool_)
+        # Choose one: one random correct answer
+        choose_one = np.flatnonzero(self.question_types == 0)
+        correct_indexes = (generator.random(len(choose_one)) * self.answer_counts[choose_one]).astype(np.int64)
+        self.correct_answers[self.answer_offsets[choose_one] + correct_indexes] = True
+        # Choose one or more and zero or more: a random number of correct answers in random positions,
+        # the answers ranked by a random key below the number are correct
+        if len(choose_one) == questions_count:
+            return
+        correct_counts = generator.integers((self.question_types == 1).astype(np.int64), self.answer_counts + 1)
+        # Answers are grouped by question, the question index added to the key sorts them by question first
+        order = np.argsort(answer_questions + generator.random(answers_count))
+        ranks = np.empty(answers_count, dtype=np.int64)
+        ranks[order] = np.arange(answers_count) - self.answer_offsets[answer_questions[order]]
+        self.correct_answers |= (ranks < correct_counts[answer_questions]) & \
+            (self.question_types[answer_questions] != 0)
+
+    @staticmethod
+    def _answer_text(index: int, answer_index: int, correct: bool) -> str:
+        """
+        Create the text of an answer of the compact question bank. The texts are unique within
+        the question and the same every time the question is drawn.
+        """
+        if correct:
+            return f"1 * {index} ~= {index}.1111{answer_index}"
+        return f"1 * {index} ~= {index + answer_index + 1}.0000{answer_index}"
+
+    def _question_index(self, question: str) -> int:
+        """
+        Get the index of a question of the bank from its text.
+        The compact question bank parses the index from the text "1 * {index} ~= ?".
+        """
+        if self.compact:
+            return int(question[4:-5])
+        return self._question_indexes[question]
+
+    def get_question(self, index: int) -> dict:
+        """
+        Get a question of the bank with its type and the correct fields of its answers.
+        Args:
+            index (int): Index of the question in the bank.
+        Returns:
+            dict: The question in the format of questions_list.
+        """
+        if not self.compact:
+            return self.questions_list[index]
+        start = int(self.answer_offsets[index])
+        correct_answers = self.correct_answers[start:int(self.answer_offsets[index + 1])].tolist()
+        return {
+            "question": f"1 * {index} ~= ?",
+            "answers": [{"answer": self._answer_text(index, j, correct), "correct": correct}
+                        for j, correct in enumerate(correct_answers)],
+            "type": _QUESTION_TYPES[self.question_types[index]]
+        }
 
     def generate_quiz(self, *, num_questions: int) -> dict:
         """
         Get a quiz with the specified number of questions.
         Questions are randomly selected from the questions_dict.
         Parameter is_corrrect is removed from the result.
+        The quiz has an "id", which QuizSolver.give_answers returns in the response,
+        so the score is computed from the indexes of the questions instead of their texts.
         """
         if num_questions > self.questions_count:
             raise ValueError("Requested number of questions exceeds available questions.")
-        # Randomly select questions
-        selected_questions = random.sample(self.questions_list, num_questions)
-        quiz = {"questions": []}
+        # Randomly select questions, the same draw as from questions_list
+        indexes = self.random.sample(range(self.questions_count), num_questions)
+        quiz = {"id": self._next_quiz_id, "questions": []}
+        self._pending_quizzes[self._next_quiz_id] = np.array(indexes, dtype=np.int64)
+        self._next_quiz_id += 1
+        if len(self._pending_quizzes) > MAX_PENDING_QUIZZES:
+            del self._pending_quizzes[next(iter(self._pending_quizzes))]
+        if self.compact:
+            # The texts are created for the selected questions only
+            answer_offsets = self.answer_offsets
+            for i in indexes:
+                quiz["questions"].append({
+                    "question": f"1 * {i} ~= ?",
+                    "answers": [{"answer": self._answer_text(i, j, correct)} for j, correct in
+                                enumerate(self.correct_answers[answer_offsets[i]:answer_offsets[i + 1]].tolist())]
+                })
+            return quiz
         # Prepare quiz structure without 'correct' field
-        for q in selected_questions:
+        for i in indexes:
+            q = self.questions_list[i]
             question_copy = {
                 "question": q["question"],
                 "answers": [{"answer": a["answer"]} for a in q["answers"]]
             }
             quiz["questions"].append(question_copy)
         return quiz
-    
+
     def compute_score(self, *, quiz: dict) -> float:
         """
         Calculate the score of the quiz based on correct answers.
@@ -86,19 +215,46 @@ class QuizGenerator:
         Returns:
             float: The score as a float between 0 and 1.
         """
-        correctly_answered = 0
-        # Evaluate each question
-        for q in quiz["questions"]:
-            original_question = self.questions_dict[q["question"]]
-            answer_is_valid = True
-            # Check each answer
-            for given_answer_index, given_answer in enumerate(q["answers"]):
-                if given_answer["correct"] != original_question["answers"][given_answer_index]["correct"]:
-                    answer_is_valid = False
-                    break
-            # If all answers are correct, increment the count
-            if answer_is_valid:
-                correctly_answered += 1
-        # Calculate score
-        score = correctly_answered / len(quiz["questions"])
-        return score          
\ No newline at end of file
+        return self.compute_scores(quizzes=[quiz])[0]
+
+    def compute_scores(self, *, quizzes: list[dict]) -> list[float]:
+        """
+        Calculate the scores of many quizzes at once.
+        The given correct fields of all quizzes are compared with the correct answers of the bank
+        in one array operation. The questions of a quiz with a known "id" are found by their indexes,
+        of other quizzes by their texts.
+        Parameters:
+            quizzes (list of dict): The quiz structures with user's answers including 'correct' fields.
+        Returns:
+            list of float: The scores as floats between 0 and 1 in the order of the quizzes.
+        """
+        indexes = []
+        questions_per_quiz = []
+        for quiz in quizzes:
+            questions = quiz["questions"]
+            quiz_indexes = self._pending_quizzes.pop(quiz.get("id"), None)
+            if quiz_indexes is None or len(quiz_indexes) != len(questions):
+                quiz_indexes = np.fromiter((self._question_index(q["question"]) for q in questions),
+                                           dtype=np.int64, count=len(questions))
+            indexes.append(quiz_indexes)
+            questions_per_quiz.append(len(questions))
+        indexes = np.concatenate(indexes) if indexes else np.zeros(0, dtype=np.int64)
+        answer_counts = self.answer_counts[indexes]
+        given_counts = np.fromiter((len(q["answers"]) for quiz in quizzes for q in quiz["questions"]),
+                                   dtype=np.int64, count=len(indexes))
+        if not np.array_equal(given_counts, answer_counts):
+            raise ValueError("Answered questions must have all answers of the questions in the quiz.")
+        answers_count = int(answer_counts.sum())
+        given_answers = np.fromiter((a["correct"] for quiz in quizzes for q in quiz["questions"]
+                                     for a in q["answers"]), dtype=np.bool_, count=answers_count)
+        # Position of every given answer in the correct answers of the bank
+        answer_questions = np.repeat(np.arange(len(indexes)), answer_counts)
+        answer_positions = np.arange(answers_count) + \
+            (self.answer_offsets[indexes] - (np.cumsum(answer_counts) - answer_counts))[answer_questions]
+        # A question is answered correctly if none of its answers differs
+        incorrectly_answered = np.zeros(len(indexes), dtype=np.bool_)
+        incorrectly_answered[answer_questions[given_answers != self.correct_answers[answer_positions]]] = True
+        quiz_of_questions = np.repeat(np.arange(len(quizzes)), questions_per_quiz)
+        correctly_answered = np.bincount(quiz_of_questions[~incorrectly_answered], minlength=len(quizzes))
+        # Calculate scores
+        return [correct / questions for correct, questions in zip(correctly_answered.tolist(), questions_per_quiz)]
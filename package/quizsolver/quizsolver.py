@@ -1,44 +1,81 @@
+import os
 import datetime
+import gc
+import math
+import time
 import random
 import json
-import matplotlib.pyplot as plt
+from array import array
 from dataclasses import dataclass
-from .common import epsilon
+from .common import epsilon, question_fingerprint, create_hash_function
 from .quizsolversetup import QuizSolverSetup
 from .quizsolverstatistics import QuizSolverStatistics
 from .rawquestion import RawQuestion
 from .question import Question
 from .answer import Answer
+from .checkpoint import QuestionBankColumns, write_checkpoint, read_checkpoint, random_state_dict, \
+    random_state_from_dict
+from .journal import Journal, read_journal
+from .knowledgebase import KnowledgeBase
 from .movingaverage import MovingAverage
+from .plotrenderer import PlotRenderer
+from .statestore import StateStore
+from .statusrenderer import StatusRenderer
 from .strategy import Strategy
 from .strategyw import StrategyW
 from .strategyl import StrategyL
 from .strategya import StrategyA
 from .strategyb import StrategyB
-from consoledraw import Console
 
 
 class QuizSolver:
-    def __init__(self, *, setup: QuizSolverSetup, strategy_in_use: str):
+    def __init__(self, *, setup: QuizSolverSetup, strategy_in_use: str,
+                 random_generator: random.Random | None = None):
         # Initialize the QuizSolver with the provided QuizSetup.
         self.setup = setup
+        # Random generator of the quiz solver and its strategies, the random module if none is given.
+        # A run with a seeded generator is reproducible and independent of other runs.
+        self.random: random.Random = random_generator if random_generator is not None else random
         self.statistics = QuizSolverStatistics()
-        self.console = Console(hideCursor=False)
+        # Renderer of console statistics is created when it is used for the first time
+        self._status_renderer: StatusRenderer | None = None
+        # Renderer process of plots is started when plots are rendered for the first time
+        self._plot_renderer: PlotRenderer | None = None
         self.latest_result: dict = {}
         # Current epoch of the solving process.
         self.epoch: int = 0
         # Initialize main question dictionary and moving average tracker.
-        self.questions: dict[str, Question] = {}
+        # Questions are keyed by the raw digest bytes of their uid.
+        self.questions: dict[bytes, Question] = {}
+        self.hash_function = create_hash_function(setup.hash_algorithm, setup.hash_digest_size)
+        # Per-strategy state of all questions and answers (strategies register their columns).
+        self.state = StateStore()
+        # Fingerprints of already seen quiz questions pointing to questions in the main dictionary.
+        self._questions_by_fingerprint: dict[tuple, Question] = {}
         self.waiting_for_score_feedback: bool = False
-        # Timestamp of the latest quiz processed.
-        self.console_redrawn_at: datetime.datetime = datetime.datetime.min
-        self.plots_rendered_at: datetime.datetime = datetime.datetime.min
+        # Monotonic time of the latest plot rendering.
+        self.plots_rendered_at: float = -math.inf
         # self.avg_quiz_questions_count: MovingAverage
         # self.avg_quiz_answers_count: MovingAverage
         # self.avg_quiz_probability_baseline: MovingAverage
         # Store the latest quiz as a dictionary of questions.
         self._latest_quiz: list[Question] = []
         self._latest_response: list[Question] = []
+        # Encoded texts and uids of the question bank, kept between checkpoints
+        self._checkpoint_bank: QuestionBankColumns | None = None
+        # Journal of the changes since the latest checkpoint, opened when the first change is recorded
+        self._journal: Journal | None = None
+        # Sequence number of the latest journal record
+        self._journal_sequence: int = 0
+        # State of the random generator after the latest journaled call (None forces storing it)
+        self._journal_random_state: tuple | None = None
+        self._replaying_journal: bool = False
+        # Knowledge base of solved questions shared between runs, opened when it is used for the first time
+        self._knowledge_base: KnowledgeBase | None = None
+        # Questions solved since the knowledge base was updated
+        self._questions_solved_since_update: list[Question] = []
+        # Number of new questions which started solved thanks to the knowledge base
+        self.questions_from_knowledge_base: int = 0
         self.strategies: dict[str,Strategy] = {
             "Winner": StrategyW(quizsolver=self, name="Winner"),
             "Looser": StrategyL(quizsolver=self, name="Looser"),
@@ -57,12 +94,9 @@ class QuizSolver:
         """
         # Analyze quiz structure
         statistics = self.statistics
-        # Calculate total number of questions and answers
-        questions_total = len(self.questions)
-        if questions_total != statistics["questions_total"]:
-            answers_total = sum(len(q.answers) for q in self.questions.values())
-        else:
-            answers_total = statistics["answers_total"]
+        # Total number of questions and answers is maintained by the state store
+        questions_total = self.state.questions_count
+        answers_total = self.state.answers_count
         len_questions_in_latest_quiz = len(self._latest_quiz)
         len_answers_in_latest_quiz = sum(len(q.answers) for q in self._latest_quiz)
         # Update finished_at if needed
@@ -94,21 +128,119 @@ class QuizSolver:
         Returns:
             RawQuestion: The solved raw question.
         """
-        question = Question(quizsolver=self, quiz_question=quiz_question)
-        # Add question to the main questions dictionary if not already present.
-        if not question.uid in self.questions:
-            # Initialize strategies for the question
-            for strategy in self.strategies.values():
-                strategy.initialize_question(question=question)
-            self.questions[question.uid] = question
-        # Retrieve the question from the main dictionary
-        question = self.questions[question.uid]
+        journal = self.journal
+        if journal is not None:
+            random_state = self._random_state_change()
+            questions_count = self.state.questions_count
+        # Resolve already known questions by their fingerprint without building a new Question.
+        fingerprint = question_fingerprint(quiz_question)
+        question = self._questions_by_fingerprint.get(fingerprint)
+        if question is None:
+            question = self._add_question(quiz_question=quiz_question)
+            self._questions_by_fingerprint[fingerprint] = question
         # add question to the latest quiz
         self._latest_quiz.append(question)
         # Use the current strategy to give an answer.
         result = self._strategy_in_use.give_answer(question=question)
+        if journal is not None:
+            self._journal_answers(journal, method="give_answer", random_state=random_state,
+                                  questions=[question], questions_count=questions_count)
         return result
     
+    def give_answers(self, *, quiz: dict) -> dict:
+        """
+        Solve a whole quiz in one pass.
+        Args:
+            quiz (dict): The quiz with a list of quiz questions under the "questions" key
+                and an optional "id".
+        Returns:
+            dict: The response quiz with a list of answered questions under the "questions" key
+                and the "id" of the quiz if it has one. Answer dictionaries of the response may be shared
+                with other responses and must not be modified.
+        """
+        journal = self.journal
+        if journal is not None:
+            random_state = self._random_state_change()
+            questions_count = self.state.questions_count
+        questions_by_fingerprint = self._questions_by_fingerprint
+        # Resolve all questions of the quiz into a list of this call,
+        # strategies and the journal never get the latest quiz itself
+        questions: list[Question] = []
+        append = questions.append
+        for quiz_question in quiz["questions"]:
+            fingerprint = question_fingerprint(quiz_question)
+            question = questions_by_fingerprint.get(fingerprint)
+            if question is None:
+                question = self._add_question(quiz_question=quiz_question)
+                questions_by_fingerprint[fingerprint] = question
+            append(question)
+        self._latest_quiz.extend(questions)
+        # Use the current strategy to answer all questions at once.
+        result = {"questions": self._strategy_in_use.give_answers(questions=questions)}
+        if "id" in quiz:
+            result["id"] = quiz["id"]
+        if journal is not None:
+            self._journal_answers(journal, method="give_answers", random_state=random_state,
+                                  questions=questions, questions_count=questions_count)
+        return result
+
+    def _add_question(self, *, quiz_question: dict) -> Question:
+        """
+        Build a question and add it to the main questions dictionary if not already present.
+        Args:
+            quiz_question (dict): The quiz question as received in the quiz.
+        Returns:
+            Question: The question stored in the main questions dictionary.
+        """
+        return self._register_question(Question(quizsolver=self, quiz_question=quiz_question))
+
+    def _register_question(self, question: Question) -> Question:
+        """
+        Add a question to the main questions dictionary if not already present.
+        Args:
+            question (Question): The new question.
+        Returns:
+            Question: The question stored in the main questions dictionary.
+        """
+        # Add question to the main questions dictionary if not already present.
+        # (the same question may arrive with a different order of answers)
+        uid_bytes = question.uid_bytes
+        if not uid_bytes in self.questions:
+            # Questions solved in earlier runs start solved (a replayed journal stores what was known)
+            if self.setup.knowledge_base_path is not None and not self._replaying_journal:
+                self._apply_knowledge(question)
+            # Assign dense ids to the question and its answers
+            self.state.add_question(question)
+            # Initialize strategies for the question
+            for strategy in self.strategies.values():
+                strategy.initialize_question(question=question)
+            self.questions[uid_bytes] = question
+        # Retrieve the question from the main dictionary
+        return self.questions[uid_bytes]
+
+    def set_answer_correctness(self, *, answer: Answer, is_correct: bool):
+        """
+        Mark an answer as correct or incorrect.
+        Args:
+            answer (Answer): The answer to mark.
+            is_correct (bool): Whether the answer is correct.
+        """
+        answer.is_correct = is_correct
+        self.state.is_correct[answer.index] = is_correct
+
+    def mark_question_solved(self, *, question: Question):
+        """
+        Mark a question as solved.
+        Args:
+            question (Question): The question to mark.
+        """
+        question.is_solved = True
+        self.state.mark_solved(question.index)
+        for strategy in self.strategies.values():
+            strategy.on_question_solved(question=question)
+        if self.setup.knowledge_base_path is not None:
+            self._questions_solved_since_update.append(question)
+
     def _calculate_moving_average_window_size(self) -> int:
         """
         Calculate the moving average window size based on the number of questions.
@@ -138,10 +270,7 @@ class QuizSolver:
         Returns:
             bool: True if all questions are solved, False otherwise.
         """
-        for question in self.questions.values():
-            if not question.is_solved:
-                return False
-        return True
+        return self.state.unsolved_questions_count == 0
 
     def determine_strategy(self):
         """
@@ -196,11 +325,14 @@ class QuizSolver:
             raise ValueError(f"Invalid max_score: {max_score}. max_score must be positive.")
         if max_score < score:
             raise ValueError(f"Invalid max_score: {max_score}. max_score must be >= score.")
+        journal = self.journal
+        if journal is not None:
+            random_state = self._random_state_change()
         # If score is perfect, set all most probable answers to max probability
         self.strategies["Winner"].process_quiz_feedback(score=score, max_score=max_score)
         self.strategies["Looser"].process_quiz_feedback(score=score, max_score=max_score)
         self._strategy_in_use.process_quiz_feedback(score=score, max_score=max_score)
-        
+        all_questions_solved = self.are_all_questions_solved
         # Reset waiting for score feedback flag
         #self.waiting_for_score_feedback = False
         # Indicate confidence that the quiz solution is 100% correct
@@ -211,8 +343,8 @@ class QuizSolver:
             "score": score,
             "max_epochs_reached": self.epoch >= self.setup.max_epochs,
             "targeted_score_reached": score >= self.setup.targeted_score,
-            "all_questions_solved": self.are_all_questions_solved,
-            "finished": self.epoch >= self.setup.max_epochs or self.are_all_questions_solved or
+            "all_questions_solved": all_questions_solved,
+            "finished": self.epoch >= self.setup.max_epochs or all_questions_solved or
                         score >= self.setup.targeted_score
         }
         # return the result dictionary
@@ -221,23 +353,375 @@ class QuizSolver:
         self.update_quiz_statistics(score=score)
         # Determine the strategy to use for the next quiz
         self.determine_strategy()
-        # Handle console redraw and plot rendering based on intervals
-        now = datetime.datetime.now()
-        if now - self.console_redrawn_at > datetime.timedelta(seconds=self.setup["redraw_console_interval"]) and self.setup["redraw_console_interval"] >= 0:
-            self.print_statistics()
-            self.console_redrawn_at = now
-        if now - self.plots_rendered_at > datetime.timedelta(seconds=self.setup["render_plots_interval"]) and self.setup["render_plots_interval"] >= 0:
-            if self.epoch > 1:
-                self._strategy_in_use.plot()
-            self.plots_rendered_at = now
+        # Handle console redraw and plot rendering based on intervals (never in headless mode or during recovery)
+        if not self.setup.headless and not self._replaying_journal:
+            status_renderer = self.status_renderer
+            if self.setup.render_status_in_background:
+                status_renderer.start_sampling(self.status_lines)
+            elif status_renderer.is_due():
+                status_renderer.render(self.status_lines())
+            now = time.monotonic()
+            if now - self.plots_rendered_at > self.setup["render_plots_interval"] and self.setup["render_plots_interval"] >= 0:
+                if self.epoch > 1:
+                    self.render_plots()
+                self.plots_rendered_at = now
         # Update epoch
         self.epoch += 1
-        self._latest_quiz = []
+        self._latest_quiz.clear()
+        if self._questions_solved_since_update:
+            self._update_knowledge_base()
+        if journal is not None:
+            self._append_journal_record(journal, {"kind": "feedback", "random": random_state,
+                                                  "score": score, "max_score": max_score})
+            journal.end_epoch()
         return result
 
-    def print_statistics(self):
+    def render_plots(self):
+        """
+        Plot the data of the strategy in use, either directly or by publishing a snapshot
+        to the renderer process.
+        """
+        if not self.setup.render_plots_out_of_process:
+            self._strategy_in_use.plot()
+            return
+        snapshot = self._strategy_in_use.plot_snapshot()
+        if snapshot is not None:
+            self.plot_renderer.publish(snapshot)
+
+    @property
+    def plot_renderer(self) -> PlotRenderer:
+        """
+        Get the renderer drawing plots in a separate process.
+        """
+        if self._plot_renderer is None:
+            self._plot_renderer = PlotRenderer()
+        return self._plot_renderer
+
+    @property
+    def status_renderer(self) -> StatusRenderer:
+        """
+        Get the renderer of console statistics. It is disabled in headless mode
+        and when the standard output is not a terminal.
+        """
+        if self._status_renderer is None:
+            interval = -1 if self.setup.headless else self.setup.redraw_console_interval
+            self._status_renderer = StatusRenderer(interval=interval)
+        return self._status_renderer
+
+    def close(self):
+        """
+        Release resources of the quiz solver, i.e. stop the status sampling thread and the plot renderer process.
+        """
+        if self._status_renderer is not None:
+            self._status_renderer.stop_sampling()
+        if self._plot_renderer is not None:
+            self._plot_renderer.close()
+            self._plot_renderer = None
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if self._knowledge_base is not None:
+            self._knowledge_base.close()
+            self._knowledge_base = None
+
+    def save_checkpoint(self, path: str):
+        """
+        Save the whole state of the quiz solver (questions, state columns, strategies,
+        moving averages, statistics, epoch and the state of the random generator) to a binary checkpoint.
+        The checkpoint is written atomically, a crash while saving keeps the previous checkpoint.
+        Texts and uids of the question bank are encoded once and only new questions are encoded
+        by later checkpoints. The journal is emptied, its records are included in the checkpoint.
+        Args:
+            path (str): Path of the checkpoint.
+        """
+        if self._checkpoint_bank is None:
+            self._checkpoint_bank = QuestionBankColumns()
+        self._checkpoint_bank.update(self.questions)
+        write_checkpoint(path, {
+            "hash_algorithm": self.setup.hash_algorithm,
+            "hash_digest_size": self.setup.hash_digest_size,
+            "epoch": self.epoch,
+            "waiting_for_score_feedback": self.waiting_for_score_feedback,
+            "strategy_in_use": self._strategy_in_use.name,
+            "latest_result": self.latest_result,
+            "latest_quiz": array('q', [question.index for question in self._latest_quiz]),
+            "statistics": self.statistics.checkpoint_state(),
+            "random": random_state_dict(self.random.getstate()),
+            "journal_sequence": self._journal_sequence,
+            "questions": self._checkpoint_bank.checkpoint_state(),
+            "state": self.state.checkpoint_state(),
+            "strategies": {name: strategy.checkpoint_state() for name, strategy in self.strategies.items()}
+        })
+        # Records up to the journal sequence of the checkpoint are skipped by recover() even if
+        # the process crashes before the journal is emptied
+        if self._journal is not None:
+            self._journal.reset()
+        self._journal_random_state = None
+
+    def load_checkpoint(self, path: str):
         """
-        Print statistics containing the state of all questions.
+        Restore the state of the quiz solver saved by save_checkpoint, replacing the current state.
+        The state of the random generator is restored too, so the solver continues exactly
+        like the solver which saved the checkpoint. The setup of the quiz solver is not stored,
+        the hash algorithm must match the setup the checkpoint was saved with.
+        Args:
+            path (str): Path of the checkpoint.
+        """
+        checkpoint = read_checkpoint(path)
+        if checkpoint["hash_algorithm"] != self.setup.hash_algorithm or \
+           checkpoint["hash_digest_size"] != self.setup.hash_digest_size:
+            raise ValueError(f'Checkpoint uses hash algorithm "{checkpoint["hash_algorithm"]}" '
+                             f'with digest size {checkpoint["hash_digest_size"]}, the setup uses '
+                             f'"{self.setup.hash_algorithm}" with digest size {self.setup.hash_digest_size}.')
+        if set(checkpoint["strategies"]) != set(self.strategies):
+            raise ValueError(f"Strategies of the checkpoint {sorted(checkpoint["strategies"])} do not match "
+                             f"the strategies of the quiz solver {sorted(self.strategies)}.")
+        # Millions of objects are created at once, the garbage collector would scan them repeatedly
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._restore_questions_and_strategies(checkpoint)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        self.epoch = checkpoint["epoch"]
+        self.waiting_for_score_feedback = checkpoint["waiting_for_score_feedback"]
+        self._strategy_in_use = self.strategies[checkpoint["strategy_in_use"]]
+        self.latest_result = checkpoint["latest_result"]
+        self.statistics.restore_checkpoint_state(checkpoint["statistics"])
+        self._restore_random_state(checkpoint["random"])
+        self._journal_sequence = checkpoint["journal_sequence"]
+        self._journal_random_state = None
+
+    def _restore_questions_and_strategies(self, checkpoint: dict):
+        """
+        Restore the state columns, the questions and the strategies from a checkpoint.
+        """
+        # Restore the columns and the questions with their ids
+        state = self.state
+        state.restore_checkpoint_state(checkpoint["state"])
+        self._checkpoint_bank = QuestionBankColumns.from_checkpoint_state(checkpoint["questions"])
+        questions = self._checkpoint_bank.restore_questions()
+        if len(questions) != state.questions_count:
+            raise ValueError(f"Checkpoint contains {len(questions)} questions, "
+                             f"its state columns {state.questions_count}.")
+        self.questions = {}
+        self._questions_by_fingerprint = {}
+        is_correct = state.is_correct
+        for question_index, question in enumerate(questions):
+            question.index = question_index
+            question.answer_offset = state.question_offsets[question_index]
+            question.is_solved = state.is_solved[question_index] == 1
+            for answer_index, answer in enumerate(question.answers, start=question.answer_offset):
+                answer.index = answer_index
+                answer.is_correct = None if is_correct[answer_index] == -1 else is_correct[answer_index] == 1
+            self.questions[question.uid_bytes] = question
+            self._cache_fingerprint(question)
+        if sum(len(question.answers) for question in questions) != state.answers_count:
+            raise ValueError("Answers of the questions in the checkpoint do not match its state columns.")
+        # Restore strategies and the solver
+        for name, strategy in self.strategies.items():
+            strategy.restore_checkpoint_state(checkpoint["strategies"][name], questions=questions)
+        self._latest_quiz = [questions[i] for i in checkpoint["latest_quiz"]]
+
+    @property
+    def knowledge_base(self) -> KnowledgeBase | None:
+        """
+        Get the knowledge base of solved questions shared between runs, None if it is disabled.
+        """
+        if self.setup.knowledge_base_path is None:
+            return None
+        if self._knowledge_base is None:
+            self._knowledge_base = KnowledgeBase(self.setup.knowledge_base_path,
+                                                 hash_algorithm=self.setup.hash_algorithm,
+                                                 digest_size=self.hash_function().digest_size)
+        return self._knowledge_base
+
+    def _apply_knowledge(self, question: Question):
+        """
+        Mark the answers of a new question as correct or incorrect if the question
+        was solved in an earlier run, the question then starts solved.
+        Args:
+            question (Question): The new question (ids are not assigned yet).
+        """
+        if question.is_solved:
+            return
+        knowledge = self.knowledge_base.lookup(question.uid_bytes)
+        if knowledge is None:
+            return
+        correct_uids, incorrect_uids = knowledge
+        answers_by_uid = {answer.uid_bytes: answer for answer in question.answers}
+        if len(correct_uids) == 0 or any(uid not in answers_by_uid for uid in correct_uids + incorrect_uids):
+            return
+        for uid in incorrect_uids:
+            answers_by_uid[uid].is_correct = False
+        for uid in correct_uids:
+            answers_by_uid[uid].is_correct = True
+        question.is_solved = True
+        self.questions_from_knowledge_base += 1
+
+    def _update_knowledge_base(self):
+        """
+        Record the questions solved since the previous update in the knowledge base.
+        """
+        self.knowledge_base.record([
+            (question.uid_bytes,
+             [answer.uid_bytes for answer in question.answers if answer.is_correct is True],
+             [answer.uid_bytes for answer in question.answers if answer.is_correct is False])
+            for question in self._questions_solved_since_update
+        ])
+        self._questions_solved_since_update.clear()
+
+    def _cache_fingerprint(self, question: Question):
+        """
+        Add the fingerprint of a restored question as it was received first to the fingerprint cache,
+        other orders of its answers are resolved by uid.
+        """
+        raw_question = question._raw_question
+        self._questions_by_fingerprint[(raw_question.question_text, raw_question.type.value,
+                                        tuple([raw_answer.answer_text
+                                               for raw_answer in raw_question.raw_answers]))] = question
+
+    def _restore_random_state(self, state: dict):
+        """
+        Restore a state of the random generator returned by random_state_dict.
+        """
+        self.random.setstate(random_state_from_dict(state))
+
+    @property
+    def journal(self) -> Journal | None:
+        """
+        Get the journal of the changes since the latest checkpoint, None if the journal is disabled.
+        A new journal is started when it is used for the first time, unless recover() opened
+        the existing one. An existing journal with records raises ValueError instead of being emptied,
+        recover() must be called first.
+        """
+        if self.setup.journal_path is None or self._replaying_journal:
+            return None
+        if self._journal is None:
+            self._journal = Journal(self.setup.journal_path, sync_epochs=self.setup.journal_sync_epochs)
+        return self._journal
+
+    def _random_state_change(self) -> dict | None:
+        """
+        Get the state of the random generator if it was changed outside of the quiz solver
+        since the latest journaled call (e.g. by the code generating quizzes), otherwise None.
+        """
+        random_state = self.random.getstate()
+        if random_state == self._journal_random_state:
+            return None
+        return random_state_dict(random_state)
+
+    def _append_journal_record(self, journal: Journal, record: dict):
+        """
+        Append a record to the journal and remember the state of the random generator after the call.
+        """
+        self._journal_sequence += 1
+        journal.append(self._journal_sequence, record)
+        self._journal_random_state = self.random.getstate()
+
+    def _journal_answers(self, journal: Journal, *, method: str, random_state: dict | None,
+                         questions: list[Question], questions_count: int):
+        """
+        Record answered questions in the journal: ids of the questions and the texts and uids
+        of the questions added to the bank (their ids start at questions_count).
+        """
+        new_questions = QuestionBankColumns()
+        # Correctness of the answers of new questions (-1 undecided, 0 incorrect, 1 correct) decided when
+        # they were added, e.g. from the knowledge base, which may know more when the journal is replayed
+        new_answers_correctness = array('b')
+        next_index = questions_count
+        for question in questions:
+            # New questions get consecutive ids in the order they first appear in the quiz
+            if question.index == next_index:
+                new_questions.append((question,))
+                new_answers_correctness.extend([-1 if answer.is_correct is None else answer.is_correct
+                                                for answer in question.answers])
+                next_index += 1
+        self._append_journal_record(journal, {
+            "kind": "answers",
+            "method": method,
+            "random": random_state,
+            "questions": new_questions.checkpoint_state(),
+            "answers_correctness": new_answers_correctness,
+            "quiz": array('q', [question.index for question in questions])
+        })
+
+    def recover(self, checkpoint_path: str | None = None) -> int:
+        """
+        Recover the state of the quiz solver after a crash: load the checkpoint (if it exists)
+        and replay the journal records saved after it. Records of an unfinished epoch are dropped,
+        the quiz solver continues after the latest epoch which received its score feedback
+        (or after the checkpoint if it was saved while waiting for feedback).
+        Must be called before the first quiz, otherwise the journal is started anew.
+        Args:
+            checkpoint_path (str | None): Path of the latest checkpoint, None to replay the journal
+                from an empty quiz solver.
+        Returns:
+            int: Number of replayed epochs.
+        """
+        if self.setup.journal_path is None:
+            raise ValueError("Journal is disabled. Set journal_path of the setup to recover.")
+        if self._journal is not None or len(self.questions) > 0:
+            raise ValueError("Recovery must be the first call of a new quiz solver.")
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            self.load_checkpoint(checkpoint_path)
+        # Records included in the checkpoint are skipped, records of an unfinished epoch are dropped
+        records = [(sequence, record, end) for sequence, record, end in read_journal(self.setup.journal_path)
+                   if sequence > self._journal_sequence]
+        while records and records[-1][1]["kind"] != "feedback":
+            records.pop()
+        length = records[-1][2] if records else 0
+        questions_by_id = list(self.questions.values())
+        epochs = 0
+        self._replaying_journal = True
+        try:
+            for sequence, record, _ in records:
+                if sequence != self._journal_sequence + 1:
+                    raise ValueError(f'Journal "{self.setup.journal_path}" continues with record {sequence}, '
+                                     f'expected record {self._journal_sequence + 1}.')
+                if record["random"] is not None:
+                    self._restore_random_state(record["random"])
+                if record["kind"] == "answers":
+                    self._replay_answers(record, questions_by_id)
+                else:
+                    self.process_score_feedback(score=record["score"], max_score=record["max_score"])
+                    epochs += 1
+                self._journal_sequence = sequence
+        finally:
+            self._replaying_journal = False
+        # The records after length were read and dropped (unfinished epoch or damaged tail)
+        self._journal = Journal(self.setup.journal_path, sync_epochs=self.setup.journal_sync_epochs, length=length,
+                                reset=True)
+        self._journal_random_state = self.random.getstate()
+        return epochs
+
+    def _replay_answers(self, record: dict, questions_by_id: list[Question]):
+        """
+        Replay a journal record of answered questions.
+        """
+        answers_correctness = iter(record["answers_correctness"])
+        for question in QuestionBankColumns.from_checkpoint_state(record["questions"]).restore_questions():
+            for answer in question.answers:
+                is_correct = next(answers_correctness)
+                answer.is_correct = None if is_correct == -1 else is_correct == 1
+            question.is_solved = any(answer.is_correct for answer in question.answers)
+            question = self._register_question(question)
+            if question.index != len(questions_by_id):
+                raise ValueError(f"Journal adds question {question.index}, expected question {len(questions_by_id)}.")
+            questions_by_id.append(question)
+            self._cache_fingerprint(question)
+        questions = [questions_by_id[index] for index in record["quiz"]]
+        self._latest_quiz.extend(questions)
+        if record["method"] == "give_answer":
+            for question in questions:
+                self._strategy_in_use.give_answer(question=question)
+        else:
+            self._strategy_in_use.give_answers(questions=questions)
+
+    def status_lines(self) -> list[str]:
+        """
+        Get the lines of the statistics containing the state of all questions.
         """
         result = "QuizSolver Statistics:\n"
         result +=f"  Epoch: {self.latest_result["epoch"]}\n"
@@ -256,9 +740,17 @@ class QuizSolver:
         # result += self.strategies["Beta"].print_statistics()+"\n"
         # result += self.strategies["NegativeBeta"].print_statistics()+"\n"
         result += self._strategy_in_use.print_statistics()+"\n"
-        try:
-            self.console.clear()
-            self.console.print(result)
-            self.console.update()
-        except Exception as e:
-            print(result)
\ No newline at end of file
+        return result.splitlines()
+
+    def print_statistics(self):
+        """
+        Print statistics containing the state of all questions. They are rendered in place
+        at the top of the terminal, or printed as plain text in headless mode
+        and when the standard output is not a terminal.
+        """
+        lines = self.status_lines()
+        status_renderer = self.status_renderer
+        if status_renderer.enabled:
+            status_renderer.render(lines)
+        else:
+            print("\n".join(lines))
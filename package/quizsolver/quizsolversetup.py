@@ -6,7 +6,19 @@ class QuizSolverSetup(dict):
                  redraw_console_interval: float = 0.25, render_plots_interval: float = -1,
                  preferred_strategy: str | None = None,
                  moving_average_window_size_override: int | None = None,
-                 measurement_rounds_of_beta_strategies: int = 1):
+                 measurement_rounds_of_beta_strategies: int = 1,
+                 hash_algorithm: str = "sha3_256",
+                 hash_digest_size: int | None = None,
+                 moving_average_history_size: int = 10000,
+                 moving_average_history_policy: str = "drop_oldest",
+                 moving_average_mode: str = "simple",
+                 moving_average_alpha: float | None = None,
+                 headless: bool = False,
+                 render_plots_out_of_process: bool = False,
+                 render_status_in_background: bool = False,
+                 journal_path: str | None = None,
+                 journal_sync_epochs: int = 1,
+                 knowledge_base_path: str | None = None):
         super().__init__()
         self["targeted_score"] = targeted_score
         self["max_epochs"] = max_epochs
@@ -15,6 +27,18 @@ class QuizSolverSetup(dict):
         self["preferred_strategy"] = preferred_strategy
         self["moving_average_window_size_override"] = moving_average_window_size_override
         self["measurement_rounds_of_beta_strategies"] = measurement_rounds_of_beta_strategies
+        self["hash_algorithm"] = hash_algorithm
+        self["hash_digest_size"] = hash_digest_size
+        self["moving_average_history_size"] = moving_average_history_size
+        self["moving_average_history_policy"] = moving_average_history_policy
+        self["moving_average_mode"] = moving_average_mode
+        self["moving_average_alpha"] = moving_average_alpha
+        self["headless"] = headless
+        self["render_plots_out_of_process"] = render_plots_out_of_process
+        self["render_status_in_background"] = render_status_in_background
+        self["journal_path"] = journal_path
+        self["journal_sync_epochs"] = journal_sync_epochs
+        self["knowledge_base_path"] = knowledge_base_path
 
     @property
     def targeted_score(self) -> float:
@@ -121,4 +145,185 @@ class QuizSolverSetup(dict):
         self["measurement_rounds_of_beta_strategies"] = value
 
     
-        
\ No newline at end of file
+        
+
+    @property
+    def hash_algorithm(self) -> str:
+        """
+        Get the name of the hashlib algorithm used to compute question and answer uids.
+        """
+        return self.get("hash_algorithm", "sha3_256")
+    
+    @hash_algorithm.setter
+    def hash_algorithm(self, value: str):
+        """
+        Set the name of the hashlib algorithm used to compute question and answer uids,
+        e.g. "sha3_256" or "blake2b".
+        """
+        self["hash_algorithm"] = value
+
+    @property
+    def hash_digest_size(self) -> int | None:
+        """
+        Get the digest size in bytes of the hash algorithm (None for the default digest size).
+        """
+        return self.get("hash_digest_size", None)
+    
+    @hash_digest_size.setter
+    def hash_digest_size(self, value: int | None):
+        """
+        Set the digest size in bytes of the hash algorithm (None for the default digest size).
+        Only blake2b and blake2s support a custom digest size.
+        """
+        self["hash_digest_size"] = value
+
+    @property
+    def moving_average_history_size(self) -> int:
+        """
+        Get the maximum number of entries in the history of each moving average (0 disables the history).
+        """
+        return self.get("moving_average_history_size", 10000)
+    
+    @moving_average_history_size.setter
+    def moving_average_history_size(self, value: int):
+        """
+        Set the maximum number of entries in the history of each moving average (0 disables the history).
+        """
+        self["moving_average_history_size"] = value
+
+    @property
+    def moving_average_history_policy(self) -> str:
+        """
+        Get the policy applied when the history of a moving average is full.
+        """
+        return self.get("moving_average_history_policy", "drop_oldest")
+    
+    @moving_average_history_policy.setter
+    def moving_average_history_policy(self, value: str):
+        """
+        Set the policy applied when the history of a moving average is full,
+        "drop_oldest" drops the oldest entries, "halve" keeps every other entry.
+        """
+        self["moving_average_history_policy"] = value
+
+    @property
+    def moving_average_mode(self) -> str:
+        """
+        Get the mode of the moving averages of the strategies.
+        """
+        return self.get("moving_average_mode", "simple")
+    
+    @moving_average_mode.setter
+    def moving_average_mode(self, value: str):
+        """
+        Set the mode of the moving averages of the strategies, "simple" averages the scores in the window,
+        "weighted" weights the scores in the window by the quiz size, "exponential" is an exponentially
+        weighted moving average of the scores weighted by the quiz size.
+        """
+        self["moving_average_mode"] = value
+
+    @property
+    def moving_average_alpha(self) -> float | None:
+        """
+        Get the smoothing factor of the exponential moving averages (None derives it from the window size).
+        """
+        return self.get("moving_average_alpha", None)
+    
+    @moving_average_alpha.setter
+    def moving_average_alpha(self, value: float | None):
+        """
+        Set the smoothing factor of the exponential moving averages (None derives it from the window size).
+        """
+        self["moving_average_alpha"] = value
+
+    @property
+    def headless(self) -> bool:
+        """
+        Get whether the quiz solver runs without console statistics and plots.
+        """
+        return self.get("headless", False)
+    
+    @headless.setter
+    def headless(self, value: bool):
+        """
+        Set whether the quiz solver runs without console statistics and plots.
+        In headless mode matplotlib is never imported.
+        """
+        self["headless"] = value
+
+    @property
+    def render_plots_out_of_process(self) -> bool:
+        """
+        Get whether plots are drawn by a separate renderer process.
+        """
+        return self.get("render_plots_out_of_process", False)
+    
+    @render_plots_out_of_process.setter
+    def render_plots_out_of_process(self, value: bool):
+        """
+        Set whether plots are drawn by a separate renderer process. The solver then only publishes
+        snapshots of the plot data and never waits for drawing, outdated snapshots are dropped.
+        """
+        self["render_plots_out_of_process"] = value
+
+    @property
+    def render_status_in_background(self) -> bool:
+        """
+        Get whether console statistics are rendered by a background thread.
+        """
+        return self.get("render_status_in_background", False)
+    
+    @render_status_in_background.setter
+    def render_status_in_background(self, value: bool):
+        """
+        Set whether console statistics are rendered by a background thread sampling the solver
+        every redraw_console_interval seconds instead of between epochs.
+        """
+        self["render_status_in_background"] = value
+
+    @property
+    def journal_path(self) -> str | None:
+        """
+        Get the path of the journal of changes since the latest checkpoint, None if disabled.
+        """
+        return self.get("journal_path", None)
+    
+    @journal_path.setter
+    def journal_path(self, value: str | None):
+        """
+        Set the path of the journal of changes since the latest checkpoint, None disables the journal.
+        Every epoch appends its quiz, new questions and score feedback to the journal,
+        QuizSolver.recover() replays them on top of the latest checkpoint after a crash.
+        """
+        self["journal_path"] = value
+
+    @property
+    def journal_sync_epochs(self) -> int:
+        """
+        Get the number of epochs between flushes of the journal to disk.
+        """
+        return self.get("journal_sync_epochs", 1)
+    
+    @journal_sync_epochs.setter
+    def journal_sync_epochs(self, value: int):
+        """
+        Set the number of epochs between flushes of the journal to disk. A crash of the machine
+        loses at most this many epochs, a crash of the process loses none.
+        """
+        self["journal_sync_epochs"] = value
+
+    @property
+    def knowledge_base_path(self) -> str | None:
+        """
+        Get the path of the knowledge base of solved questions shared between runs, None if disabled.
+        """
+        return self.get("knowledge_base_path", None)
+    
+    @knowledge_base_path.setter
+    def knowledge_base_path(self, value: str | None):
+        """
+        Set the path of the knowledge base of solved questions shared between runs, None disables it.
+        Questions solved by any quiz solver using the knowledge base are recorded there,
+        questions found there start solved.
+        """
+        self["knowledge_base_path"] = value
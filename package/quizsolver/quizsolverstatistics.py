@@ -18,4 +18,24 @@ class QuizSolverStatistics(dict):
         self["answers_per_quiz_on_average"] = 0.0
         self["sum_of_all_questions_of_all_quizzes"] = 0
         self["sum_of_all_answers_of_all_quizzes"] = 0   
-        
\ No newline at end of file
+        
+
+    def checkpoint_state(self) -> dict:
+        """
+        Get the statistics for a checkpoint, timestamps are stored in ISO format.
+        """
+        state = dict(self)
+        for key in ("started_at", "finished_at"):
+            if state[key] is not None:
+                state[key] = state[key].isoformat()
+        return state
+
+    def restore_checkpoint_state(self, state: dict):
+        """
+        Restore statistics returned by checkpoint_state.
+        """
+        self.clear()
+        self.update(state)
+        for key in ("started_at", "finished_at"):
+            if self[key] is not None:
+                self[key] = datetime.datetime.fromisoformat(self[key])
@@ -0,0 +1,84 @@
+import random
+import numpy as np
+from typing import Iterator
+from .quizgenerator import QuizGenerator
+
+
+class QuizSource:
+    def __init__(self, *, seed: int, questions_count: int = 200,
+                 min_answers_per_question: int = 4,
+                 max_answers_per_question: int = 4,
+                 probability_of_choose_one_type: float = 1.0,
+                 probability_of_choose_one_or_more_type: float = 0.0,
+                 probability_of_choose_zero_or_more_type: float = 0.0,
+                 compact: bool = False,
+                 questions_per_quiz: int | None = None,
+                 quizzes_count: int | None = None):
+        """
+        Initialize a reproducible source of quizzes for benchmarks and simulations.
+        The question bank and every quiz are drawn from random generators seeded by seed,
+        so the same seed always gives the same quizzes, and sources with different seeds
+        are independent. The random module is not used.
+        A quiz solver seeded by solver_random makes the whole run reproducible:
+            source = QuizSource(seed=seed)
+            quiz_solver = QuizSolver(setup=setup, strategy_in_use=strategy, random_generator=source.solver_random)
+            for quiz in source:
+                score = source.score(quiz_solver.give_answers(quiz=quiz))
+                quiz_solver.process_score_feedback(score=score, max_score=1.0)
+        Args:
+            seed (int): Seed of the quizzes and of solver_random.
+            questions_count, min_answers_per_question, max_answers_per_question, probability_of_*_type, compact:
+                The question bank, see QuizGenerator.
+            questions_per_quiz (int | None): Number of questions of each quiz, 20 % of the bank if None.
+            quizzes_count (int | None): Number of quizzes of the source, unlimited if None.
+        """
+        self.seed = seed
+        self.random = random.Random(seed)
+        # Separate stream for the quiz solver, the quizzes do not depend on how it uses its generator
+        self.solver_random = random.Random(f"{seed}:solver")
+        self.quiz_generator = QuizGenerator(questions_count=questions_count,
+                                            min_answers_per_question=min_answers_per_question,
+                                            max_answers_per_question=max_answers_per_question,
+                                            probability_of_choose_one_type=probability_of_choose_one_type,
+                                            probability_of_choose_one_or_more_type=probability_of_choose_one_or_more_type,
+                                            probability_of_choose_zero_or_more_type=probability_of_choose_zero_or_more_type,
+                                            compact=compact,
+                                            random_generator=self.random,
+                                            numpy_generator=np.random.default_rng(seed))
+        if questions_per_quiz is None:
+            questions_per_quiz = max(1, questions_count // 5)
+        if not 1 <= questions_per_quiz <= questions_count:
+            raise ValueError(f"Invalid questions_per_quiz: {questions_per_quiz}. "
+                             f"questions_per_quiz must be between 1 and {questions_count}.")
+        self.questions_per_quiz = questions_per_quiz
+        self.quizzes_count = quizzes_count
+        self.quizzes_generated: int = 0
+
+    def __iter__(self) -> Iterator[dict]:
+        """
+        Iterate over the quizzes. Each quiz is drawn when it is requested,
+        the iteration continues where the previous one stopped.
+        """
+        while self.quizzes_count is None or self.quizzes_generated < self.quizzes_count:
+            self.quizzes_generated += 1
+            yield self.quiz_generator.generate_quiz(num_questions=self.questions_per_quiz)
+
+    def score(self, response: dict) -> float:
+        """
+        Score a response to a quiz of the source.
+        Args:
+            response (dict): The quiz answered by QuizSolver.give_answers.
+        Returns:
+            float: The score as a float between 0 and 1.
+        """
+        return self.quiz_generator.compute_score(quiz=response)
+
+    def scores(self, responses: list[dict]) -> list[float]:
+        """
+        Score many responses to quizzes of the source at once.
+        Args:
+            responses (list of dict): The quizzes answered by QuizSolver.give_answers.
+        Returns:
+            list of float: The scores in the order of the responses.
+        """
+        return self.quiz_generator.compute_scores(quizzes=responses)
@@ -1,33 +1,56 @@
-from enum import Enum
-from .common import hash_string
+import sys
+from .common import xor_hash_bytes
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-    from .quizsolver import RawQuestion
+    from .rawquestion import RawQuestion
 
 
 
 class RawAnswer:
-    def __init__(self, *, quiz_answer: dict):
+    __slots__ = ("answer_text", "uid_bytes", "parent_question")
+
+    def __init__(self, *, quiz_answer: dict, parent_question: 'RawQuestion', uid_bytes: bytes):
         """
         Initialize a RawAnswer object from a dictionary.
         Args:
             value (dict): A dictionary containing answer properties.
+            parent_question (RawQuestion): The raw question this answer belongs to.
+            uid_bytes (bytes): Unique identifier of the answer computed by the parent question.
+        """
+        # load answer properties (the original dictionary is not kept, the text is interned)
+        self.answer_text: str = sys.intern(quiz_answer.get("answer", ""))
+        # uid and link to parent question
+        self.uid_bytes: bytes = uid_bytes
+        self.parent_question: 'RawQuestion' = parent_question
+
+    @property
+    def raw_hash_bytes(self) -> bytes:
+        """
+        Get the raw hash of the answer text.
+        The raw hash is not stored, it is recovered from the answer uid and the uid of the parent question.
+        Returns: Raw hash as bytes.
+        """
+        return xor_hash_bytes(self.uid_bytes, self.parent_question.uid_bytes)
+
+    @property
+    def raw_hash_str(self) -> str:
+        """
+        Get the raw hash of the answer as a hex string.
+        Returns: Raw hash as a hex string.
+        """
+        return self.raw_hash_bytes.hex()
+
+    @property
+    def uid(self) -> str:
+        """
+        Get the unique identifier of the answer as a hex string.
+        Returns: Unique identifier as a hex string.
         """
-        # load answer properties
-        self._original_value: dict = quiz_answer
-        self.answer_text: str = quiz_answer.get("answer", "")
-        # compute raw hash
-        self.raw_hash_bytes: bytes = hash_string(self.answer_text)
-        self.raw_hash_str: str = self.raw_hash_bytes.hex()
-        # create uid and link to parent question
-        # uid and link to parent question will be set in RawQuestion
-        self.uid_bytes: bytes
-        self.uid: str
-        self.parent_question: 'RawQuestion'
+        return self.uid_bytes.hex()
 
     def to_dict(self):
         """
         Get dictionary representation of the raw answer.
         Returns: Dictionary with raw answer details.
         """
-        return self._original_value
\ No newline at end of file
+        return {"answer": self.answer_text}
\ No newline at end of file
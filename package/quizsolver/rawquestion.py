@@ -1,61 +1,100 @@
+import sys
 import json
+from hashlib import sha3_256
+from typing import Callable
 from .rawanswer import RawAnswer
-from .common import RawQuestionType,  hash_string, xor_hash_bytes
+from .common import RawQuestionType, hash_string, hash_strings, compute_uids
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .question import Question
 
 
 class RawQuestion:
-    def __init__(self, *, quiz_question: dict, parent_question: 'Question'):
+    __slots__ = ("parent_question", "question_text", "type", "raw_hash_bytes", "raw_answers", "uid_bytes")
+
+    def __init__(self, *, quiz_question: dict, parent_question: 'Question', hash_function: Callable = sha3_256):
         """
         Initialize a RawQuestion from a dictionary value.
         Args:
             value (dict): Dictionary containing question data.
+            hash_function (Callable): Hash function used to compute hashes and uids.
         """
-        # load question properties
-        self._original_value: dict = quiz_question
+        # load question properties (the original dictionary is not kept, the text is interned)
         self.parent_question: 'Question' = parent_question
-        self.question_text: str = quiz_question.get("question", "")
+        self.question_text: str = sys.intern(quiz_question.get("question", ""))
         self.type: RawQuestionType = RawQuestionType(quiz_question.get("type", "chooseOne"))
         # compute raw hash of the question
-        self.raw_hash_bytes: bytes = hash_string(self.question_text + self.type.value)
-        self.raw_hash_str: str = self.raw_hash_bytes.hex()
+        self.raw_hash_bytes: bytes = hash_string(self.question_text + self.type.value, hash_function)
         # load answers and check that each answer is different
         received_raw_answers = quiz_question.get("answers", [])
         if not received_raw_answers or len(received_raw_answers) == 0:
             raise ValueError("A question must have at least one answer.")
-        self.raw_answers: list[RawAnswer] = []
+        # hash all answer texts at once
+        answer_hashes = hash_strings([quiz_answer.get("answer", "") for quiz_answer in received_raw_answers],
+                                     hash_function)
         # each answer must be different
-        seen_answer_hashes = set()
-        for raw_answer in received_raw_answers:
-            self.raw_answers.append(RawAnswer(quiz_answer=raw_answer))
-        # create uid
-        self.uid_bytes: bytes = self._compute_uid()
-        self.uid: str = self.uid_bytes.hex()
-        # set parent question and compute answer uids
-        for raw_answer in self.raw_answers:
-            if raw_answer.raw_hash_bytes in seen_answer_hashes:
-                raise ValueError("Duplicate answer detected in a question:\n " +
-                                  json.dumps(quiz_question, indent=4))
-            seen_answer_hashes.add(raw_answer.raw_hash_bytes)
-            raw_answer.parent_question = self
-            raw_answer.uid_bytes = xor_hash_bytes(self.uid_bytes, raw_answer.raw_hash_bytes)
-            raw_answer.uid = raw_answer.uid_bytes.hex()
+        if len(set(answer_hashes)) != len(answer_hashes):
+            raise ValueError("Duplicate answer detected in a question:\n " +
+                              json.dumps(quiz_question, indent=4))
+        # create uid and answer uids
+        self.uid_bytes, answer_uids = compute_uids(self.raw_hash_bytes, answer_hashes)
+        # create raw answers linked to this question
+        self.raw_answers: list[RawAnswer] = [
+            RawAnswer(quiz_answer=raw_answer, parent_question=self, uid_bytes=answer_uid)
+            for raw_answer, answer_uid in zip(received_raw_answers, answer_uids)
+        ]
+
+    @classmethod
+    def restore(cls, *, parent_question: 'Question', question_text: str, type: RawQuestionType,
+                raw_hash_bytes: bytes, uid_bytes: bytes, answer_texts: list[str],
+                answer_uids: list[bytes]) -> 'RawQuestion':
+        """
+        Create a raw question from stored texts, hashes and uids without hashing the texts again.
+        Args:
+            parent_question (Question): The question this raw question belongs to.
+            question_text (str): Text of the question.
+            type (RawQuestionType): Type of the question.
+            raw_hash_bytes (bytes): Raw hash of the question.
+            uid_bytes (bytes): Unique identifier of the question.
+            answer_texts (list of str): Texts of the raw answers.
+            answer_uids (list of bytes): Unique identifiers of the raw answers.
+        Returns: The raw question.
+        """
+        raw_question = cls.__new__(cls)
+        raw_question.parent_question = parent_question
+        raw_question.question_text = sys.intern(question_text)
+        raw_question.type = type
+        raw_question.raw_hash_bytes = raw_hash_bytes
+        raw_question.uid_bytes = uid_bytes
+        raw_question.raw_answers = [
+            RawAnswer(quiz_answer={"answer": answer_text}, parent_question=raw_question, uid_bytes=answer_uid)
+            for answer_text, answer_uid in zip(answer_texts, answer_uids)
+        ]
+        return raw_question
 
-    def _compute_uid(self):
+    @property
+    def raw_hash_str(self) -> str:
         """
-        Compute a unique identifier for the raw question based on its content.
-        Returns: UID string
+        Get the raw hash of the question as a hex string.
+        Returns: Raw hash as a hex string.
         """
-        combined_hash = self.raw_hash_bytes
-        for raw_answer in self.raw_answers:
-            combined_hash = xor_hash_bytes(combined_hash, raw_answer.raw_hash_bytes) 
-        return combined_hash
-    
+        return self.raw_hash_bytes.hex()
+
+    @property
+    def uid(self) -> str:
+        """
+        Get the unique identifier of the question as a hex string.
+        Returns: Unique identifier as a hex string.
+        """
+        return self.uid_bytes.hex()
+
     def to_dict(self):
         """
         Get dictionary representation of the raw question.
         Returns: Dictionary with raw question details and answers.
         """
-        return self._original_value
\ No newline at end of file
+        return {
+            "question": self.question_text,
+            "type": self.type.value,
+            "answers": [raw_answer.to_dict() for raw_answer in self.raw_answers]
+        }
\ No newline at end of file
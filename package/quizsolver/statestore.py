@@ -0,0 +1,157 @@
+from array import array
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .question import Question
+
+
+class StateStore:
+    def __init__(self):
+        """
+        Initialize an empty struct-of-arrays store of per-strategy state.
+        Every answer gets a dense answer id and every question a dense question id
+        when the question is added to the store. Answers of a question have consecutive ids
+        starting at the offset of the question.
+        Columns are typed arrays indexed by the answer id (answer columns)
+        or by the question id (question columns).
+        """
+        self.answers_count: int = 0
+        self.questions_count: int = 0
+        self.solved_questions_count: int = 0
+        # Id of the first answer of each question
+        self.question_offsets: array = array('q')
+        # Registered columns and their default values
+        self._answer_columns: dict[str, array] = {}
+        self._answer_defaults: dict[str, int] = {}
+        self._question_columns: dict[str, array] = {}
+        self._question_defaults: dict[str, int] = {}
+        # Correctness of each answer (-1 undecided, 0 incorrect, 1 correct) and solved flag of each question
+        self.is_correct: array = self.add_answer_column("is_correct", typecode='b', default=-1)
+        self.is_solved: array = self.add_question_column("is_solved", typecode='b', default=0)
+
+    def add_answer_column(self, name: str, *, typecode: str = 'i', default: int = 0) -> array:
+        """
+        Register a column indexed by answer id. Existing answers get the default value.
+        Args:
+            name (str): Name of the column, e.g. "Alpha.counter".
+            typecode (str): Typecode of the array backing the column.
+            default (int): Value of the column for newly added answers.
+        Returns:
+            array: The column.
+        """
+        if name in self._answer_columns:
+            raise ValueError(f'Answer column "{name}" is already registered.')
+        column = array(typecode, [default]) * self.answers_count
+        self._answer_columns[name] = column
+        self._answer_defaults[name] = default
+        return column
+
+    def add_question_column(self, name: str, *, typecode: str = 'q', default: int = -1) -> array:
+        """
+        Register a column indexed by question id. Existing questions get the default value.
+        Args:
+            name (str): Name of the column, e.g. "Alpha.most_probable_answer".
+            typecode (str): Typecode of the array backing the column.
+            default (int): Value of the column for newly added questions.
+        Returns:
+            array: The column.
+        """
+        if name in self._question_columns:
+            raise ValueError(f'Question column "{name}" is already registered.')
+        column = array(typecode, [default]) * self.questions_count
+        self._question_columns[name] = column
+        self._question_defaults[name] = default
+        return column
+
+    def answer_column(self, name: str) -> array:
+        """
+        Get a registered column indexed by answer id.
+        """
+        return self._answer_columns[name]
+
+    def question_column(self, name: str) -> array:
+        """
+        Get a registered column indexed by question id.
+        """
+        return self._question_columns[name]
+
+    @property
+    def unsolved_questions_count(self) -> int:
+        """
+        Number of questions which are not solved yet.
+        """
+        return self.questions_count - self.solved_questions_count
+
+    def mark_solved(self, question_index: int):
+        """
+        Set the solved flag of a question and update the count of solved questions.
+        Args:
+            question_index (int): Id of the question.
+        """
+        if self.is_solved[question_index] == 0:
+            self.is_solved[question_index] = 1
+            self.solved_questions_count += 1
+
+    def add_question(self, question: 'Question'):
+        """
+        Assign dense ids to a question and its answers and append default values to all columns.
+        Args:
+            question (Question): The question to add.
+        """
+        len_answers = len(question.answers)
+        question.index = self.questions_count
+        question.answer_offset = self.answers_count
+        for i, answer in enumerate(question.answers):
+            answer.index = self.answers_count + i
+        self.question_offsets.append(self.answers_count)
+        self.questions_count += 1
+        self.answers_count += len_answers
+        # Extend all columns with default values
+        for name, column in self._answer_columns.items():
+            column.extend(array(column.typecode, [self._answer_defaults[name]]) * len_answers)
+        for name, column in self._question_columns.items():
+            column.append(self._question_defaults[name])
+        # Store correctness of answers and solved flag decided when the question was created
+        if question.is_solved:
+            self.mark_solved(question.index)
+        for answer in question.answers:
+            if answer.is_correct is not None:
+                self.is_correct[answer.index] = answer.is_correct
+
+    def checkpoint_state(self) -> dict:
+        """
+        Get the state of the store for a checkpoint.
+        Returns:
+            dict: Counts, offsets of the questions and all registered columns.
+        """
+        return {
+            "answers_count": self.answers_count,
+            "questions_count": self.questions_count,
+            "solved_questions_count": self.solved_questions_count,
+            "question_offsets": self.question_offsets,
+            "answer_columns": self._answer_columns,
+            "question_columns": self._question_columns
+        }
+
+    def restore_checkpoint_state(self, state: dict):
+        """
+        Restore a state returned by checkpoint_state. Columns are restored in place,
+        so references to them held by strategies stay valid.
+        Args:
+            state (dict): The state, it must contain the same columns as the store.
+        """
+        for columns, restored_columns in ((self._answer_columns, state["answer_columns"]),
+                                          (self._question_columns, state["question_columns"])):
+            if set(columns) != set(restored_columns):
+                raise ValueError(f"Columns of the checkpoint {sorted(restored_columns)} do not match "
+                                 f"the registered columns {sorted(columns)}.")
+            for name, column in columns.items():
+                if restored_columns[name].typecode != column.typecode:
+                    raise ValueError(f'Type of column "{name}" in the checkpoint does not match.')
+        self.answers_count = state["answers_count"]
+        self.questions_count = state["questions_count"]
+        self.solved_questions_count = state["solved_questions_count"]
+        self.question_offsets[:] = state["question_offsets"]
+        for name, column in self._answer_columns.items():
+            column[:] = state["answer_columns"][name]
+        for name, column in self._question_columns.items():
+            column[:] = state["question_columns"][name]
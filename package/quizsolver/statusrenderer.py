@@ -0,0 +1,130 @@
+import sys
+import math
+import time
+import shutil
+import threading
+from typing import Callable, TextIO
+
+# Shortest interval of the background sampling thread in seconds
+MIN_SAMPLING_INTERVAL = 0.05
+
+
+class StatusRenderer:
+    def __init__(self, *, interval: float, stream: TextIO | None = None):
+        """
+        Initialize a renderer of a block of status lines at the top of a terminal.
+        Lines are rendered at most once per interval, measured on a monotonic clock,
+        and only the lines which changed since the previous render are rewritten.
+        If the stream is not a terminal or the interval is negative, the renderer is disabled
+        and is_due() is always False, so checking it costs only a clock read.
+        Args:
+            interval (float): Minimum number of seconds between renders, negative disables rendering.
+            stream (TextIO | None): Stream of the terminal, sys.stdout by default.
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        self.interval = interval
+        self.enabled: bool = interval >= 0 and self._is_terminal(self.stream)
+        self.renders: int = 0
+        self.rewritten_lines: int = 0
+        self._columns: int = shutil.get_terminal_size().columns
+        self._lines: list[str] = []
+        self._next_render_at: float = time.monotonic() if self.enabled else math.inf
+        self._lock = threading.Lock()
+        self._stop_sampling = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def _is_terminal(stream: TextIO) -> bool:
+        """
+        Check if the stream is a terminal.
+        """
+        try:
+            return stream.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+    @property
+    def is_sampling(self) -> bool:
+        """
+        Check if the background sampling thread is running.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_due(self) -> bool:
+        """
+        Check if the status should be rendered now. Always False when the renderer is disabled
+        or the background sampling thread renders the status.
+        """
+        return time.monotonic() >= self._next_render_at
+
+    def render(self, lines: list[str]):
+        """
+        Render the status lines, rewriting only the lines which changed since the previous render.
+        Lines longer than the terminal are cut, so every line takes exactly one row.
+        Args:
+            lines (list of str): The status lines without line breaks.
+        """
+        lines = [line[:self._columns] for line in lines]
+        with self._lock:
+            output = []
+            if self.renders == 0:
+                # Clear the screen before the first render
+                output.append("\x1b[2J")
+            for row, line in enumerate(lines):
+                if row >= len(self._lines) or self._lines[row] != line:
+                    # Move the cursor to the row, write the line and erase the rest of the row
+                    output.append(f"\x1b[{row + 1};1H{line}\x1b[K")
+                    self.rewritten_lines += 1
+            for row in range(len(lines), len(self._lines)):
+                output.append(f"\x1b[{row + 1};1H\x1b[K")
+                self.rewritten_lines += 1
+            if output:
+                # Leave the cursor below the status
+                output.append(f"\x1b[{len(lines) + 1};1H")
+                self.stream.write("".join(output))
+                self.stream.flush()
+            self._lines = lines
+            self.renders += 1
+            if not self.is_sampling:
+                self._next_render_at = time.monotonic() + self.interval
+
+    def start_sampling(self, sample: Callable[[], list[str]]):
+        """
+        Start a background thread which renders the lines returned by sample() once per interval,
+        so the status is not rendered on the thread calling is_due(). Does nothing if the renderer
+        is disabled or the thread is already running.
+        Args:
+            sample (Callable): Function returning the current status lines.
+        """
+        if not self.enabled or self._thread is not None:
+            return
+        self._next_render_at = math.inf
+        self._stop_sampling.clear()
+        self._thread = threading.Thread(target=self._sample, args=(sample,),
+                                        name="QuizSolverStatusRenderer", daemon=True)
+        self._thread.start()
+
+    def _sample(self, sample: Callable[[], list[str]]):
+        """
+        Main loop of the background sampling thread.
+        """
+        while not self._stop_sampling.wait(max(self.interval, MIN_SAMPLING_INTERVAL)):
+            try:
+                lines = sample()
+            except Exception:
+                # The sampled counters may be in the middle of an update, try again next interval
+                continue
+            self.render(lines)
+
+    def stop_sampling(self, *, timeout: float = 1.0):
+        """
+        Stop the background sampling thread. The status is rendered by is_due() checks again.
+        Args:
+            timeout (float): Seconds to wait for the thread to finish.
+        """
+        if self._thread is None:
+            return
+        self._stop_sampling.set()
+        self._thread.join(timeout)
+        self._thread = None
+        self._next_render_at = time.monotonic() if self.enabled else math.inf
@@ -1,16 +1,83 @@
 import random
+import numpy as np
+from .movingaverage import MovingAverage
+from .question import Question
+from .checkpoint import random_state_dict, random_state_from_dict
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
+    from array import array
     from .answer import Answer
-    from .question import Question
     from .quizsolver import QuizSolver
 
 class Strategy:
-    def __init__(self, *, quizsolver: 'QuizSolver', name: str = "BaseStrategy"):
+    def __init__(self, *, quizsolver: 'QuizSolver', name: str = "BaseStrategy",
+                 random_generator: random.Random | None = None):
         self._quizsolver = quizsolver
         self.name = name
+        # Random generator of the strategy, the random generator of the quiz solver if none is given
+        self.random: random.Random = random_generator if random_generator is not None else quizsolver.random
         self.epochs_used = 0
         self.enabled = True
+        # Id of the most probable answer of each question (column of the state store)
+        self._most_probable_answer = self._add_question_column("most_probable_answer", typecode='q')
+
+    def _add_answer_column(self, column_name: str, *, typecode: str = 'i', default: int = 0) -> 'array':
+        """
+        Register a column of this strategy indexed by answer id in the state store.
+        """
+        return self._quizsolver.state.add_answer_column(f"{self.name}.{column_name}",
+                                                        typecode=typecode, default=default)
+
+    def _add_question_column(self, column_name: str, *, typecode: str = 'i', default: int = -1) -> 'array':
+        """
+        Register a column of this strategy indexed by question id in the state store.
+        """
+        return self._quizsolver.state.add_question_column(f"{self.name}.{column_name}",
+                                                          typecode=typecode, default=default)
+
+    def _create_moving_average(self, *, initial_value: float) -> MovingAverage:
+        """
+        Create a moving average with the mode and history settings of the quiz solver setup.
+        """
+        setup = self._quizsolver.setup
+        return MovingAverage(initial_value=initial_value,
+                             history_size=setup.moving_average_history_size,
+                             history_policy=setup.moving_average_history_policy,
+                             mode=setup.moving_average_mode,
+                             alpha=setup.moving_average_alpha)
+
+    def _get_answer(self, question: 'Question', answer_index: int) -> 'Answer':
+        """
+        Get an answer of a question by its answer id in the state store.
+        """
+        return question.answers[answer_index - question.answer_offset]
+
+    def _pick_initial_answer(self, question: 'Question') -> 'Answer':
+        """
+        Pick a random answer of a new question. A question solved when it is added
+        (e.g. known from the knowledge base) starts with its correct answer. The random generator
+        is advanced either way, so known questions do not change the choices for other questions.
+        Args:
+            question (Question): The new question.
+        Returns:
+            Answer: The initial most probable answer.
+        """
+        answer = question.answers[self.random.randint(0, len(question.answers) - 1)]
+        if question.is_solved:
+            for candidate in question.answers:
+                if candidate.is_correct:
+                    return candidate
+        return answer
+
+    def get_most_probable_answer(self, question: 'Question') -> 'Answer':
+        """
+        Get the answer of a question this strategy currently considers the most probable.
+        Args:
+            question (Question): The question to process.
+        Returns:
+            Answer: The most probable answer.
+        """
+        return question.answers[self._most_probable_answer[question.index] - question.answer_offset]
 
     def initialize_question(self, *, question: 'Question'):
         """
@@ -18,6 +85,43 @@ class Strategy:
         """
         raise NotImplementedError("This method should be implemented by subclasses.")
 
+    def on_question_solved(self, *, question: 'Question'):
+        """
+        Called by the quiz solver when a question is marked as solved.
+        Strategies keeping indexes of unsolved questions update them here.
+        Args:
+            question (Question): The solved question.
+        """
+        pass
+
+    def checkpoint_state(self) -> dict:
+        """
+        Get the state of the strategy for a checkpoint (columns are stored by the state store).
+        Subclasses extend the state of their base class.
+        The state of the random generator of the strategy is stored by the quiz solver
+        unless the strategy has a random generator of its own.
+        Returns:
+            dict: Scalars and arrays of the state.
+        """
+        return {
+            "epochs_used": self.epochs_used,
+            "enabled": self.enabled,
+            "random": random_state_dict(self.random.getstate())
+            if self.random is not self._quizsolver.random else None
+        }
+
+    def restore_checkpoint_state(self, state: dict, *, questions: list['Question']):
+        """
+        Restore a state returned by checkpoint_state.
+        Args:
+            state (dict): The state.
+            questions (list of Question): Questions of the quiz solver in the order of their ids.
+        """
+        self.epochs_used = state["epochs_used"]
+        self.enabled = state["enabled"]
+        if state.get("random") is not None:
+            self.random.setstate(random_state_from_dict(state["random"]))
+
     def give_answer(self, *, question: 'Question') -> dict:
         """
         Process a question when it is presented in the quiz.
@@ -26,6 +130,38 @@ class Strategy:
         """
         raise NotImplementedError("This method should be implemented by subclasses.")
 
+    def give_answers(self, *, questions: list['Question']) -> list[dict]:
+        """
+        Process all questions of a quiz at once.
+        Args:
+            questions (list of Question): The questions to process.
+        Returns:
+            list of dict: Response dictionaries of the questions in the same order.
+        """
+        give_answer = self.give_answer
+        return [give_answer(question=question) for question in questions]
+
+    @staticmethod
+    def _question_ids(questions: list['Question']) -> np.ndarray:
+        """
+        Get the ids of questions as an array for reading columns of a whole quiz at once.
+        """
+        return np.fromiter((question.index for question in questions), dtype=np.int64, count=len(questions))
+
+    def _to_response_dicts(self, questions: list['Question'], question_ids: np.ndarray,
+                           answer_ids: np.ndarray) -> list[dict]:
+        """
+        Build the responses of a quiz from the response templates of its questions.
+        Args:
+            questions (list of Question): The questions of the quiz.
+            question_ids (np.ndarray): Ids of the questions, see _question_ids.
+            answer_ids (np.ndarray): Id of the answer given to each question.
+        Returns:
+            list of dict: Response dictionaries of the questions in the same order.
+        """
+        answer_offsets = np.frombuffer(self._quizsolver.state.question_offsets, dtype=np.int64)[question_ids]
+        return Question.to_response_dicts(questions, answer_positions=(answer_ids - answer_offsets).tolist())
+
     def process_quiz_feedback(self, *, score: float, max_score: float):
         """
         Process feedback after a quiz has been submitted and scored.
@@ -39,6 +175,14 @@ class Strategy:
         Plot any relevant data for the strategy.
         """
         raise NotImplementedError("This method should be implemented by subclasses.")
+
+    def plot_snapshot(self) -> dict | None:
+        """
+        Create a compact snapshot of the data shown by plot(), which can be drawn in another process.
+        Returns:
+            dict | None: The snapshot or None if there is nothing to plot yet.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
     
     def print_statistics(self) -> str:
         """
@@ -1,47 +1,60 @@
 import random
-from matplotlib import pyplot as plt
-from .common import epsilon, minmax, inverse_square_likelyhood
+import numpy as np
+from .common import epsilon, minmax, inverse_square_likelyhood, progress_bar
 from .strategy import Strategy
 from .movingaverage import MovingAverage
+from .plotrenderer import PALETTE_INDEX, PLOT_ROWS, PlotCanvas, create_plot_snapshot
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-    from .answer import Answer
     from .question import Question
     from .quizsolver import QuizSolver
 
 class StrategyA(Strategy):
-    def __init__(self, *, quizsolver: 'QuizSolver', name: str = "A", is_negative: bool = False):
-        super().__init__(quizsolver=quizsolver, name=name)
+    def __init__(self, *, quizsolver: 'QuizSolver', name: str = "A", is_negative: bool = False,
+                 random_generator: random.Random | None = None):
+        super().__init__(quizsolver=quizsolver, name=name, random_generator=random_generator)
         self._ma: MovingAverage | None = None
         self.is_negative = is_negative
+        # Counter of each answer (column of the state store)
+        self._counter = self._add_answer_column("counter")
         self.latest_score: float = 0.0
         self.latest_max_score: float = 1.0
         # Variables for charts
         self.figure_initialized: bool = False
         self.figure = None
         self.axes: list = []
-        self.axes_data: list = []
+        self.plot_canvas: PlotCanvas | None = None
 
     def initialize_question(self, *, question: 'Question'):
         """
         Initialize the strategy before starting the quiz solving process.
         """
-        # Initialize data for each answer
-        for answer in question.answers:
-            answer.data[self.name] = {
-                "most_probable": False,
-                "counter": 0
-            }
         # Select a random most probable answer
-        random_index = random.randint(0, len(question.answers) - 1)
-        question.answers[random_index].data[self.name] = {
-            "most_probable": True,
-            "counter": 1
-        }
-        # Store most probable answer in question data
-        question.data[self.name] = {
-            "most_probable_answer": question.answers[random_index]
-        }
+        most_probable_answer = self._pick_initial_answer(question)
+        self._counter[most_probable_answer.index] = 1
+        # Store most probable answer of the question
+        self._most_probable_answer[question.index] = most_probable_answer.index
+
+    def checkpoint_state(self) -> dict:
+        """
+        Get the state of the strategy for a checkpoint.
+        """
+        state = super().checkpoint_state()
+        state.update({
+            "ma": self._ma.checkpoint_state() if self._ma is not None else None,
+            "latest_score": self.latest_score,
+            "latest_max_score": self.latest_max_score
+        })
+        return state
+
+    def restore_checkpoint_state(self, state: dict, *, questions: list['Question']):
+        """
+        Restore a state returned by checkpoint_state.
+        """
+        super().restore_checkpoint_state(state, questions=questions)
+        self._ma = MovingAverage.from_checkpoint_state(state["ma"]) if state["ma"] is not None else None
+        self.latest_score = state["latest_score"]
+        self.latest_max_score = state["latest_max_score"]
 
     def give_answer(self, *, question: 'Question') -> dict:
         """
@@ -49,7 +62,18 @@ class StrategyA(Strategy):
         Args:
             question (Question): The question to process.
         """
-        return question.to_response_dict(strategy_name=self.name)
+        return question.to_response_dict(most_probable_answer=self.get_most_probable_answer(question))
+
+    def give_answers(self, *, questions: list['Question']) -> list[dict]:
+        """
+        Process all questions of a quiz at once.
+        Args:
+            questions (list of Question): The questions to process.
+        """
+        question_ids = self._question_ids(questions)
+        # Most probable answers of the whole quiz are read from the column at once
+        answer_ids = np.frombuffer(self._most_probable_answer, dtype=np.int64)[question_ids]
+        return self._to_response_dicts(questions, question_ids, answer_ids)
     
     def _change_most_probable_answer(self, question: 'Question'):
         """
@@ -69,16 +93,14 @@ class StrategyA(Strategy):
                              "This should not happen.")
         # Select a new most probable answer randomly from possible answers
         # and initialize its data
-        new_most_probable_answer = random.choice(possible_answers)
-        new_most_probable_answer.data[self.name]["most_probable"] = True
-        new_most_probable_answer.data[self.name]["counter"] = 1
-        # Update question data
-        question.data[self.name]["most_probable_answer"] = new_most_probable_answer
-        # Reset data for other answers
+        new_most_probable_answer = self.random.choice(possible_answers)
+        # Reset counters of other answers
+        counter = self._counter
         for answer in question.answers:
-            if answer != new_most_probable_answer:
-                answer.data[self.name]["most_probable"] = False
-                answer.data[self.name]["counter"] = 0
+            counter[answer.index] = 0
+        counter[new_most_probable_answer.index] = 1
+        # Update most probable answer of the question
+        self._most_probable_answer[question.index] = new_most_probable_answer.index
 
     def _initialize_moving_average(self):
         """
@@ -92,7 +114,7 @@ class StrategyA(Strategy):
                 probability.append(1 / len(question.answers))
             average_probability = sum(probability) / len(probability)
             # initialize moving average
-            self._ma = MovingAverage(initial_value=average_probability)
+            self._ma = self._create_moving_average(initial_value=average_probability)
 
     def _update_moving_average_window_size(self):
         """
@@ -171,32 +193,38 @@ class StrategyA(Strategy):
         if self._ma is None:
             raise ValueError("Moving average not initialized.")
         self._update_moving_average_window_size()
-        # Update moving average with current factor
-        self._ma.add_value(factor)
-        # shuffle sorted latest quiz questions
-        questions_to_train = self._quizsolver._latest_quiz
+        # Update moving average with current factor weighted by the quiz size
+        self._ma.add_value(factor, len(self._quizsolver._latest_quiz))
+        # Decide once for the whole quiz whether counters are increased or decreased
+        increase = (factor - epsilon > self._ma.moving_average and self.is_negative == False) or \
+                   (factor + epsilon < self._ma.moving_average and self.is_negative == True)
+        # Train answer probabilities of unsolved questions of the latest quiz
+        latest_quiz = self._quizsolver._latest_quiz
+        state = self._quizsolver.state
+        question_ids = np.fromiter((question.index for question in latest_quiz),
+                                   dtype=np.int64, count=len(latest_quiz))
         #questions_to_train = self.get_questions_to_train()
-        # train answer probabilities
-        for question in questions_to_train:
-            # If question is already solved then continue
-            if question.is_solved:
-                continue
-            # select most probable answer
-            most_probable_answer: Answer = question.data[self.name]["most_probable_answer"]
-            # If the most probable answer is marked as incorrect, change it
-            if most_probable_answer.is_correct == False:
-                self._change_most_probable_answer(question)
-            # Update counter based on score factor and moving average
-            elif (factor - epsilon > self._ma.moving_average and self.is_negative == False) or \
-                 (factor + epsilon < self._ma.moving_average and self.is_negative == True):
-                # Increase counter for most probable answer
-                most_probable_answer.data[self.name]["counter"] += 1
-            else:
-                # Decrease counter for most probable answer
-                most_probable_answer.data[self.name]["counter"] -= 1
-                # Change most probable answer if counter is zero or negative
-                if most_probable_answer.data[self.name]["counter"] <= epsilon:
-                    self._change_most_probable_answer(question)
+        rows = np.flatnonzero(np.frombuffer(state.is_solved, dtype=np.int8)[question_ids] == 0)
+        if len(rows) == 0:
+            return
+        answer_ids = np.frombuffer(self._most_probable_answer, dtype=np.int64)[question_ids[rows]]
+        # Most probable answers marked as incorrect are changed without updating their counters
+        incorrect = np.frombuffer(state.is_correct, dtype=np.int8)[answer_ids] == 0
+        counter = np.frombuffer(self._counter, dtype=self._counter.typecode)
+        if increase:
+            # Increase counters of most probable answers
+            np.add.at(counter, answer_ids[~incorrect], 1)
+            change = incorrect
+        else:
+            # Decrease counters of most probable answers
+            # and change most probable answers whose counter is zero or negative
+            np.subtract.at(counter, answer_ids[~incorrect], 1)
+            change = incorrect | (counter[answer_ids] <= epsilon)
+        # release the view of the counter column before it can be resized
+        del counter
+        # Change most probable answers in the order of the quiz
+        for row in rows[change]:
+            self._change_most_probable_answer(latest_quiz[row])
 
     def get_progress(self) -> float:
         """
@@ -211,6 +239,28 @@ class StrategyA(Strategy):
         else:
             return 1.0 - self._ma.moving_average
     
+    def plot_snapshot(self) -> dict | None:
+        """
+        Create a compact snapshot of the data shown by plot().
+        Returns:
+            dict | None: The snapshot or None if the moving average is not initialized yet.
+        """
+        # Check if moving averages are initialized
+        if self._ma is None:
+            return None
+        # Bars of answers: the counter, or a placeholder if the answer is not counted
+        counter = np.frombuffer(self._counter, dtype=self._counter.typecode)
+        is_counted = counter > 0
+        values = np.where(is_counted, counter, 0.5)
+        colors = np.where(is_counted, PALETTE_INDEX["black"], PALETTE_INDEX["lightgray"]).astype(np.uint8)
+        return create_plot_snapshot(title=f'Strategy {self.name}. '
+                                          f'Avg0: {self._ma.moving_average:.4f}',
+                                    label='MA Moving Average',
+                                    history=self._ma.history_of_moving_averages,
+                                    state=self._quizsolver.state,
+                                    values=values,
+                                    colors=colors)
+
     def plot(self):
         """
         Create a plot composed of 5 subplots.
@@ -219,78 +269,23 @@ class StrategyA(Strategy):
         Third subplot: Probabilities of all second answers in questions "self.q"
         Fourth subplot: Probabilities of all third answers in questions "self.q"
         Fifth subplot: Probabilities of all fourth answers in questions "self.q"
-        0.01 second pause to update the plot.
+        The artists are created once and updated in place, see PlotCanvas.
+        Nothing is plotted (and matplotlib is not imported) in headless mode.
         """
-        rows = 5
-        cols = 1
-        answers_per_row = 400
-        # Calculate maximum answers to plot
-        max_answers = rows * answers_per_row
+        if self._quizsolver.setup.headless:
+            return
+        # Import pyplot only when plotting, it is slow to import and not needed in headless mode
+        import matplotlib.pyplot as plt
         # Initialize figure and axes if not already done
         if not self.figure_initialized:
-            self.figure, self.axes = plt.subplots(rows, cols, figsize=(13, 5.5))
+            self.figure, self.axes = plt.subplots(PLOT_ROWS, 1, figsize=(13, 5.5))
+            self.plot_canvas = PlotCanvas(self.figure, self.axes)
+            plt.show(block=False)
             self.figure_initialized = True
-            # initialize axes data
-            for row in range(rows):
-                self.axes_data.append([])
-        # Check if moving averages are initialized
-        if self._ma is None:
+        snapshot = self.plot_snapshot()
+        if snapshot is None:
             return
-        # Clear and update first subplot
-        self.axes[0].clear()
-        self.axes[0].set_title(f'Strategy {self.name}. '
-                               f'Avg0: {self._ma.moving_average:.4f}')
-        self.axes[0].plot(self._ma.history_of_moving_averages, label='MA Moving Average', color='blue')
-        self.axes[0].legend()
-        
-        # Clear and update other subplots
-        for i in range(1, 5):
-            self.axes[i].clear()
-        # draw answers
-        colors = []
-        answers = []
-        answers_count = 0
-        questions = list(self._quizsolver.questions.values())
-        for question in questions:
-            # If the limit of answers to plot is reached, break
-            if answers_count >= max_answers:
-                break
-            for answer in question.answers:
-                # If the limit of answers to plot is reached, break
-                if answers_count >= max_answers:
-                    break
-                if answer.data[self.name]["counter"] > 0:
-                    colors.append('black')
-                    answers.append(answer.data[self.name]["counter"])
-                else:
-                    colors.append('lightgray')
-                    answers.append(0.5)
-            # increment answers count
-            answers_count += len(question.answers) + 4
-            colors.append('lightgray')
-            colors.append('lightgray')
-            colors.append('lightgray')
-            colors.append('lightgray')
-            answers.append(0)
-            answers.append(0)
-            answers.append(0)
-            answers.append(0)
-
-        if len(answers) < max_answers:
-            # pad answers and colors to max_answers
-            answers += [0] * (max_answers - len(answers))
-            colors += ['black'] * (max_answers - len(colors))
-
-        for i in range(1, 5):
-            # get data for this subplot
-            start_index = (i - 1) * answers_per_row
-            end_index = start_index + answers_per_row
-            data = answers[start_index:end_index]
-            color_data = colors[start_index:end_index]
-            self.axes[i].xaxis.set_visible(False)
-            self.axes[i].bar(range(len(data)), data, color=color_data, alpha=0.7)
-
-        plt.pause(0.01)
+        self.plot_canvas.draw(snapshot)
     
     def print_statistics(self) -> str:
         """
@@ -303,8 +298,5 @@ class StrategyA(Strategy):
         result = f'Strategy {self.name} ({"Enabled" if self.enabled else "Disabled"}):\n'
         result += f'  Epochs used: {self.epochs_used}\n'
         result += f'  Moving Average: {moving_average * 100:,.3f}% (Window Size={window_size})\n'
-        # draw progress bar
-        bar_length = 50
-        bar_used = int(self.get_progress() * bar_length)
-        result += f"[" + "#" * bar_used + "-" * (bar_length - bar_used) + "]\n"
+        result += progress_bar(self.get_progress()) + "\n"
         return result
\ No newline at end of file
@@ -1,8 +1,10 @@
 import random
-from .common import epsilon, inverse_square_likelyhood, minmax
+import numpy as np
+from array import array
+from .common import IndexedSet, epsilon, inverse_square_likelyhood, progress_bar
 from .strategy import Strategy
 from .movingaverage import MovingAverage
-import matplotlib.pyplot as plt
+from .plotrenderer import PALETTE_INDEX, PLOT_ROWS, PlotCanvas, create_plot_snapshot
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .answer import Answer
@@ -10,16 +12,32 @@ if TYPE_CHECKING:
     from .quizsolver import QuizSolver
 
 class StrategyB(Strategy):
-    def __init__(self, *, quizsolver: 'QuizSolver', name: str = "B", is_negative: bool = False):
-        super().__init__(quizsolver=quizsolver, name=name)
+    def __init__(self, *, quizsolver: 'QuizSolver', name: str = "B", is_negative: bool = False,
+                 random_generator: random.Random | None = None):
+        super().__init__(quizsolver=quizsolver, name=name, random_generator=random_generator)
         self.finished_measurements: int = 0
         self._ma0: MovingAverage | None = None
         self._ma1: MovingAverage | None = None
         self._ma2: MovingAverage | None = None
         # self.training_group: list['Question'] = []
-        self.training_batch: list['Question'] = []
-        self.training_minibatch: list['Question'] = []
+        # Training pool and the minibatch picked from it (O(1) membership test and removal)
+        self.training_batch: IndexedSet = IndexedSet()
+        self.training_minibatch: IndexedSet = IndexedSet()
         self.is_negative = is_negative
+        # Counters of each answer and most probable answers of each question
+        # for group 1 and group 2 (columns of the state store)
+        self._counters = {
+            "1": self._add_answer_column("counter1"),
+            "2": self._add_answer_column("counter2")
+        }
+        self._most_probable_answers = {
+            "1": self._add_question_column("most_probable_answer1", typecode='q'),
+            "2": self._add_question_column("most_probable_answer2", typecode='q')
+        }
+        # Index of unsolved questions bucketed by counter1 of their most probable answer 1
+        # and the bucket each question is currently stored in (-1 if not indexed)
+        self._unsolved_by_counter1: dict[int, IndexedSet] = {}
+        self._counter1_bucket = self._add_question_column("counter1_bucket", typecode='q')
         self.latest_score: float = 0.0
         self.latest_max_score: float = 1.0
         self.window_size_delta: int = 0
@@ -32,24 +50,21 @@ class StrategyB(Strategy):
         self.figure_initialized: bool = False
         self.figure = None
         self.axes: list = []
-        self.axes_data: list = []
+        self.plot_canvas: PlotCanvas | None = None
 
     def pick_training_batch(self):
         """
         Pick a training batch of questions for the current quiz.
         """
-        self.training_batch = []
-        # Get all questions from the quiz solver
-        unsolved_questions = [q for q in self._quizsolver.questions.values() if not q.is_solved]
-        len_unsolved_questions = len(unsolved_questions)
+        self.training_batch.clear()
+        # Only non-empty buckets of unsolved questions are kept in the index
+        buckets = self._unsolved_by_counter1
         # If there are no questions, set training group to empty and return
-        if len_unsolved_questions == 0:
+        if len(buckets) == 0:
             return
         # Get min and max counter1 values across all questions
-        min_counter1, _, max_counter1, _ = minmax(
-            unsolved_questions,
-            key=lambda q: q.data[self.name]["most_probable_answer1"].data[self.name]["counter1"]
-        )
+        min_counter1 = min(buckets)
+        max_counter1 = max(buckets)
         # Compute difference between min and max counter1
         min_max_counter_diff = max_counter1 - min_counter1
         # Determine minimum likelyhood based on counter difference
@@ -61,40 +76,64 @@ class StrategyB(Strategy):
             min_likelyhood = 0.2
         else:
             min_likelyhood = 0.1
-        # Assign questions to training batch based on counter1
-        for question in unsolved_questions:
-            counter1 = question.data[self.name]["most_probable_answer1"].data[self.name]["counter1"]
-            random_value = random.uniform(0, 1)
+        # Assign questions to training batch based on counter1.
+        # Every question of a bucket is included with the same probability, so instead of
+        # drawing a random value per question, draw how many questions of the bucket are included
+        # and pick that many questions uniformly at random.
+        for counter1_value, bucket in buckets.items():
             likelyhood_in_training_batch = inverse_square_likelyhood(
                 min=min_counter1,
                 max=max_counter1,
                 min_likelyhood=min_likelyhood,
                 max_likelyhood=1.0,
-                value=counter1
+                value=counter1_value
             )
-            # Determine if question is included in training batch
-            in_training_batch = random_value <= likelyhood_in_training_batch + epsilon
-            if in_training_batch:
-                self.training_batch.append(question)
+            probability = min(likelyhood_in_training_batch + epsilon, 1.0)
+            how_many_to_pick = self.random.binomialvariate(len(bucket), probability)
+            self.training_batch.update(self.random.sample(bucket.items, how_many_to_pick))
+
+    def _update_training_index(self, question: 'Question'):
+        """
+        Move a question to the bucket matching the counter1 value of its most probable answer 1,
+        or remove it from the index if it is solved.
+        Args:
+            question (Question): The question to process.
+        """
+        buckets = self._unsolved_by_counter1
+        old_counter1_value = self._counter1_bucket[question.index]
+        if question.is_solved:
+            new_counter1_value = -1
+        else:
+            new_counter1_value = self._counters["1"][self._most_probable_answers["1"][question.index]]
+        if old_counter1_value == new_counter1_value:
+            return
+        # Remove question from its old bucket and drop the bucket if it becomes empty
+        if old_counter1_value != -1:
+            bucket = buckets[old_counter1_value]
+            bucket.remove(question)
+            if len(bucket) == 0:
+                del buckets[old_counter1_value]
+        # Add question to its new bucket
+        if new_counter1_value != -1:
+            bucket = buckets.get(new_counter1_value)
+            if bucket is None:
+                bucket = buckets[new_counter1_value] = IndexedSet()
+            bucket.add(question)
+        self._counter1_bucket[question.index] = new_counter1_value
 
     def pick_training_minibatch(self, *, how_many_to_pick: int | None = None):
         # Reset training batch if empty
         if len(self.training_batch) == 0:
             self.pick_training_batch()
         # Pick random questions from training batch and store them in training minibatch
-        self.training_minibatch = random.sample(
-            self.training_batch,
+        self.training_minibatch = IndexedSet(self.random.sample(
+            self.training_batch.items,
             k=min(how_many_to_pick if how_many_to_pick is not None else 1,
                   len(self.training_batch))
-        )
+        ))
         # Remove selected questions from training batch
-        questions_to_remove = []
-        for question in self.training_batch:
-            if question in self.training_minibatch:
-                questions_to_remove.append(question)
-        for question in questions_to_remove:
+        for question in self.training_minibatch:
             self.training_batch.remove(question)
-        
 
 
     # def pick_training_group(self):
@@ -162,31 +201,80 @@ class StrategyB(Strategy):
         """
         Initialize the strategy before starting the quiz solving process.
         """
-        # Initialize data for each answer
-        for answer in question.answers:
-            answer.data[self.name] = {
-                "most_probable": False,
-                "most_probable1": False,
-                "most_probable2": False,
-                "counter1": 0,
-                "counter2": 0
-            }
         # Select a random most probable answer 1
-        random_index1 = random.randint(0, len(question.answers) - 1)
-        question.answers[random_index1].data[self.name]["most_probable"] = True
-        question.answers[random_index1].data[self.name]["most_probable1"] = True
-        question.answers[random_index1].data[self.name]["counter1"] = 1
+        answer1 = self._pick_initial_answer(question)
+        self._counters["1"][answer1.index] = 1
         # Select a random most probable answer 2
-        random_index2 = random.randint(0, len(question.answers) - 1)
-        question.answers[random_index2].data[self.name]["most_probable2"] = True
-        question.answers[random_index2].data[self.name]["counter2"] = 1
-        # Store most probable answer in question data
-        question.data[self.name] = {
-            "selected_for_measurement_counter": 0,
-            "most_probable_answer": question.answers[random_index1],
-            "most_probable_answer1": question.answers[random_index1],
-            "most_probable_answer2": question.answers[random_index2]
-        }
+        answer2 = self._pick_initial_answer(question)
+        self._counters["2"][answer2.index] = 1
+        # Store most probable answers of the question
+        self._most_probable_answer[question.index] = answer1.index
+        self._most_probable_answers["1"][question.index] = answer1.index
+        self._most_probable_answers["2"][question.index] = answer2.index
+        self._update_training_index(question)
+
+    def on_question_solved(self, *, question: 'Question'):
+        """
+        Remove a solved question from the index of unsolved questions.
+        Args:
+            question (Question): The solved question.
+        """
+        self._update_training_index(question)
+
+    def checkpoint_state(self) -> dict:
+        """
+        Get the state of the strategy for a checkpoint.
+        Sets of questions are stored as ids in their iteration order and the buckets
+        of the index of unsolved questions in the order of the index,
+        so random picks from them are repeated exactly after a restore.
+        """
+        state = super().checkpoint_state()
+        buckets = self._unsolved_by_counter1
+        state.update({
+            "finished_measurements": self.finished_measurements,
+            "ma0": self._ma0.checkpoint_state() if self._ma0 is not None else None,
+            "ma1": self._ma1.checkpoint_state() if self._ma1 is not None else None,
+            "ma2": self._ma2.checkpoint_state() if self._ma2 is not None else None,
+            "training_batch": array('q', [question.index for question in self.training_batch]),
+            "training_minibatch": array('q', [question.index for question in self.training_minibatch]),
+            "unsolved_by_counter1": {
+                "counter1_values": array('q', buckets),
+                "sizes": array('q', [len(bucket) for bucket in buckets.values()]),
+                "questions": array('q', [question.index for bucket in buckets.values() for question in bucket])
+            },
+            "latest_score": self.latest_score,
+            "latest_max_score": self.latest_max_score,
+            "window_size_delta": self.window_size_delta,
+            "measurement_rounds": self._measurement_rounds,
+            "hit_counter1": self._hit_counter1,
+            "hit_counter2": self._hit_counter2
+        })
+        return state
+
+    def restore_checkpoint_state(self, state: dict, *, questions: list['Question']):
+        """
+        Restore a state returned by checkpoint_state.
+        """
+        super().restore_checkpoint_state(state, questions=questions)
+        self.finished_measurements = state["finished_measurements"]
+        self._ma0 = MovingAverage.from_checkpoint_state(state["ma0"]) if state["ma0"] is not None else None
+        self._ma1 = MovingAverage.from_checkpoint_state(state["ma1"]) if state["ma1"] is not None else None
+        self._ma2 = MovingAverage.from_checkpoint_state(state["ma2"]) if state["ma2"] is not None else None
+        self.training_batch = IndexedSet(questions[i] for i in state["training_batch"])
+        self.training_minibatch = IndexedSet(questions[i] for i in state["training_minibatch"])
+        index = state["unsolved_by_counter1"]
+        self._unsolved_by_counter1 = {}
+        first = 0
+        for counter1_value, size in zip(index["counter1_values"], index["sizes"]):
+            self._unsolved_by_counter1[counter1_value] = IndexedSet(questions[i] for i in
+                                                                    index["questions"][first:first + size])
+            first += size
+        self.latest_score = state["latest_score"]
+        self.latest_max_score = state["latest_max_score"]
+        self.window_size_delta = state["window_size_delta"]
+        self._measurement_rounds = state["measurement_rounds"]
+        self._hit_counter1 = state["hit_counter1"]
+        self._hit_counter2 = state["hit_counter2"]
 
     def give_answer(self, *, question: 'Question') -> dict:
         """
@@ -194,22 +282,51 @@ class StrategyB(Strategy):
         Args:
             question (Question): The question to process.
         """
-        if self.epochs_used % 2 == 1 and question in self.training_minibatch:
-            for answer in question.answers:
-                answer.data[self.name]["most_probable"] = answer.data[self.name]["most_probable2"]
-            question.data[self.name]["most_probable_answer"] = question.data[self.name]["most_probable_answer2"]
+        use_answer2 = self.epochs_used % 2 == 1 and question in self.training_minibatch
+        return self._answer_question(question, use_answer2=use_answer2)
+
+    def give_answers(self, *, questions: list['Question']) -> list[dict]:
+        """
+        Process all questions of a quiz at once.
+        Args:
+            questions (list of Question): The questions to process.
+        """
+        question_ids = self._question_ids(questions)
+        answer_ids = np.frombuffer(self._most_probable_answers["1"], dtype=np.int64)[question_ids]
+        # Questions of the training minibatch are answered with answer 2 in odd epochs only
+        if self.epochs_used % 2 == 1:
+            training_minibatch = self.training_minibatch
+            use_answer2 = np.fromiter((question in training_minibatch for question in questions),
+                                      dtype=np.bool_, count=len(questions))
+            answer_ids = np.where(use_answer2,
+                                  np.frombuffer(self._most_probable_answers["2"], dtype=np.int64)[question_ids],
+                                  answer_ids)
+            answers2_count = int(np.count_nonzero(use_answer2))
+        else:
+            answers2_count = 0
+        self._hit_counter1 += len(questions) - answers2_count
+        self._hit_counter2 += answers2_count
+        # Answered most probable answers of the whole quiz are stored at once
+        np.frombuffer(self._most_probable_answer, dtype=np.int64)[question_ids] = answer_ids
+        return self._to_response_dicts(questions, question_ids, answer_ids)
+
+    def _answer_question(self, question: 'Question', *, use_answer2: bool) -> dict:
+        """
+        Answer a question with its most probable answer 1 or most probable answer 2.
+        Args:
+            question (Question): The question to process.
+            use_answer2 (bool): Whether to answer with the most probable answer 2.
+        """
+        group_index = "2" if use_answer2 else "1"
+        if use_answer2:
             self._hit_counter2 += 1
-            return question.to_response_dict(strategy_name=self.name)
-            # return question.to_response_dict(strategy_name=self.name,
-            #                                  most_probable_key="most_probable2")
         else:
-            for answer in question.answers:
-                answer.data[self.name]["most_probable"] = answer.data[self.name]["most_probable1"]
-            question.data[self.name]["most_probable_answer"] = question.data[self.name]["most_probable_answer1"]
             self._hit_counter1 += 1
-            return question.to_response_dict(strategy_name=self.name)
-            # return question.to_response_dict(strategy_name=self.name,
-            #                                  most_probable_key="most_probable1")
+        # Answer with the most probable answer of the group
+        most_probable_answer_index = self._most_probable_answers[group_index][question.index]
+        self._most_probable_answer[question.index] = most_probable_answer_index
+        most_probable_answer = question.answers[most_probable_answer_index - question.answer_offset]
+        return question.to_response_dict(most_probable_answer=most_probable_answer)
     
     def _change_most_probable_answer1(self, question: 'Question'):
         """
@@ -220,17 +337,15 @@ class StrategyB(Strategy):
         """
         # Switch current most probable answer to second most probable
         # Get current most probable answers
-        most_probable_answer1: Answer = question.data[self.name]["most_probable_answer1"]
-        most_probable_answer2: Answer = question.data[self.name]["most_probable_answer2"]
+        counter1 = self._counters["1"]
+        most_probable_answer1 = self._most_probable_answers["1"]
+        most_probable_answer2_index = self._most_probable_answers["2"][question.index]
         # Decrease counter of current most probable answer to zero
-        most_probable_answer1.data[self.name]["most_probable1"] = False
-        most_probable_answer1.data[self.name]["counter1"] = 0
+        counter1[most_probable_answer1[question.index]] = 0
         # Set most probable answer 1 to most probable answer 2
-        most_probable_answer1 = most_probable_answer2
-        most_probable_answer1.data[self.name]["most_probable1"] = True
-        most_probable_answer1.data[self.name]["counter1"] = 1
-        # Update question data
-        question.data[self.name]["most_probable_answer1"] = most_probable_answer1
+        counter1[most_probable_answer2_index] = 1
+        most_probable_answer1[question.index] = most_probable_answer2_index
+        self._update_training_index(question)
         # Change second most probable answer to a new random answer
         self._change_most_probable_answer2(question)
 
@@ -240,12 +355,12 @@ class StrategyB(Strategy):
         Args:
             question (Question): The question to process.
         """
-        most_probable_answer1: Answer = question.data[self.name]["most_probable_answer1"]
+        most_probable_answer1_index = self._most_probable_answers["1"][question.index]
         # Get list of possible answers to select from
         possible_answers = []
         for answer in question.answers:
             #if answer.is_correct is None and answer != most_probable_answer:
-            if answer.is_correct is None and answer != most_probable_answer1:
+            if answer.is_correct is None and answer.index != most_probable_answer1_index:
                 possible_answers.append(answer)
         # this should never happen        
         if len(possible_answers) < 1:
@@ -253,16 +368,14 @@ class StrategyB(Strategy):
                              "This should not happen.")
         # Select a new most probable answer randomly from possible answers
         # and initialize its data
-        new_most_probable_answer = random.choice(possible_answers)
-        new_most_probable_answer.data[self.name]["most_probable2"] = True
-        new_most_probable_answer.data[self.name]["counter2"] = 1
-        # Update question data
-        question.data[self.name]["most_probable_answer2"] = new_most_probable_answer
-        # Reset data for other answers
+        new_most_probable_answer = self.random.choice(possible_answers)
+        # Reset counters of other answers
+        counter2 = self._counters["2"]
         for answer in question.answers:
-            if answer != new_most_probable_answer:
-                answer.data[self.name]["most_probable2"] = False
-                answer.data[self.name]["counter2"] = 0
+            counter2[answer.index] = 0
+        counter2[new_most_probable_answer.index] = 1
+        # Update most probable answer 2 of the question
+        self._most_probable_answers["2"][question.index] = new_most_probable_answer.index
     
     def increase_counter(self, question: 'Question', group_index: str):
         """
@@ -271,8 +384,10 @@ class StrategyB(Strategy):
             question (Question): The question to process.
             group_index (str): The group index ("1" or "2") to determine which counter to increase.
         """
-        most_probable_answer: Answer = question.data[self.name][f"most_probable_answer{group_index}"]
-        most_probable_answer.data[self.name][f"counter{group_index}"] += 1
+        most_probable_answer_index = self._most_probable_answers[group_index][question.index]
+        self._counters[group_index][most_probable_answer_index] += 1
+        if group_index == "1":
+            self._update_training_index(question)
 
     def decrease_counter(self, question: 'Question', group_index: str):
         """
@@ -281,14 +396,17 @@ class StrategyB(Strategy):
             question (Question): The question to process.
             group_index (str): The group index ("1" or "2") to det ermine which counter to decrease.
         """
-        most_probable_answer: Answer = question.data[self.name][f"most_probable_answer{group_index}"]
-        most_probable_answer.data[self.name][f"counter{group_index}"] -= 1
+        most_probable_answer_index = self._most_probable_answers[group_index][question.index]
+        counter = self._counters[group_index]
+        counter[most_probable_answer_index] -= 1
         # Change most probable answer if counter is zero or negative
-        if most_probable_answer.data[self.name][f"counter{group_index}"] <= epsilon:
+        if counter[most_probable_answer_index] <= epsilon:
             if group_index == "1":
                 self._change_most_probable_answer1(question)
             else:
                 self._change_most_probable_answer2(question)
+        elif group_index == "1":
+            self._update_training_index(question)
 
     def _initialize_moving_average(self):
         """
@@ -302,9 +420,9 @@ class StrategyB(Strategy):
                 probability.append(1 / len(question.answers))
             average_probability = sum(probability) / len(probability)
             # initialize moving average
-            self._ma0 = MovingAverage(initial_value=average_probability)
-            self._ma1 = MovingAverage(initial_value=average_probability)
-            self._ma2 = MovingAverage(initial_value=average_probability)
+            self._ma0 = self._create_moving_average(initial_value=average_probability)
+            self._ma1 = self._create_moving_average(initial_value=average_probability)
+            self._ma2 = self._create_moving_average(initial_value=average_probability)
 
     def _update_moving_average_window_size(self):
         """
@@ -351,11 +469,12 @@ class StrategyB(Strategy):
         if self._ma0 is None or self._ma1 is None or self._ma2 is None:
             raise ValueError("Moving average not initialized.")
         self._update_moving_average_window_size()
-        # Update moving averages with current factor
+        # Update moving averages with current factor weighted by the quiz size
+        quiz_size = len(self._quizsolver._latest_quiz)
         if self.epochs_used % 2 == 0:
-            self._ma1.add_value(factor)
+            self._ma1.add_value(factor, quiz_size)
         else:
-            self._ma2.add_value(factor)
+            self._ma2.add_value(factor, quiz_size)
         # Update epoch count
         self.epochs_used += 1
         # if this is not the right epoch to update, return
@@ -382,8 +501,8 @@ class StrategyB(Strategy):
             if question.is_solved:
                 continue
             # select most probable answer
-            most_probable_answer1: Answer = question.data[self.name]["most_probable_answer1"]
-            most_probable_answer2: Answer = question.data[self.name]["most_probable_answer2"]
+            most_probable_answer1: Answer = self._get_answer(question, self._most_probable_answers["1"][question.index])
+            most_probable_answer2: Answer = self._get_answer(question, self._most_probable_answers["2"][question.index])
             # If the most probable answer is marked as incorrect, change it
             correctness_modified = False
             if most_probable_answer2.is_correct == False:
@@ -423,9 +542,9 @@ class StrategyB(Strategy):
             # else:
             #     self.decrease_counter(question, group_index="2")
 
-            m1 = ma1_median - epsilon * random.uniform(0, 1)
-            m2 = ma2_median - epsilon * random.uniform(0, 1)
-            threshold = threshold - epsilon * random.uniform(0, 1)
+            m1 = ma1_median - epsilon * self.random.uniform(0, 1)
+            m2 = ma2_median - epsilon * self.random.uniform(0, 1)
+            threshold = threshold - epsilon * self.random.uniform(0, 1)
             if self.is_negative == False:
                 if m1 > m2 > threshold:
                     self.increase_counter(question, group_index="1")
@@ -483,6 +602,42 @@ class StrategyB(Strategy):
         else:
             return 1.0 - self._ma0.moving_average
     
+    def plot_snapshot(self) -> dict | None:
+        """
+        Create a compact snapshot of the data shown by plot().
+        Returns:
+            dict | None: The snapshot or None if the moving averages are not initialized yet.
+        """
+        # Check if moving averages are initialized
+        if self._ma0 is None or self._ma1 is None or self._ma2 is None:
+            return None
+        # Bars of answers: counter 1, else counter 2, else a placeholder.
+        # Answers of questions in the training minibatch are highlighted.
+        state = self._quizsolver.state
+        counter1 = np.frombuffer(self._counters["1"], dtype=self._counters["1"].typecode)
+        counter2 = np.frombuffer(self._counters["2"], dtype=self._counters["2"].typecode)
+        is_training_question = np.zeros(state.questions_count, dtype=bool)
+        is_training_question[[question.index for question in self.training_minibatch]] = True
+        answers_per_question = np.diff(np.append(np.frombuffer(state.question_offsets, dtype=np.int64),
+                                                 state.answers_count))
+        is_training = np.repeat(is_training_question, answers_per_question)
+        is_counted1 = counter1 > 0
+        is_counted2 = ~is_counted1 & (counter2 > 0)
+        values = np.where(is_counted1, counter1, np.where(is_counted2, counter2, 0.5))
+        colors = np.select([is_counted1 & is_training, is_counted1, is_counted2 & is_training, is_counted2],
+                           [PALETTE_INDEX["blue"], PALETTE_INDEX["black"],
+                            PALETTE_INDEX["cornflowerblue"], PALETTE_INDEX["gray"]],
+                           PALETTE_INDEX["lightgray"]).astype(np.uint8)
+        return create_plot_snapshot(title=f'Strategy {self.name}. '
+                                          f'Avg0: {self._ma0.moving_average:.4f}, '
+                                          f'Med1: {self._ma1.moving_average:.4f}, '
+                                          f'Med2: {self._ma2.moving_average:.4f}',
+                                    label='MA0 Moving Average',
+                                    history=self._ma0.history_of_moving_averages,
+                                    state=state,
+                                    values=values,
+                                    colors=colors)
+
     def plot(self):
         """
         Create a plot composed of 5 subplots.
@@ -491,86 +646,23 @@ class StrategyB(Strategy):
         Third subplot: Probabilities of all second answers in questions "self.q"
         Fourth subplot: Probabilities of all third answers in questions "self.q"
         Fifth subplot: Probabilities of all fourth answers in questions "self.q"
-        0.01 second pause to update the plot.
+        The artists are created once and updated in place, see PlotCanvas.
+        Nothing is plotted (and matplotlib is not imported) in headless mode.
         """
-        rows = 5
-        cols = 1
-        answers_per_row = 400
-        # Calculate maximum answers to plot
-        max_answers = rows * answers_per_row
+        if self._quizsolver.setup.headless:
+            return
+        # Import pyplot only when plotting, it is slow to import and not needed in headless mode
+        import matplotlib.pyplot as plt
         # Initialize figure and axes if not already done
         if not self.figure_initialized:
-            self.figure, self.axes = plt.subplots(rows, cols, figsize=(13, 5.5))
+            self.figure, self.axes = plt.subplots(PLOT_ROWS, 1, figsize=(13, 5.5))
+            self.plot_canvas = PlotCanvas(self.figure, self.axes)
+            plt.show(block=False)
             self.figure_initialized = True
-            # initialize axes data
-            for row in range(rows):
-                self.axes_data.append([])
-        # Check if moving averages are initialized
-        if self._ma0 is None or self._ma1 is None or self._ma2 is None:
+        snapshot = self.plot_snapshot()
+        if snapshot is None:
             return
-        # Clear and update first subplot
-        self.axes[0].clear()
-        self.axes[0].set_title(f'Strategy {self.name}. '
-                               f'Avg0: {self._ma0.moving_average:.4f}, '
-                               f'Med1: {self._ma1.moving_average:.4f}, '
-                               f'Med2: {self._ma2.moving_average:.4f}')
-        self.axes[0].plot(self._ma0.history_of_moving_averages, label='MA0 Moving Average', color='blue')
-        # self.axes[0].plot(self._ma1.history_of_medians, label='MA1 Median', color='cyan')
-        # self.axes[0].plot(self._ma2.history_of_medians, label='MA2 Median', color='orange')
-        self.axes[0].legend()
-        
-        # Clear and update other subplots
-        for i in range(1, 5):
-            self.axes[i].clear()
-        # draw answers
-        colors = []
-        answers = []
-        answers_count = 0
-        questions = list(self._quizsolver.questions.values())
-        for question in questions:
-            # If the limit of answers is reached, break
-            if answers_count >= max_answers:
-                break
-            is_in_training_group = question in self.training_minibatch
-            for answer in question.answers:
-                # If the limit of answers is reached, break
-                if answers_count >= max_answers:
-                    break
-                if answer.data[self.name]["counter1"] > 0:
-                    colors.append('blue' if is_in_training_group else 'black')
-                    answers.append(answer.data[self.name]["counter1"])
-                elif answer.data[self.name]["counter2"] > 0:
-                    colors.append('cornflowerblue' if is_in_training_group else 'gray')
-                    answers.append(answer.data[self.name]["counter2"])
-                else:
-                    colors.append('lightgray')
-                    answers.append(0.5)
-            # increment answers count
-            answers_count += len(question.answers) + 4
-            colors.append('lightgray')
-            colors.append('lightgray')
-            colors.append('lightgray')
-            colors.append('lightgray')
-            answers.append(0)
-            answers.append(0)
-            answers.append(0)
-            answers.append(0)
-            
-        if len(answers) < max_answers:
-            # pad answers and colors to max_answers
-            answers += [0] * (max_answers - len(answers))
-            colors += ['black'] * (max_answers - len(colors))
-
-        for i in range(1, 5):
-            # get data for this subplot
-            start_index = (i - 1) * answers_per_row
-            end_index = start_index + answers_per_row
-            data = answers[start_index:end_index]
-            color_data = colors[start_index:end_index]
-            self.axes[i].xaxis.set_visible(False)
-            self.axes[i].bar(range(len(data)), data, color=color_data, alpha=0.7)
-
-        plt.pause(0.01)
+        self.plot_canvas.draw(snapshot)
     
     def print_statistics(self) -> str:
         """
@@ -583,8 +675,5 @@ class StrategyB(Strategy):
         result = f'Strategy {self.name} ({"Enabled" if self.enabled else "Disabled"}):\n'
         result += f'  Measurements Finished / Epochs used: {self.finished_measurements} / {self.epochs_used}\n'
         result += f'  Moving Average: {moving_average * 100:,.3f}% (Window Size={window_size})\n'
-        # draw progress bar
-        bar_length = 50
-        bar_used = int(self.get_progress() * bar_length)
-        result += f"[" + "#" * bar_used + "-" * (bar_length - bar_used) + "]\n"
+        result += progress_bar(self.get_progress()) + "\n"
         return result
\ No newline at end of file
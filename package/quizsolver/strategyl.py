@@ -8,8 +8,9 @@ if TYPE_CHECKING:
     from .quizsolver import QuizSolver
 
 class StrategyL(Strategy):
-    def __init__(self, *, quizsolver: 'QuizSolver', name: str = "L"):
-        super().__init__(quizsolver=quizsolver, name=name)
+    def __init__(self, *, quizsolver: 'QuizSolver', name: str = "L",
+                 random_generator: random.Random | None = None):
+        super().__init__(quizsolver=quizsolver, name=name, random_generator=random_generator)
         # How many times was this strategy used to close questions
         self.loose_strike_count = 0
         # How many questions were solved by this strategy
@@ -22,13 +23,29 @@ class StrategyL(Strategy):
         """
         Initialize the strategy before starting the quiz solving process.
         """
-        # Initialize data for each answer
-        for answer in question.answers:
-            answer.data[self.name] = {"most_probable": False}
-        random_index = random.randint(0, len(question.answers) - 1)
-        question.answers[random_index].data[self.name]["most_probable"] = True
-        # Store most probable answer in question data
-        question.data[self.name] = {"most_probable_answer": question.answers[random_index]}
+        # Select a random most probable answer
+        self._most_probable_answer[question.index] = self._pick_initial_answer(question).index
+
+    def checkpoint_state(self) -> dict:
+        """
+        Get the state of the strategy for a checkpoint.
+        """
+        state = super().checkpoint_state()
+        state.update({
+            "loose_strike_count": self.loose_strike_count,
+            "questions_solved": self.questions_solved,
+            "answers_closed": self.answers_closed
+        })
+        return state
+
+    def restore_checkpoint_state(self, state: dict, *, questions: list['Question']):
+        """
+        Restore a state returned by checkpoint_state.
+        """
+        super().restore_checkpoint_state(state, questions=questions)
+        self.loose_strike_count = state["loose_strike_count"]
+        self.questions_solved = state["questions_solved"]
+        self.answers_closed = state["answers_closed"]
 
     def give_answer(self, *, question: 'Question') -> dict:
         """
@@ -51,13 +68,15 @@ class StrategyL(Strategy):
         # if score is zero, increment loose strike count
         self.loose_strike_count += 1
         # If the score is zero, mark the most probable answers as incorrect
-        for question in self._quizsolver._latest_quiz:
+        quizsolver = self._quizsolver
+        strategy_in_use = quizsolver._strategy_in_use
+        for question in quizsolver._latest_quiz:
             # if question is already solved then continue
             if question.is_solved:
                 continue
             # Mark the most probable answer as incorrect
-            most_probable_answer: Answer = question.data[self._quizsolver._strategy_in_use.name]["most_probable_answer"]
-            most_probable_answer.is_correct = False
+            most_probable_answer: Answer = strategy_in_use.get_most_probable_answer(question)
+            quizsolver.set_answer_correctness(answer=most_probable_answer, is_correct=False)
             self.answers_closed += 1
             # get list of undecided answers
             undecided_answers = []
@@ -72,8 +91,8 @@ class StrategyL(Strategy):
             # If only one undecided answer remains, mark it as correct
             # and mark question as solved
             if len(undecided_answers) == 1:
-                undecided_answers[0].is_correct = True
-                question.is_solved = True
+                quizsolver.set_answer_correctness(answer=undecided_answers[0], is_correct=True)
+                quizsolver.mark_question_solved(question=question)
                 self.questions_solved += 1
                 self.answers_closed += 1
                 continue
@@ -8,8 +8,9 @@ if TYPE_CHECKING:
     from .quizsolver import QuizSolver
 
 class StrategyW(Strategy):
-    def __init__(self, *, quizsolver: 'QuizSolver', name: str = "W"):
-        super().__init__(quizsolver=quizsolver, name=name)
+    def __init__(self, *, quizsolver: 'QuizSolver', name: str = "W",
+                 random_generator: random.Random | None = None):
+        super().__init__(quizsolver=quizsolver, name=name, random_generator=random_generator)
         # How many times was this strategy used to close questions
         self.win_strike_count = 0
         # How many questions were solved by this strategy
@@ -21,13 +22,29 @@ class StrategyW(Strategy):
         """
         Initialize the strategy before starting the quiz solving process.
         """
-        # Initialize data for each answer
-        for answer in question.answers:
-            answer.data[self.name] = {"most_probable": False}
-        random_index = random.randint(0, len(question.answers) - 1)
-        question.answers[random_index].data[self.name]["most_probable"] = True
-        # Store most probable answer in question data
-        question.data[self.name] = {"most_probable_answer": question.answers[random_index]}
+        # Select a random most probable answer
+        self._most_probable_answer[question.index] = self._pick_initial_answer(question).index
+
+    def checkpoint_state(self) -> dict:
+        """
+        Get the state of the strategy for a checkpoint.
+        """
+        state = super().checkpoint_state()
+        state.update({
+            "win_strike_count": self.win_strike_count,
+            "questions_solved": self.questions_solved,
+            "answers_closed": self.answers_closed
+        })
+        return state
+
+    def restore_checkpoint_state(self, state: dict, *, questions: list['Question']):
+        """
+        Restore a state returned by checkpoint_state.
+        """
+        super().restore_checkpoint_state(state, questions=questions)
+        self.win_strike_count = state["win_strike_count"]
+        self.questions_solved = state["questions_solved"]
+        self.answers_closed = state["answers_closed"]
 
     def give_answer(self, *, question: 'Question') -> dict:
         """
@@ -50,21 +67,23 @@ class StrategyW(Strategy):
         # if score is perfect, increment win strike count
         self.win_strike_count += 1
         # If the score is perfect, mark the most probable answers as correct
-        for question in self._quizsolver._latest_quiz:
+        quizsolver = self._quizsolver
+        strategy_in_use = quizsolver._strategy_in_use
+        for question in quizsolver._latest_quiz:
             # If question is already solved then continue
             if question.is_solved:
                 continue
             # Mark the question as solved
-            question.is_solved = True
+            quizsolver.mark_question_solved(question=question)
             self.questions_solved += 1
             # Mark the most probable answer as correct
             for answer in question.answers:
-                answer.is_correct = False
+                quizsolver.set_answer_correctness(answer=answer, is_correct=False)
                 self.answers_closed += 1
-            most_probable_answer: Answer = question.data[self._quizsolver._strategy_in_use.name]["most_probable_answer"]
-            most_probable_answer.is_correct = True
+            most_probable_answer: Answer = strategy_in_use.get_most_probable_answer(question)
+            quizsolver.set_answer_correctness(answer=most_probable_answer, is_correct=True)
             # Mark the question of this strategy as solved
-            question.data[self.name]["most_probable_answer"] = most_probable_answer
+            self._most_probable_answer[question.index] = most_probable_answer.index
     
     def plot(self):
         """
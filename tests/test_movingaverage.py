@@ -0,0 +1,140 @@
+import random
+import pytest
+from package.quizsolver.movingaverage import MovingAverage
+
+INITIAL_VALUE = 0.25
+
+
+def create_moving_average(window_sizes: list[int], **options) -> MovingAverage:
+    """
+    Create a moving average whose ring retains the largest window of the schedule,
+    so every window can be compared with the values added to a reference list.
+    """
+    moving_average = MovingAverage(initial_value=INITIAL_VALUE, window_size=max(window_sizes), **options)
+    moving_average.set_window_size(window_sizes[0])
+    return moving_average
+
+
+def window_sizes_schedule(window_sizes: list[int], values_count: int):
+    """Yield the value index and the window size to set before adding the value, None to keep it."""
+    step = values_count // len(window_sizes)
+    for i in range(values_count):
+        yield i, window_sizes[i // step] if i % step == 0 and i // step < len(window_sizes) else None
+
+
+def sorted_median(values: list[float]) -> float:
+    """Median of values by sorting them."""
+    sorted_values = sorted(values)
+    mid = len(sorted_values) // 2
+    if len(sorted_values) % 2 == 0:
+        return (sorted_values[mid - 1] + sorted_values[mid]) / 2.0
+    return sorted_values[mid]
+
+
+@pytest.mark.parametrize("window_sizes", [
+    [7, 3, 100, 8, 1000, 1, 2, 50, 2],
+    [2, 7, 2, 1, 2],
+    [2, 1, 2, 1],
+])
+def test_median_matches_sorted_window(window_sizes):
+    generator = random.Random(0)
+    moving_average = create_moving_average(window_sizes)
+    # The window starts filled with the initial value
+    values = [INITIAL_VALUE] * max(window_sizes)
+    for i, window_size in window_sizes_schedule(window_sizes, 4000):
+        if window_size is not None:
+            moving_average.set_window_size(window_size)
+        # Rounded values produce ties
+        value = round(generator.uniform(0, 1), 2)
+        values.append(value)
+        moving_average.add_value(value)
+        assert moving_average.median == sorted_median(values[-moving_average.window_size:]), \
+            f"after {i + 1} values"
+
+
+@pytest.mark.parametrize("window_sizes", [[64, 7, 20, 3, 33, 1, 50], [2, 1, 2]])
+def test_simple_and_weighted_modes_match_window(window_sizes):
+    generator = random.Random(1)
+    simple = create_moving_average(window_sizes)
+    weighted = create_moving_average(window_sizes, mode="weighted")
+    values = [INITIAL_VALUE] * max(window_sizes)
+    weights = [1.0] * max(window_sizes)
+    for i, window_size in window_sizes_schedule(window_sizes, 5000):
+        if window_size is not None:
+            simple.set_window_size(window_size)
+            weighted.set_window_size(window_size)
+        value = generator.uniform(0, 1)
+        value_weight = generator.choice([0.0, 1.0, generator.uniform(0, 100)])
+        values.append(value)
+        weights.append(value_weight)
+        simple.add_value(value, value_weight)
+        weighted.add_value(value, value_weight)
+        window_values = values[-weighted.window_size:]
+        window_weights = weights[-weighted.window_size:]
+        # Weights are ignored by the simple mode
+        assert simple.moving_average == pytest.approx(sum(window_values) / len(window_values), abs=1e-9), \
+            f"after {i + 1} values"
+        weight_total = sum(window_weights)
+        reference = sum(v * w for v, w in zip(window_values, window_weights)) / weight_total \
+            if weight_total > 0 else 0.0
+        assert weighted.moving_average == pytest.approx(reference, abs=1e-9), f"after {i + 1} values"
+
+
+@pytest.mark.parametrize("alpha", [None, 0.1, 1.0])
+def test_exponential_mode_matches_reference(alpha):
+    window_sizes = [64, 7, 20, 3, 33, 1, 50]
+    generator = random.Random(2)
+    exponential = create_moving_average(window_sizes, mode="exponential", alpha=alpha)
+    # Reference: exponentially weighted sums of all values and their weights
+    exponential_sum, exponential_weight = INITIAL_VALUE, 1.0
+    for i, window_size in window_sizes_schedule(window_sizes, 5000):
+        if window_size is not None:
+            exponential.set_window_size(window_size)
+        value = generator.uniform(0, 1)
+        value_weight = generator.choice([0.0, 1.0, generator.uniform(0, 100)])
+        exponential.add_value(value, value_weight)
+        # Without an alpha, the smoothing factor follows the window size
+        value_alpha = alpha if alpha is not None else 2.0 / (exponential.window_size + 1)
+        exponential_sum = (1 - value_alpha) * exponential_sum + value_alpha * value_weight * value
+        exponential_weight = (1 - value_alpha) * exponential_weight + value_alpha * value_weight
+        reference = exponential_sum / exponential_weight if exponential_weight > 0 else 0.0
+        assert exponential.moving_average == pytest.approx(reference, abs=1e-9), f"after {i + 1} values"
+
+
+def test_zero_weights():
+    weighted = MovingAverage(initial_value=INITIAL_VALUE, window_size=4, mode="weighted")
+    exponential = MovingAverage(initial_value=INITIAL_VALUE, window_size=4, mode="exponential", alpha=1.0)
+    for moving_average in (weighted, exponential):
+        for value in (0.9, 0.1, 0.5, 0.7):
+            moving_average.add_value(value, 0.0)
+        # A window (or history) of zero weights has no average
+        assert moving_average.moving_average == 0.0
+        moving_average.add_value(0.6, 2.0)
+        assert moving_average.moving_average == pytest.approx(0.6)
+
+
+def test_set_window_size_keeps_added_values():
+    moving_average = MovingAverage(initial_value=0.0, window_size=2)
+    for value in range(1, 7):
+        moving_average.add_value(float(value))
+    # The ring retained the older values, growing the window includes them
+    moving_average.set_window_size(5)
+    assert moving_average.window_values() == [2.0, 3.0, 4.0, 5.0, 6.0]
+    assert moving_average.moving_average == pytest.approx(4.0)
+    assert moving_average.median == 4.0
+    moving_average.set_window_size(2)
+    assert moving_average.window_values() == [5.0, 6.0]
+    assert moving_average.moving_average == pytest.approx(5.5)
+    assert moving_average.median == 5.5
+
+
+@pytest.mark.parametrize("options", [
+    {"mode": "median"},
+    {"alpha": 0.0},
+    {"alpha": 1.5},
+    {"history_policy": "keep"},
+    {"window_size": 20, "max_window_size": 10},
+])
+def test_invalid_options(options):
+    with pytest.raises(ValueError):
+        MovingAverage(**options)